@@ -0,0 +1,97 @@
+"""Esquema inicial (equivalente ao antigo create_all)
+
+Bancos criados pelo create_all de versões anteriores já têm parte destas
+tabelas; só as que faltam são criadas, então `alembic upgrade head`
+funciona tanto num banco novo quanto num existente.
+
+Revision ID: 0001_baseline
+Revises:
+Create Date: 2026-10-18
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0001_baseline"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _create_table(existing: set, name: str, *columns, indexes=()):
+    if name in existing:
+        return
+    op.create_table(name, *columns)
+    for index_name, index_columns, unique in indexes:
+        op.create_index(index_name, name, index_columns, unique=unique)
+
+
+def upgrade():
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    _create_table(
+        existing, "users",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("email", sa.String()),
+        sa.Column("password", sa.String()),
+        indexes=[("ix_users_id", ["id"], False), ("ix_users_email", ["email"], True)],
+    )
+    _create_table(
+        existing, "resumes",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id")),
+        sa.Column("data", sa.JSON(), nullable=False),
+        indexes=[("ix_resumes_id", ["id"], False)],
+    )
+    _create_table(
+        existing, "templates",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id")),
+        sa.Column("html_content", sa.Text()),
+        indexes=[("ix_templates_id", ["id"], False)],
+    )
+    _create_table(
+        existing, "generated_resumes",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("resume_id", sa.Integer(), sa.ForeignKey("resumes.id")),
+        sa.Column("generated_data", sa.JSON()),
+        indexes=[("ix_generated_resumes_id", ["id"], False)],
+    )
+    _create_table(
+        existing, "export_jobs",
+        sa.Column("id", sa.String(32), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id")),
+        sa.Column("resume_id", sa.Integer(), sa.ForeignKey("resumes.id")),
+        sa.Column("template_name", sa.String(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("error", sa.Text()),
+        sa.Column("result_path", sa.String()),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Column("started_at", sa.DateTime()),
+        sa.Column("finished_at", sa.DateTime()),
+        sa.Column("render_ms", sa.Integer()),
+        indexes=[
+            ("ix_export_jobs_user_id", ["user_id"], False),
+            ("ix_export_jobs_status", ["status"], False),
+        ],
+    )
+    _create_table(
+        existing, "llm_cache",
+        sa.Column("key", sa.String(64), primary_key=True),
+        sa.Column("model", sa.String(), nullable=False),
+        sa.Column("prompt_version", sa.String(), nullable=False),
+        sa.Column("response", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Column("last_used_at", sa.DateTime()),
+        sa.Column("hits", sa.Integer(), nullable=False),
+        indexes=[
+            ("ix_llm_cache_created_at", ["created_at"], False),
+            ("ix_llm_cache_last_used_at", ["last_used_at"], False),
+        ],
+    )
+
+
+def downgrade():
+    for name in ("llm_cache", "export_jobs", "generated_resumes", "templates", "resumes", "users"):
+        op.drop_table(name)
@@ -0,0 +1,47 @@
+"""Índices nas chaves estrangeiras e timestamps de currículos
+
+Revision ID: 0002_indexes_timestamps
+Revises: 0001_baseline
+Create Date: 2026-10-18
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0002_indexes_timestamps"
+down_revision = "0001_baseline"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # SQLite não aceita ADD COLUMN com default não constante: as colunas entram
+    # anuláveis e as linhas existentes recebem o horário da migração.
+    with op.batch_alter_table("resumes") as batch:
+        batch.add_column(sa.Column("created_at", sa.DateTime()))
+        batch.add_column(sa.Column("updated_at", sa.DateTime()))
+        batch.create_index("ix_resumes_user_id_id", ["user_id", "id"])
+
+    with op.batch_alter_table("generated_resumes") as batch:
+        batch.add_column(sa.Column("created_at", sa.DateTime()))
+        batch.create_index("ix_generated_resumes_resume_id_id", ["resume_id", "id"])
+
+    op.create_index("ix_templates_user_id", "templates", ["user_id"])
+    op.create_index("ix_export_jobs_resume_id", "export_jobs", ["resume_id"])
+
+    op.execute("UPDATE resumes SET created_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP")
+    op.execute("UPDATE generated_resumes SET created_at = CURRENT_TIMESTAMP")
+
+
+def downgrade():
+    op.drop_index("ix_export_jobs_resume_id", table_name="export_jobs")
+    op.drop_index("ix_templates_user_id", table_name="templates")
+
+    with op.batch_alter_table("generated_resumes") as batch:
+        batch.drop_index("ix_generated_resumes_resume_id_id")
+        batch.drop_column("created_at")
+
+    with op.batch_alter_table("resumes") as batch:
+        batch.drop_index("ix_resumes_user_id_id")
+        batch.drop_column("updated_at")
+        batch.drop_column("created_at")
@@ -0,0 +1,31 @@
+"""Histórico de revisões dos currículos (deltas + snapshots)
+
+Revision ID: 0003_resume_revisions
+Revises: 0002_indexes_timestamps
+Create Date: 2026-10-18
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0003_resume_revisions"
+down_revision = "0002_indexes_timestamps"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "resume_revisions",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("resume_id", sa.Integer(), sa.ForeignKey("resumes.id"), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("kind", sa.String(8), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime()),
+        sa.UniqueConstraint("resume_id", "version", name="uq_resume_revisions_resume_id_version"),
+    )
+
+
+def downgrade():
+    op.drop_table("resume_revisions")
@@ -0,0 +1,28 @@
+"""Índice de cobertura para o histórico de gerações
+
+Revision ID: 0004_generations_index
+Revises: 0003_resume_revisions
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+
+revision = "0004_generations_index"
+down_revision = "0003_resume_revisions"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # created_at entra no índice: listagem e validação (ETag) não leem a tabela
+    with op.batch_alter_table("generated_resumes") as batch:
+        batch.drop_index("ix_generated_resumes_resume_id_id")
+        batch.create_index(
+            "ix_generated_resumes_resume_id_id_created_at", ["resume_id", "id", "created_at"]
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("generated_resumes") as batch:
+        batch.drop_index("ix_generated_resumes_resume_id_id_created_at")
+        batch.create_index("ix_generated_resumes_resume_id_id", ["resume_id", "id"])
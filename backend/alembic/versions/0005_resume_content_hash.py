@@ -0,0 +1,48 @@
+"""Hash do conteúdo dos currículos (ETags de preview e exportação)
+
+Revision ID: 0005_resume_content_hash
+Revises: 0004_generations_index
+Create Date: 2026-10-18
+"""
+import hashlib
+import json
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0005_resume_content_hash"
+down_revision = "0004_generations_index"
+branch_labels = None
+depends_on = None
+
+
+def _content_hash(data) -> str:
+    # Mesmo cálculo de app.services.resume_service.content_hash
+    payload = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def upgrade():
+    with op.batch_alter_table("resumes") as batch:
+        batch.add_column(sa.Column("content_hash", sa.String(64)))
+
+    resumes = sa.table(
+        "resumes",
+        sa.column("id", sa.Integer()),
+        sa.column("data", sa.JSON()),
+        sa.column("content_hash", sa.String(64)),
+    )
+    bind = op.get_bind()
+    rows = bind.execute(sa.select(resumes.c.id, resumes.c.data)).all()
+    for resume_id, data in rows:
+        bind.execute(
+            resumes.update()
+            .where(resumes.c.id == resume_id)
+            .values(content_hash=_content_hash(data))
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("resumes") as batch:
+        batch.drop_column("content_hash")
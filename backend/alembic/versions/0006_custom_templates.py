@@ -0,0 +1,57 @@
+"""Templates personalizados: nome, revisão, hash e timestamps
+
+Revision ID: 0006_custom_templates
+Revises: 0005_resume_content_hash
+Create Date: 2026-10-18
+"""
+import hashlib
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0006_custom_templates"
+down_revision = "0005_resume_content_hash"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("templates") as batch:
+        batch.add_column(sa.Column("name", sa.String(100)))
+        batch.add_column(sa.Column("revision", sa.Integer(), nullable=False, server_default="1"))
+        batch.add_column(sa.Column("content_hash", sa.String(64)))
+        batch.add_column(sa.Column("created_at", sa.DateTime()))
+        batch.add_column(sa.Column("updated_at", sa.DateTime()))
+
+    templates = sa.table(
+        "templates",
+        sa.column("id", sa.Integer()),
+        sa.column("name", sa.String(100)),
+        sa.column("html_content", sa.Text()),
+        sa.column("content_hash", sa.String(64)),
+    )
+    bind = op.get_bind()
+    for template_id, html_content in bind.execute(sa.select(templates.c.id, templates.c.html_content)).all():
+        bind.execute(
+            templates.update()
+            .where(templates.c.id == template_id)
+            .values(
+                name=f"Template {template_id}",
+                content_hash=hashlib.sha256((html_content or "").encode("utf-8")).hexdigest(),
+            )
+        )
+    op.execute("UPDATE templates SET created_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP")
+
+    # O default do servidor só serviu para preencher as linhas existentes
+    with op.batch_alter_table("templates") as batch:
+        batch.alter_column("revision", server_default=None)
+
+
+def downgrade():
+    with op.batch_alter_table("templates") as batch:
+        batch.drop_column("updated_at")
+        batch.drop_column("created_at")
+        batch.drop_column("content_hash")
+        batch.drop_column("revision")
+        batch.drop_column("name")
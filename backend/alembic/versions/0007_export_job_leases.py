@@ -0,0 +1,29 @@
+"""Dono e concessão dos jobs de exportação
+
+Revision ID: 0007_export_job_leases
+Revises: 0006_custom_templates
+Create Date: 2026-10-18
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0007_export_job_leases"
+down_revision = "0006_custom_templates"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Jobs existentes ficam sem dono: a primeira instância que subir os recupera
+    with op.batch_alter_table("export_jobs") as batch:
+        batch.add_column(sa.Column("owner", sa.String(32)))
+        batch.add_column(sa.Column("lease_expires_at", sa.DateTime()))
+        batch.create_index("ix_export_jobs_lease_expires_at", ["lease_expires_at"])
+
+
+def downgrade():
+    with op.batch_alter_table("export_jobs") as batch:
+        batch.drop_index("ix_export_jobs_lease_expires_at")
+        batch.drop_column("lease_expires_at")
+        batch.drop_column("owner")
@@ -1,67 +1,104 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.core.security import verify_password, get_password_hash, create_access_token
+from app.core.database import get_async_db
+from app.core.deps import invalidate_user
+from app.core.security import create_access_token
 from app.models.user import User
 from app.schemas.auth import UserRegister, UserLogin, Token
+from app.services.password_hasher import password_hasher, HasherBusyError
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
+def _busy_exception(error: HasherBusyError) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(error),
+        headers={"Retry-After": "1"},
+    )
+
+
+async def _authenticate(db: AsyncSession, email: str, password: str):
+    user = await db.scalar(select(User).where(User.email == email))
+    if not user:
+        return None
+
+    try:
+        valid, new_hash = await password_hasher.verify(password, user.password)
+    except HasherBusyError as e:
+        raise _busy_exception(e)
+
+    if not valid:
+        return None
+
+    # Custo do bcrypt mudou desde o cadastro: regrava o hash com os parâmetros atuais
+    if new_hash:
+        user.password = new_hash
+        await db.commit()
+        invalidate_user(user.id)
+
+    return user
+
+
 @router.post("/register", response_model=Token)
-def register(user_data: UserRegister, db: Session = Depends(get_db)):
+async def register(user_data: UserRegister, db: AsyncSession = Depends(get_async_db)):
     # Verifica se usuário já existe
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
+    existing_user = await db.scalar(select(User).where(User.email == user_data.email))
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email já cadastrado"
         )
-    
+
     # Cria novo usuário
-    hashed_password = get_password_hash(user_data.password)
+    try:
+        hashed_password = await password_hasher.hash(user_data.password)
+    except HasherBusyError as e:
+        raise _busy_exception(e)
+
     new_user = User(email=user_data.email, password=hashed_password)
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
-    
+    await db.commit()
+    await db.refresh(new_user)
+
     # Gera token
-    access_token = create_access_token(data={"sub": str(new_user.id)})
+    access_token = create_access_token(data={"sub": str(new_user.id), "email": new_user.email})
     return {"access_token": access_token, "token_type": "bearer"}
 
 
 @router.post("/login", response_model=Token)
-def login(
+async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),  # ← MUDANÇA AQUI
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     # Busca usuário (OAuth2 usa 'username' mas vamos usar como email)
-    user = db.query(User).filter(User.email == form_data.username).first()
-    
-    if not user or not verify_password(form_data.password, user.password):
+    user = await _authenticate(db, form_data.username, form_data.password)
+
+    if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Email ou senha incorretos",
             headers={"WWW-Authenticate": "Bearer"},  # ← IMPORTANTE
         )
-    
+
     # Gera token
-    access_token = create_access_token(data={"sub": str(user.id)})
+    access_token = create_access_token(data={"sub": str(user.id), "email": user.email})
     return {"access_token": access_token, "token_type": "bearer"}
 
 
 # Rota alternativa para login com JSON (para o frontend)
 @router.post("/login-json", response_model=Token)
-def login_json(user_data: UserLogin, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.email == user_data.email).first()
-    
-    if not user or not verify_password(user_data.password, user.password):
+async def login_json(user_data: UserLogin, db: AsyncSession = Depends(get_async_db)):
+    user = await _authenticate(db, user_data.email, user_data.password)
+
+    if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Email ou senha incorretos"
         )
-    
-    access_token = create_access_token(data={"sub": str(user.id)})
-    return {"access_token": access_token, "token_type": "bearer"}
\ No newline at end of file
+
+    access_token = create_access_token(data={"sub": str(user.id), "email": user.email})
+    return {"access_token": access_token, "token_type": "bearer"}
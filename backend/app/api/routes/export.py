@@ -1,72 +1,93 @@
-from fastapi import APIRouter, Depends, HTTPException, Response, Query
-from sqlalchemy.orm import Session
-from playwright.sync_api import sync_playwright
+import json
 
-from app.core.database import get_db
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, Query, status
+from fastapi.responses import FileResponse, StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_async_db
 from app.core.deps import get_current_user
+from app.models.export_job import ExportJob
 from app.models.resume import Resume
-from app.services.template_service import (
-    render_template,
-    resume_model_to_template_data
-)
+from app.core.config import settings
+from app.schemas.bulk_export import BulkExportRequest
+from app.schemas.export_job import ExportJobCreate, ExportJobStatus
+from app.services.browser_pool import browser_pool, PoolTimeoutError, PoolClosedError
+from app.services.bulk_export import stream_bulk_zip
+from app.services.custom_template_service import get_custom_template, custom_template_renderer, TemplateLimitError
+from app.services.docx_service import stream_resume_docx, DOCX_MEDIA_TYPE
+from app.services.export_queue import export_queue, QueueFullError
+from app.services.native_pdf import native_pdf_renderer
+from app.services.pdf_service import render_resume_pdf, pdf_renderer_for, PDF_OPTIONS
+from app.services.resume_service import get_resume_content_hash
+from app.services.template_service import get_template_hash
+from app.utils.http_cache import make_etag, is_not_modified, cache_headers, not_modified
 
 router = APIRouter(prefix="/export", tags=["Export"])
 
+# Muda quando o gerador do documento Word muda (invalida os ETags já emitidos)
+WORD_FORMAT_VERSION = "docx-1"
+
 @router.get("/pdf/{resume_id}")
-def export_resume_pdf(
+async def export_resume_pdf(
     resume_id: int,
+    request: Request,
     template_name: str = Query("modern", description="Nome do template (modern, classic, creative)"),
-    db: Session = Depends(get_db),
+    template_id: int | None = Query(None, description="Id de um template personalizado (substitui template_name)"),
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(get_current_user)
 ):
     """
     Exporta o currículo para PDF usando o template HTML especificado.
     O PDF será gerado exatamente como aparece no preview.
+    Responde 304 (sem renderizar) se o ETag do cliente ainda vale.
     """
+    resume_hash = await get_resume_content_hash(db, resume_id, current_user.id)
+    if resume_hash is None:
+        raise HTTPException(status_code=404, detail="Currículo não encontrado")
+
+    custom_template = None
+    if template_id is not None:
+        custom_template = await get_custom_template(db, template_id, current_user.id)
+        if not custom_template:
+            raise HTTPException(status_code=404, detail="Template personalizado não encontrado")
+        template_key, template_hash = f"custom:{custom_template.id}", custom_template.content_hash
+    else:
+        try:
+            template_key, template_hash = template_name, get_template_hash(template_name)
+        except FileNotFoundError:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Template '{template_name}' não encontrado"
+            )
+
+    headers = cache_headers(make_etag(
+        "pdf", resume_hash, template_key, template_hash,
+        json.dumps(PDF_OPTIONS, sort_keys=True), pdf_renderer_for(template_name, custom_template)
+    ))
+    if is_not_modified(request, headers["ETag"]):
+        return not_modified(headers)
+
     # 1. Busca o currículo no banco
-    resume = db.query(Resume).filter(
+    resume = await db.scalar(select(Resume).where(
         Resume.id == resume_id,
         Resume.user_id == current_user.id
-    ).first()
+    ))
     
     if not resume:
         raise HTTPException(status_code=404, detail="Currículo não encontrado")
 
     try:
-        # 2. Converte dados do Resume para formato do template
-        template_data = resume_model_to_template_data(resume)
-        
-        # 3. Renderiza o template HTML (mesmo usado no preview)
-        html_content = render_template(template_name, template_data)
-        
-        # 4. Converte HTML para PDF usando Playwright
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            
-            # Define o conteúdo HTML
-            page.set_content(html_content, wait_until="networkidle")
-            
-            # Gera o PDF com configurações A4
-            pdf_bytes = page.pdf(
-                format="A4",
-                margin={
-                    "top": "1.5cm",
-                    "right": "1.5cm",
-                    "bottom": "1.5cm",
-                    "left": "1.5cm"
-                },
-                print_background=True
-            )
-            
-            browser.close()
+        # 2. Renderiza o template e converte para PDF (ou reaproveita do cache)
+        pdf_bytes = await render_resume_pdf(resume, template_name, custom_template)
         
-        # 5. Retorna o PDF para download
+        # 3. Retorna o PDF para download
         return Response(
             content=pdf_bytes,
             media_type="application/pdf",
             headers={
-                "Content-Disposition": f"attachment; filename=resume_{resume_id}_{template_name}.pdf"
+                **headers,
+                "Content-Disposition": f"attachment; filename=resume_{resume_id}_{template_key.replace(':', '_')}.pdf"
             }
         )
 
@@ -75,64 +96,165 @@ def export_resume_pdf(
             status_code=404,
             detail=f"Template '{template_name}' não encontrado"
         )
+    except TemplateLimitError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except (PoolTimeoutError, PoolClosedError) as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Erro ao gerar arquivo PDF: {str(e)}"
         )
 
-@router.get("/word/{resume_id}")
-def export_resume_rtf(
-    resume_id: int,
-    db: Session = Depends(get_db),
+
+@router.get("/pool/status")
+def pdf_pool_status():
+    """Ocupação e tempos de espera do pool de navegadores."""
+    return {
+        **browser_pool.stats(),
+        "native": native_pdf_renderer.stats(),
+        "custom_templates": custom_template_renderer.stats(),
+    }
+
+
+@router.post("/jobs", response_model=ExportJobStatus, status_code=status.HTTP_202_ACCEPTED)
+async def create_export_job(
+    job_data: ExportJobCreate,
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(get_current_user)
 ):
-    # 1. Busca o currículo no banco
-    resume = db.query(Resume).filter(
-        Resume.id == resume_id, 
+    """
+    Enfileira a exportação PDF de um currículo e retorna o job imediatamente.
+    Consulte o status em /export/jobs/{job_id} e baixe o resultado quando concluído.
+    """
+    resume = await db.scalar(select(Resume).where(
+        Resume.id == job_data.resume_id,
         Resume.user_id == current_user.id
-    ).first()
-    
+    ))
+
     if not resume:
         raise HTTPException(status_code=404, detail="Currículo não encontrado")
 
-    data = resume.data #
-    
     try:
-        # 2. Construção manual do corpo do documento RTF
-        # RTF utiliza uma sintaxe de controle por contra-barras
-        name = data.get("fullName", "Sem Nome")
-        summary = data.get("summary", "")
-        
-        # Início do documento RTF (Configuração de fontes e cores)
-        rtf_content = r"{\rtf1\ansi\deff0 {\fonttbl {\f0 Arial;}}"
-        rtf_content += r"\viewkind4\uc1 \pard\qc\f0\fs44\b " + name + r"\b0\fs20\par"
-        rtf_content += r"\pard\qc " + f"{data.get('email')} | {data.get('phone')}" + r"\par\sb120\par"
-        
-        # Seção Resumo
-        rtf_content += r"\pard\b\fs28 RESUMO PROFISSIONAL\b0\fs20\par"
-        rtf_content += r"\pard\fs22 " + summary + r"\par\sb120\par"
-        
-        # Seção Experiência
-        if data.get("experience"):
-            rtf_content += r"\pard\b\fs28 EXPERIÊNCIA PROFISSIONAL\b0\fs20\par"
-            for exp in data.get("experience"):
-                rtf_content += r"\pard\b\fs24 " + exp.get("role") + " @ " + exp.get("company") + r"\b0\par"
-                rtf_content += r"\pard\i " + exp.get("period", "") + r"\i0\par"
-                rtf_content += r"\pard " + exp.get("description", "") + r"\par\sb60\par"
-        
-        rtf_content += r"}"
+        return await export_queue.submit(db, current_user.id, resume.id, job_data.template_name)
+    except QueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
 
-        # 3. Retorno do arquivo
-        headers = {
-            'Content-Disposition': f'attachment; filename="resume_{resume_id}.doc"'
-        }
-        
-        return Response(
-            content=rtf_content.encode('latin-1', 'replace'),
-            media_type="application/msword",
-            headers=headers
+
+@router.post("/bulk")
+async def export_bulk_zip(
+    bulk_data: BulkExportRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user = Depends(get_current_user)
+):
+    """
+    Exporta vários currículos em vários templates num único ZIP.
+    Os PDFs são renderizados em paralelo e enviados conforme ficam prontos.
+    """
+    query = select(Resume.id).where(Resume.user_id == current_user.id)
+    if bulk_data.resume_ids is not None:
+        query = query.where(Resume.id.in_(bulk_data.resume_ids))
+    resume_ids = list(await db.scalars(query.order_by(Resume.id)))
+
+    if not resume_ids:
+        raise HTTPException(status_code=404, detail="Nenhum currículo encontrado")
+
+    templates = list(dict.fromkeys(bulk_data.templates))
+    for template_name in templates:
+        try:
+            get_template_hash(template_name)
+        except FileNotFoundError:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Template '{template_name}' não encontrado"
+            )
+
+    items = [(resume_id, template_name) for resume_id in resume_ids for template_name in templates]
+    if len(items) > settings.EXPORT_BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Lote excede o limite de {settings.EXPORT_BULK_MAX_ITEMS} arquivos"
         )
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erro ao gerar documento: {str(e)}")
\ No newline at end of file
+    return StreamingResponse(
+        stream_bulk_zip(items),
+        media_type="application/zip",
+        headers={"Content-Disposition": "attachment; filename=resumes.zip"}
+    )
+
+
+async def _get_user_job(db: AsyncSession, job_id: str, user_id: int) -> ExportJob:
+    job = await db.scalar(select(ExportJob).where(
+        ExportJob.id == job_id,
+        ExportJob.user_id == user_id
+    ))
+
+    if not job:
+        raise HTTPException(status_code=404, detail="Job de exportação não encontrado")
+
+    return job
+
+
+@router.get("/jobs/{job_id}", response_model=ExportJobStatus)
+async def get_export_job(
+    job_id: str,
+    db: AsyncSession = Depends(get_async_db),
+    current_user = Depends(get_current_user)
+):
+    """Status, tentativas e tempos de um job de exportação."""
+    return await _get_user_job(db, job_id, current_user.id)
+
+
+@router.get("/jobs/{job_id}/download")
+async def download_export_job(
+    job_id: str,
+    db: AsyncSession = Depends(get_async_db),
+    current_user = Depends(get_current_user)
+):
+    """Baixa o PDF gerado por um job concluído."""
+    job = await _get_user_job(db, job_id, current_user.id)
+
+    if job.status != "done" or not job.result_path:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Job ainda não concluído (status: {job.status})"
+        )
+
+    return FileResponse(
+        job.result_path,
+        media_type="application/pdf",
+        filename=f"resume_{job.resume_id}_{job.template_name}.pdf"
+    )
+
+@router.get("/word/{resume_id}")
+async def export_resume_docx(
+    resume_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    current_user = Depends(get_current_user)
+):
+    """Exporta o currículo para Word (.docx), enviado em stream conforme é gerado."""
+    resume_hash = await get_resume_content_hash(db, resume_id, current_user.id)
+    if resume_hash is None:
+        raise HTTPException(status_code=404, detail="Currículo não encontrado")
+
+    etag_headers = cache_headers(make_etag("word", resume_hash, WORD_FORMAT_VERSION))
+    if is_not_modified(request, etag_headers["ETag"]):
+        return not_modified(etag_headers)
+
+    resume = await db.scalar(select(Resume).where(
+        Resume.id == resume_id,
+        Resume.user_id == current_user.id
+    ))
+
+    if not resume:
+        raise HTTPException(status_code=404, detail="Currículo não encontrado")
+
+    return StreamingResponse(
+        stream_resume_docx(resume.data),
+        media_type=DOCX_MEDIA_TYPE,
+        headers={
+            **etag_headers,
+            "Content-Disposition": f'attachment; filename="resume_{resume_id}.docx"'
+        }
+    )
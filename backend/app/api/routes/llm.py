@@ -1,31 +1,109 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+import asyncio
+import json
+from typing import List
 
-from app.core.database import get_db
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.db.session import AsyncSessionLocal
 from app.models.resume import Resume
 from app.models.generated_resume import GeneratedResume
-from app.services.llm_service import generate_resume_with_ai
+from app.schemas.job import JobContext
+from app.services.llm_cache import make_llm_cache_key, get_cached_result, store_cached_result
+from app.services.json_stream import ResumeStreamParser
+from app.services.llm_providers import RateLimitError
+from app.services.llm_resilience import CircuitOpenError
+from app.services.prompt_builder import build_resume_prompt, serialize_candidate
+from app.services.llm_service import (
+    generate_resume_with_ai_async,
+    stream_resume_with_ai,
+    finalize_streamed_response,
+    LLMTimeoutError,
+    MODEL_NAME,
+    PROMPT_VERSION,
+)
 from app.core.deps import get_current_user
 
 router = APIRouter(prefix="/ai", tags=["AI"])
 
+# Intervalo entre verificações de desconexão do cliente
+DISCONNECT_POLL_INTERVAL = 0.5
+
+# Nome do evento SSE emitido quando cada seção do JSON da IA termina
+SECTION_EVENTS = {
+    "summary": "summary",
+    "highlightedSkills": "skills",
+    "suggestedAdditions": "suggestions",
+}
+
+
+async def _cancel_on_disconnect(request: Request, coro):
+    """Executa `coro` e cancela a task se o cliente fechar a conexão."""
+    task = asyncio.create_task(coro)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=DISCONNECT_POLL_INTERVAL)
+            if done:
+                return task.result()
+            if await request.is_disconnected():
+                task.cancel()
+                raise HTTPException(status_code=499, detail="Cliente desconectado")
+    finally:
+        if not task.done():
+            task.cancel()
+
 
 @router.post("/generate/{resume_id}")
-def generate_ai_resume(
+async def generate_ai_resume(
     resume_id: int,
     job_context: dict,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    bypass_cache: bool = Query(False, description="Ignora o cache e força nova geração"),
+    db: AsyncSession = Depends(get_async_db),
     user=Depends(get_current_user),
 ):
-    resume = db.query(Resume).filter(
+    resume = await db.scalar(select(Resume).where(
         Resume.id == resume_id,
         Resume.user_id == user.id
-    ).first()
+    ))
 
     if not resume:
         return {"error": "Resume not found"}
 
-    result = generate_resume_with_ai(resume.data, job_context)
+    cache_key = make_llm_cache_key(resume.data, job_context, MODEL_NAME, PROMPT_VERSION)
+    result = None
+    if settings.LLM_CACHE_ENABLED and not bypass_cache:
+        result = await get_cached_result(db, cache_key)
+
+    response.headers["X-Cache"] = "HIT" if result is not None else "MISS"
+
+    if result is None:
+        prompt = build_resume_prompt(resume.data, job_context)
+        response.headers["X-Prompt-Tokens"] = str(prompt.estimated_tokens)
+        try:
+            result = await _cancel_on_disconnect(
+                request,
+                generate_resume_with_ai_async(resume.data, job_context, prompt=prompt)
+            )
+        except LLMTimeoutError as e:
+            raise HTTPException(status_code=504, detail=str(e))
+        except (RateLimitError, CircuitOpenError) as e:
+            retry_after = getattr(e, "retry_after", settings.LLM_RETRY_MAX_DELAY)
+            raise HTTPException(
+                status_code=503,
+                detail=str(e),
+                headers={"Retry-After": str(max(1, int(retry_after)))}
+            )
+
+        if settings.LLM_CACHE_ENABLED:
+            await store_cached_result(db, cache_key, result, MODEL_NAME, PROMPT_VERSION)
+
+    # O histórico é registrado mesmo quando a resposta vem do cache
 
     generated = GeneratedResume(
         resume_id=resume.id,
@@ -33,7 +111,214 @@ def generate_ai_resume(
     )
 
     db.add(generated)
-    db.commit()
-    db.refresh(generated)
+    await db.commit()
+    await db.refresh(generated)
 
     return generated
+
+
+def _sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+def _section_events(result: dict):
+    """Eventos SSE de um resultado já completo (ex.: vindo do cache)."""
+    if "summary" in result:
+        yield _sse("summary", result["summary"])
+    for index, experience in enumerate(result.get("tailoredExperiences") or []):
+        yield _sse("experience", {"index": index, "experience": experience})
+    for key, event in SECTION_EVENTS.items():
+        if key != "summary" and key in result:
+            yield _sse(event, result[key])
+
+
+@router.post("/generate/{resume_id}/stream")
+async def stream_ai_resume(
+    resume_id: int,
+    job_context: dict,
+    bypass_cache: bool = Query(False, description="Ignora o cache e força nova geração"),
+    db: AsyncSession = Depends(get_async_db),
+    user=Depends(get_current_user),
+):
+    """
+    Versão streaming de /generate via Server-Sent Events.
+
+    Emite `summary`, um `experience` por experiência reescrita, `skills` e
+    `suggestions` conforme cada seção termina, e `done` com o GeneratedResume
+    salvo ao final (ou `error`).
+    """
+    resume = await db.scalar(select(Resume).where(
+        Resume.id == resume_id,
+        Resume.user_id == user.id
+    ))
+
+    if not resume:
+        raise HTTPException(status_code=404, detail="Resume not found")
+
+    cv_data = resume.data
+    cache_key = make_llm_cache_key(cv_data, job_context, MODEL_NAME, PROMPT_VERSION)
+    cached = None
+    if settings.LLM_CACHE_ENABLED and not bypass_cache:
+        cached = await get_cached_result(db, cache_key)
+        await db.commit()
+
+    prompt = None if cached is not None else build_resume_prompt(cv_data, job_context)
+
+    async def event_stream():
+        if cached is not None:
+            result = cached
+            for event in _section_events(result):
+                yield event
+        else:
+            parser = ResumeStreamParser()
+            try:
+                async for text in stream_resume_with_ai(cv_data, job_context, prompt=prompt):
+                    for event in parser.feed(text):
+                        if event[0] == "item" and event[1] == "tailoredExperiences":
+                            yield _sse("experience", {"index": event[2], "experience": event[3]})
+                        elif event[0] == "field" and event[1] in SECTION_EVENTS:
+                            yield _sse(SECTION_EVENTS[event[1]], event[2])
+
+                result = await finalize_streamed_response(parser.buffer, cv_data, job_context)
+            except ValueError as e:
+                yield _sse("error", {"detail": str(e)})
+                return
+
+        # Sessão própria: a do request pode já ter sido liberada durante o stream
+        async with AsyncSessionLocal() as stream_db:
+            if cached is None and settings.LLM_CACHE_ENABLED:
+                await store_cached_result(stream_db, cache_key, result, MODEL_NAME, PROMPT_VERSION)
+
+            generated = GeneratedResume(resume_id=resume_id, generated_data=result)
+            stream_db.add(generated)
+            await stream_db.commit()
+            yield _sse("done", {"id": generated.id, "generated_data": result})
+
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    if prompt is not None:
+        headers["X-Prompt-Tokens"] = str(prompt.estimated_tokens)
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream", headers=headers)
+
+
+@router.post("/generate/{resume_id}/batch")
+async def generate_ai_resume_batch(
+    resume_id: int,
+    jobs: List[JobContext],
+    max_parallel: int | None = Query(None, ge=1, description="Gerações simultâneas (limitado pela configuração)"),
+    bypass_cache: bool = Query(False, description="Ignora o cache e força nova geração"),
+    db: AsyncSession = Depends(get_async_db),
+    user=Depends(get_current_user),
+):
+    """
+    Otimiza um currículo para várias vagas de uma vez.
+
+    As gerações rodam em paralelo e cada resultado (ou erro) é enviado como
+    uma linha NDJSON assim que termina. Todos os GeneratedResume são gravados
+    numa única transação; a última linha traz os ids criados.
+    """
+    resume = await db.scalar(select(Resume).where(
+        Resume.id == resume_id,
+        Resume.user_id == user.id
+    ))
+
+    if not resume:
+        raise HTTPException(status_code=404, detail="Resume not found")
+
+    if not jobs:
+        raise HTTPException(status_code=400, detail="Informe ao menos uma vaga")
+
+    if len(jobs) > settings.LLM_BATCH_MAX_JOBS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Lote excede o limite de {settings.LLM_BATCH_MAX_JOBS} vagas"
+        )
+
+    parallel = min(max_parallel or settings.LLM_BATCH_CONCURRENCY, settings.LLM_BATCH_CONCURRENCY)
+    cv_data = resume.data
+    job_contexts = [job.dict() for job in jobs]
+    cache_keys = [
+        make_llm_cache_key(cv_data, job_context, MODEL_NAME, PROMPT_VERSION)
+        for job_context in job_contexts
+    ]
+
+    cached = {}
+    if settings.LLM_CACHE_ENABLED and not bypass_cache:
+        for index, cache_key in enumerate(cache_keys):
+            result = await get_cached_result(db, cache_key)
+            if result is not None:
+                cached[index] = result
+        await db.commit()
+
+    # Seção do candidato serializada uma única vez para todas as vagas
+    candidate_json = serialize_candidate(cv_data)
+    prompts = {
+        index: build_resume_prompt(cv_data, job_context, candidate_json)
+        for index, job_context in enumerate(job_contexts)
+        if index not in cached
+    }
+
+    async def results_stream():
+        semaphore = asyncio.Semaphore(parallel)
+        results = {}
+
+        async def run(index: int, job_context: dict):
+            async with semaphore:
+                try:
+                    result = await generate_resume_with_ai_async(
+                        cv_data, job_context, prompt=prompts[index]
+                    )
+                    return index, result, None
+                except ValueError as e:
+                    return index, None, str(e)
+
+        for index, result in cached.items():
+            results[index] = result
+            yield json.dumps({"index": index, "status": "ok", "cached": True, "generated_data": result}) + "\n"
+
+        tasks = [
+            asyncio.create_task(run(index, job_context))
+            for index, job_context in enumerate(job_contexts)
+            if index not in cached
+        ]
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, result, error = await next_done
+                if error is not None:
+                    yield json.dumps({"index": index, "status": "error", "detail": error}) + "\n"
+                else:
+                    results[index] = result
+                    yield json.dumps({
+                        "index": index,
+                        "status": "ok",
+                        "cached": False,
+                        "prompt_tokens": prompts[index].estimated_tokens,
+                        "generated_data": result,
+                    }) + "\n"
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        # Grava todo o histórico (e o cache) numa única transação
+        async with AsyncSessionLocal() as batch_db:
+            generated_rows = {}
+            for index in sorted(results):
+                generated = GeneratedResume(resume_id=resume_id, generated_data=results[index])
+                batch_db.add(generated)
+                generated_rows[index] = generated
+
+                if index not in cached and settings.LLM_CACHE_ENABLED:
+                    await store_cached_result(batch_db, cache_keys[index], results[index], MODEL_NAME, PROMPT_VERSION)
+
+            await batch_db.commit()
+            ids = {index: generated.id for index, generated in generated_rows.items()}
+
+        yield json.dumps({
+            "status": "done",
+            "succeeded": len(results),
+            "failed": len(job_contexts) - len(results),
+            "generated_ids": ids,
+        }) + "\n"
+
+    return StreamingResponse(results_stream(), media_type="application/x-ndjson")
@@ -1,44 +1,72 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import get_async_db
 from app.core.deps import get_current_user
 from app.schemas.cv import CVData
 from app.services.resume_service import (
     create_resume,
-    get_user_resumes,
+    list_resume_summaries,
     get_resume_by_id,
+    SELECTABLE_FIELDS,
     delete_resume,  # Adicione esta importação
+    restore_resume_revision,
 )
+from app.services.revision_service import list_revisions, get_revision
+from app.services.generation_service import (
+    user_owns_resume,
+    generations_state,
+    list_generations,
+    get_generation_meta,
+    get_generation,
+)
+from app.utils.http_cache import make_etag, is_not_modified, cache_headers, not_modified
 
 router = APIRouter(prefix="/resumes", tags=["Resumes"])
 
 
 @router.post("/")
-def save_resume(
+async def save_resume(
     cv_data: CVData,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user=Depends(get_current_user),
 ):
-    resume = create_resume(db, current_user.id, cv_data.dict())
+    resume = await create_resume(db, current_user.id, cv_data.dict())
     return resume
 
 
 @router.get("/")
-def list_resumes(
-    db: Session = Depends(get_db),
+async def list_resumes(
+    response: Response,
+    limit: int = Query(settings.RESUME_PAGE_SIZE, ge=1, le=settings.RESUME_PAGE_MAX),
+    cursor: int | None = Query(None, description="Valor de X-Next-Cursor da página anterior"),
+    fields: str | None = Query(None, description="Campos extras separados por vírgula (ex.: email,skills ou data)"),
+    db: AsyncSession = Depends(get_async_db),
     current_user=Depends(get_current_user),
 ):
-    return get_user_resumes(db, current_user.id)
+    """
+    Lista resumos dos currículos (id, fullName, datas e contagens), do mais recente
+    para o mais antigo. A próxima página é indicada no header X-Next-Cursor.
+    """
+    selected = [field.strip() for field in fields.split(",") if field.strip()] if fields else []
+    unknown = [field for field in selected if field not in SELECTABLE_FIELDS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Campos inválidos: {', '.join(unknown)}")
+
+    items, next_cursor = await list_resume_summaries(db, current_user.id, limit, cursor, selected)
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+    return items
 
 
 @router.get("/{resume_id}")
-def get_resume(
+async def get_resume(
     resume_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user=Depends(get_current_user),
 ):
-    resume = get_resume_by_id(db, resume_id, current_user.id)
+    resume = await get_resume_by_id(db, resume_id, current_user.id)
 
     if not resume:
         raise HTTPException(status_code=404, detail="Resume não encontrado")
@@ -48,12 +76,12 @@ def get_resume(
 
 # NOVA ROTA DELETE
 @router.delete("/{resume_id}")
-def remove_resume(
+async def remove_resume(
     resume_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user=Depends(get_current_user),
 ):
-    success = delete_resume(db, resume_id, current_user.id)
+    success = await delete_resume(db, resume_id, current_user.id)
     
     if not success:
         raise HTTPException(status_code=404, detail="Resume não encontrado")
@@ -63,17 +91,129 @@ def remove_resume(
 
 # NOVA ROTA PUT (para edição)
 @router.put("/{resume_id}")
-def update_resume(
+async def update_resume(
     resume_id: int,
     cv_data: CVData,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user=Depends(get_current_user),
 ):
     from app.services.resume_service import update_resume as update_resume_service
     
-    resume = update_resume_service(db, resume_id, current_user.id, cv_data.dict())
+    resume = await update_resume_service(db, resume_id, current_user.id, cv_data.dict())
     
     if not resume:
         raise HTTPException(status_code=404, detail="Resume não encontrado")
     
     return resume
+
+
+@router.get("/{resume_id}/revisions")
+async def list_resume_revisions(
+    resume_id: int,
+    response: Response,
+    limit: int = Query(settings.RESUME_PAGE_SIZE, ge=1, le=settings.RESUME_PAGE_MAX),
+    cursor: int | None = Query(None, description="Valor de X-Next-Cursor da página anterior"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user),
+):
+    """Lista as revisões (versão, tipo e data), da mais recente para a mais antiga."""
+    resume = await get_resume_by_id(db, resume_id, current_user.id)
+    if not resume:
+        raise HTTPException(status_code=404, detail="Resume não encontrado")
+
+    items, next_cursor = await list_revisions(db, resume.id, limit, cursor)
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+    return items
+
+
+@router.get("/{resume_id}/revisions/{version}")
+async def get_resume_revision(
+    resume_id: int,
+    version: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user),
+):
+    resume = await get_resume_by_id(db, resume_id, current_user.id)
+    if not resume:
+        raise HTTPException(status_code=404, detail="Resume não encontrado")
+
+    revision = await get_revision(db, resume.id, version)
+    if revision is None:
+        raise HTTPException(status_code=404, detail="Revisão não encontrada")
+    return revision
+
+
+@router.post("/{resume_id}/revisions/{version}/restore")
+async def restore_resume(
+    resume_id: int,
+    version: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user),
+):
+    try:
+        resume = await restore_resume_revision(db, resume_id, current_user.id, version)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    if not resume:
+        raise HTTPException(status_code=404, detail="Resume não encontrado")
+
+    return resume
+
+
+@router.get("/{resume_id}/generations")
+async def list_resume_generations(
+    resume_id: int,
+    request: Request,
+    response: Response,
+    limit: int = Query(settings.RESUME_PAGE_SIZE, ge=1, le=settings.RESUME_PAGE_MAX),
+    cursor: int | None = Query(None, description="Valor de X-Next-Cursor da página anterior"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user),
+):
+    """
+    Lista as gerações da IA (id e data), da mais recente para a mais antiga.
+    Responde 304 se o histórico não mudou desde o ETag / Last-Modified do cliente.
+    """
+    if not await user_owns_resume(db, resume_id, current_user.id):
+        raise HTTPException(status_code=404, detail="Resume não encontrado")
+
+    last_id, count, last_created = await generations_state(db, resume_id)
+    headers = cache_headers(
+        make_etag("generations", resume_id, last_id, count, limit, cursor, weak=True),
+        last_created,
+    )
+    if is_not_modified(request, headers["ETag"], last_created):
+        return not_modified(headers)
+
+    items, next_cursor = await list_generations(db, resume_id, limit, cursor)
+    response.headers.update(headers)
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+    return items
+
+
+@router.get("/{resume_id}/generations/{generation_id}")
+async def get_resume_generation(
+    resume_id: int,
+    generation_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user),
+):
+    if not await user_owns_resume(db, resume_id, current_user.id):
+        raise HTTPException(status_code=404, detail="Resume não encontrado")
+
+    meta = await get_generation_meta(db, resume_id, generation_id)
+    if meta is None:
+        raise HTTPException(status_code=404, detail="Geração não encontrada")
+
+    # Gerações são imutáveis: o id basta como validador
+    headers = cache_headers(make_etag("generation", meta.id), meta.created_at)
+    if is_not_modified(request, headers["ETag"], meta.created_at):
+        return not_modified(headers)
+
+    response.headers.update(headers)
+    return await get_generation(db, resume_id, generation_id)
@@ -1,43 +1,91 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import HTMLResponse
-from sqlalchemy.orm import Session
-from app.core.database import get_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import get_async_db
 from app.models.resume import Resume
+from app.schemas.template import (
+    CustomTemplateCreate,
+    CustomTemplateUpdate,
+    CustomTemplateSummary,
+    CustomTemplateDetail,
+)
+from app.services.custom_template_service import (
+    list_custom_templates,
+    get_custom_template,
+    create_custom_template,
+    update_custom_template,
+    delete_custom_template,
+    render_custom_template,
+    TemplateLimitError,
+)
+from app.services.resume_service import get_resume_content_hash
 from app.services.template_service import (
     load_template,
     render_template,
     resume_to_template_data,
     get_available_templates,
+    get_templates_metadata,
+    get_template_hash,
     resume_model_to_template_data
 )
+from app.utils.http_cache import make_etag, is_not_modified, cache_headers, not_modified
 from app.core.deps import get_current_user
 
 router = APIRouter(prefix="/templates", tags=["Templates"])
 
 @router.get("/list")
 def list_templates():
-    """Lista todos os templates HTML disponíveis."""
-    templates = get_available_templates()
+    """Lista todos os templates HTML disponíveis, com hash e data de modificação."""
+    details = get_templates_metadata()
     return {
-        "templates": templates,
-        "count": len(templates)
+        "templates": [template["name"] for template in details],
+        "details": details,
+        "count": len(details)
     }
 
 
 @router.get("/preview/{resume_id}", response_class=HTMLResponse)
-def preview_template(
+async def preview_template(
     resume_id: int,
+    request: Request,
     template_name: str = Query("modern", description="Nome do template"),
-    db: Session = Depends(get_db),
+    template_id: int | None = Query(None, description="Id de um template personalizado (substitui template_name)"),
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(get_current_user)
 ):
-    """Gera preview HTML do currículo com um template específico."""
-    
+    """
+    Gera preview HTML do currículo com um template específico.
+    Responde 304 (sem renderizar) se o ETag do cliente ainda vale.
+    """
+    resume_hash = await get_resume_content_hash(db, resume_id, current_user.id)
+    if resume_hash is None:
+        raise HTTPException(status_code=404, detail="Currículo não encontrado")
+
+    custom_template = None
+    if template_id is not None:
+        custom_template = await get_custom_template(db, template_id, current_user.id)
+        if not custom_template:
+            raise HTTPException(status_code=404, detail="Template personalizado não encontrado")
+        template_key, template_hash = f"custom:{custom_template.id}", custom_template.content_hash
+    else:
+        try:
+            template_key, template_hash = template_name, get_template_hash(template_name)
+        except FileNotFoundError:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Template '{template_name}' não encontrado"
+            )
+
+    headers = cache_headers(make_etag("preview", resume_hash, template_key, template_hash))
+    if is_not_modified(request, headers["ETag"]):
+        return not_modified(headers)
+
     # Busca o currículo do usuário
-    resume = db.query(Resume).filter(
+    resume = await db.scalar(select(Resume).where(
         Resume.id == resume_id,
         Resume.user_id == current_user.id
-    ).first()
+    ))
     
     if not resume:
         raise HTTPException(status_code=404, detail="Currículo não encontrado")
@@ -53,8 +101,13 @@ def preview_template(
     
     # Renderiza o template
     try:
-        html = render_template(template_name, template_data)
-        return HTMLResponse(content=html, status_code=200)
+        if custom_template is not None:
+            html = await render_custom_template(custom_template, template_data)
+        else:
+            html = render_template(template_name, template_data)
+        return HTMLResponse(content=html, status_code=200, headers=headers)
+    except TemplateLimitError as e:
+        raise HTTPException(status_code=422, detail=str(e))
     except FileNotFoundError:
         raise HTTPException(
             status_code=404,
@@ -64,4 +117,81 @@ def preview_template(
         raise HTTPException(
             status_code=500,
             detail=f"Erro ao renderizar: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+
+@router.get("/custom", response_model=list[CustomTemplateSummary])
+async def list_user_templates(
+    db: AsyncSession = Depends(get_async_db),
+    current_user = Depends(get_current_user)
+):
+    """Lista os templates personalizados do usuário (sem o HTML)."""
+    return await list_custom_templates(db, current_user.id)
+
+
+@router.post("/custom", response_model=CustomTemplateDetail, status_code=201)
+async def create_user_template(
+    template_data: CustomTemplateCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user = Depends(get_current_user)
+):
+    """Cria um template personalizado (HTML com sintaxe Jinja, validado no sandbox)."""
+    try:
+        return await create_custom_template(
+            db, current_user.id, template_data.name, template_data.html_content
+        )
+    except TemplateLimitError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/custom/{template_id}", response_model=CustomTemplateDetail)
+async def get_user_template(
+    template_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user = Depends(get_current_user)
+):
+    template = await get_custom_template(db, template_id, current_user.id)
+
+    if not template:
+        raise HTTPException(status_code=404, detail="Template personalizado não encontrado")
+
+    return template
+
+
+@router.put("/custom/{template_id}", response_model=CustomTemplateDetail)
+async def update_user_template(
+    template_id: int,
+    template_data: CustomTemplateUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user = Depends(get_current_user)
+):
+    """Atualiza nome e/ou HTML; uma mudança no HTML gera nova revisão."""
+    try:
+        template = await update_custom_template(
+            db, template_id, current_user.id, template_data.name, template_data.html_content
+        )
+    except TemplateLimitError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if not template:
+        raise HTTPException(status_code=404, detail="Template personalizado não encontrado")
+
+    return template
+
+
+@router.delete("/custom/{template_id}")
+async def remove_user_template(
+    template_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user = Depends(get_current_user)
+):
+    success = await delete_custom_template(db, template_id, current_user.id)
+
+    if not success:
+        raise HTTPException(status_code=404, detail="Template personalizado não encontrado")
+
+    return {"message": "Template eliminado com sucesso"}
@@ -1,20 +1,44 @@
+from dataclasses import dataclass
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import get_async_db
 from app.models.user import User
 from app.core.security import SECRET_KEY, ALGORITHM
+from app.utils.ttl_cache import TTLCache
 
 # ← IMPORTANTE: O tokenUrl precisa ser o caminho COMPLETO da rota de login
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
-def get_current_user(
+@dataclass(frozen=True)
+class CurrentUser:
+    """Identidade do usuário autenticado (sem sessão do banco associada)."""
+    id: int
+    email: str | None = None
+
+
+# Identidades já conferidas no banco, por (user_id, token)
+_user_cache = TTLCache(
+    max_entries=settings.AUTH_USER_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.AUTH_USER_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_user(user_id: int):
+    """Descarta a identidade em cache (usuário removido ou senha alterada)."""
+    _user_cache.discard_where(lambda key: key[0] == user_id)
+
+
+async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
-):
+    db: AsyncSession = Depends(get_async_db),
+) -> CurrentUser:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Não autenticado",
@@ -26,12 +50,24 @@ def get_current_user(
         user_id: str = payload.get("sub")
         if user_id is None:
             raise credentials_exception
-    except JWTError:
+        user_id = int(user_id)
+    except (JWTError, ValueError):
         raise credentials_exception
 
-    user = db.query(User).filter(User.id == int(user_id)).first()
+    # Assinatura e expiração já conferidas: opcionalmente confia nas claims
+    if settings.AUTH_TRUST_TOKEN_CLAIMS and payload.get("email"):
+        return CurrentUser(id=user_id, email=payload["email"])
+
+    cache_key = (user_id, token)
+    current_user = _user_cache.get(cache_key)
+    if current_user is not None:
+        return current_user
+
+    user = (await db.execute(select(User.id, User.email).where(User.id == user_id))).first()
 
     if user is None:
         raise credentials_exception
 
-    return user
+    current_user = CurrentUser(id=user.id, email=user.email)
+    _user_cache.set(cache_key, current_user)
+    return current_user
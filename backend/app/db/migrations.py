@@ -0,0 +1,57 @@
+import logging
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+
+from app.db.session import engine
+
+logger = logging.getLogger(__name__)
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+
+class MigrationsPendingError(RuntimeError):
+    """O banco não está na última revisão das migrações."""
+
+
+def _alembic_config() -> Config:
+    config = Config(str(ALEMBIC_INI))
+    # Não reconfigura o logging da aplicação ao rodar dentro do servidor
+    config.attributes["configure_logger"] = False
+    return config
+
+
+def migration_status() -> tuple:
+    """Retorna (revisão atual do banco, revisão mais recente das migrações)."""
+    head = ScriptDirectory.from_config(_alembic_config()).get_current_head()
+    with engine.connect() as connection:
+        current = MigrationContext.configure(connection).get_current_revision()
+    return current, head
+
+
+def upgrade_to_head():
+    command.upgrade(_alembic_config(), "head")
+
+
+def check_migrations(auto_upgrade: bool = False):
+    """
+    Confere, sem emitir DDL, se o banco está atualizado. Com `auto_upgrade`,
+    aplica as migrações pendentes; caso contrário, falha com instruções.
+    """
+    current, head = migration_status()
+    if current == head:
+        return
+
+    if auto_upgrade:
+        logger.info("Aplicando migrações do banco: %s -> %s", current, head)
+        upgrade_to_head()
+        return
+
+    raise MigrationsPendingError(
+        f"Banco na revisão {current or 'nenhuma'}, esperado {head}. "
+        "Execute 'alembic upgrade head' no diretório backend "
+        "(ou defina DB_AUTO_MIGRATE=true)."
+    )
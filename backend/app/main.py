@@ -1,21 +1,44 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.routes import router
 from app.core.config import settings
-from app.db.base import Base
-from app.db.session import engine
-
-# Importa todos os models ANTES de criar as tabelas
-from app.models.user import User
-from app.models.resume import Resume
-from app.models.generated_resume import GeneratedResume
-from app.models.template import Template
-
-# Cria as tabelas automaticamente no SQLite
-Base.metadata.create_all(bind=engine)
-
-app = FastAPI(title=settings.PROJECT_NAME)
+from app.db.migrations import check_migrations
+from app.db.session import async_engine
+from app.services.browser_pool import browser_pool
+from app.services.custom_template_service import custom_template_renderer
+from app.services.export_queue import export_queue
+from app.services.native_pdf import native_pdf_renderer
+from app.services.password_hasher import password_hasher
+from app.services.template_service import template_registry
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # O esquema é gerido pelo Alembic; aqui só se confere a revisão do banco
+    check_migrations(auto_upgrade=settings.DB_AUTO_MIGRATE)
+
+    # Templates HTML compilados uma vez (bytecode em cache no disco)
+    template_registry.load_all()
+
+    # Navegadores aquecidos para exportação PDF, encerrados ao desligar
+    await browser_pool.start()
+    await native_pdf_renderer.start()
+    await custom_template_renderer.start()
+    await export_queue.start()
+    await password_hasher.start()
+    yield
+    await password_hasher.close()
+    await export_queue.close()
+    await custom_template_renderer.close()
+    await native_pdf_renderer.close()
+    await browser_pool.close()
+    await async_engine.dispose()
+
+
+app = FastAPI(title=settings.PROJECT_NAME, lifespan=lifespan)
 
 # CORS liberado para o front (React / TS)
 app.add_middleware(
@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from app.db.base import Base
+
+class ExportJob(Base):
+    __tablename__ = "export_jobs"
+
+    id = Column(String(32), primary_key=True)  # uuid4 hex
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
+    resume_id = Column(Integer, ForeignKey("resumes.id"), index=True)
+    template_name = Column(String, nullable=False)
+    status = Column(String, nullable=False, default="pending", index=True)  # pending, running, done, failed
+    attempts = Column(Integer, nullable=False, default=0)
+    error = Column(Text)
+    result_path = Column(String)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+    render_ms = Column(Integer)  # tempo da última tentativa
+    # Instância (processo) que detém o job e até quando; renovado enquanto ela vive
+    owner = Column(String(32))
+    lease_expires_at = Column(DateTime, index=True)
@@ -1,9 +1,16 @@
-from sqlalchemy import Column, Integer, ForeignKey, JSON
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, ForeignKey, JSON, DateTime, Index
 from app.db.base import Base
 
 class GeneratedResume(Base):
     __tablename__ = "generated_resumes"
+    # Histórico de um currículo em ordem de criação; cobre a listagem (id, created_at)
+    __table_args__ = (
+        Index("ix_generated_resumes_resume_id_id_created_at", "resume_id", "id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     resume_id = Column(Integer, ForeignKey("resumes.id"))
     generated_data = Column(JSON)  # saída da IA
+    created_at = Column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,15 @@
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, String, DateTime, JSON
+from app.db.base import Base
+
+class LLMCacheEntry(Base):
+    __tablename__ = "llm_cache"
+
+    key = Column(String(64), primary_key=True)  # sha256 de cv + vaga + modelo + versão do prompt
+    model = Column(String, nullable=False)
+    prompt_version = Column(String, nullable=False)
+    response = Column(JSON, nullable=False)  # saída da IA já validada
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    last_used_at = Column(DateTime, default=datetime.utcnow, index=True)
+    hits = Column(Integer, nullable=False, default=0)
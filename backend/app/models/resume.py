@@ -1,11 +1,18 @@
-from sqlalchemy import Column, Integer, ForeignKey, JSON
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, String, ForeignKey, JSON, DateTime, Index
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
 class Resume(Base):
     __tablename__ = "resumes"
+    # (user_id, id) atende às buscas por dono e à paginação por keyset
+    __table_args__ = (Index("ix_resumes_user_id_id", "user_id", "id"),)
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
     data = Column(JSON, nullable=False)
+    content_hash = Column(String(64))  # SHA-256 do JSON canônico de `data` (base dos ETags)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     user = relationship("User")
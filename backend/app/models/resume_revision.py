@@ -0,0 +1,16 @@
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, String, ForeignKey, JSON, DateTime, UniqueConstraint
+from app.db.base import Base
+
+class ResumeRevision(Base):
+    __tablename__ = "resume_revisions"
+    # Também serve de índice para buscar o snapshot mais próximo de uma versão
+    __table_args__ = (UniqueConstraint("resume_id", "version", name="uq_resume_revisions_resume_id_version"),)
+
+    id = Column(Integer, primary_key=True)
+    resume_id = Column(Integer, ForeignKey("resumes.id"), nullable=False)
+    version = Column(Integer, nullable=False)
+    kind = Column(String(8), nullable=False)  # snapshot (dados completos) ou delta (diff da versão anterior)
+    payload = Column(JSON, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
@@ -1,9 +1,16 @@
-from sqlalchemy import Column, Integer, ForeignKey, Text
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, String, ForeignKey, Text, DateTime
 from app.db.base import Base
 
 class Template(Base):
     __tablename__ = "templates"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"))
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
+    name = Column(String(100))
     html_content = Column(Text)  # template convertido para HTML
+    revision = Column(Integer, nullable=False, default=1)  # incrementada a cada edição do HTML
+    content_hash = Column(String(64))  # SHA-256 de html_content
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
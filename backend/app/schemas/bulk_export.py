@@ -0,0 +1,8 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class BulkExportRequest(BaseModel):
+    resume_ids: Optional[List[int]] = None  # None = todos os currículos do usuário
+    templates: List[str] = ["modern", "classic", "creative"]
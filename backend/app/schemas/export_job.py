@@ -0,0 +1,24 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class ExportJobCreate(BaseModel):
+    resume_id: int
+    template_name: str = "modern"
+
+
+class ExportJobStatus(BaseModel):
+    id: str
+    resume_id: int
+    template_name: str
+    status: str
+    attempts: int
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    render_ms: Optional[int] = None
+
+    model_config = {"from_attributes": True}
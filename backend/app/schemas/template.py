@@ -0,0 +1,29 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class CustomTemplateCreate(BaseModel):
+    name: str = Field(..., min_length=1, max_length=100)
+    html_content: str
+
+
+class CustomTemplateUpdate(BaseModel):
+    name: Optional[str] = Field(None, min_length=1, max_length=100)
+    html_content: Optional[str] = None
+
+
+class CustomTemplateSummary(BaseModel):
+    id: int
+    name: Optional[str] = None
+    revision: int
+    content_hash: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    model_config = {"from_attributes": True}
+
+
+class CustomTemplateDetail(CustomTemplateSummary):
+    html_content: str
@@ -0,0 +1,219 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+
+from playwright.async_api import async_playwright
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeoutError(Exception):
+    """Nenhum navegador ficou livre dentro do tempo limite."""
+
+
+class PoolClosedError(Exception):
+    """O pool está sendo encerrado e não aceita novos empréstimos."""
+
+
+async def _allow_only_data_urls(route):
+    """Handler de rota para HTML não confiável: nada sai para a rede ou para o disco."""
+    if route.request.url.startswith("data:"):
+        await route.continue_()
+    else:
+        await route.abort()
+
+
+class _PooledBrowser:
+    """Um navegador Chromium com seu contexto e página reaproveitáveis."""
+
+    def __init__(self, browser, context, page):
+        self.browser = browser
+        self.context = context
+        self.page = page
+        self.uses = 0
+
+    def is_healthy(self) -> bool:
+        return self.browser.is_connected() and not self.page.is_closed()
+
+    async def close(self):
+        try:
+            await self.browser.close()
+        except Exception:
+            pass
+
+
+class BrowserPool:
+    """
+    Pool de navegadores Chromium mantidos aquecidos durante a vida da aplicação.
+
+    Cada exportação empresta um navegador (contexto + página), renderiza e
+    devolve. Navegadores são reciclados após `max_uses` renderizações ou
+    quando falham no health check.
+    """
+
+    def __init__(self, size: int, max_uses: int, acquire_timeout: float):
+        self.size = size
+        self.max_uses = max_uses
+        self.acquire_timeout = acquire_timeout
+
+        self._playwright = None
+        self._available: asyncio.Queue | None = None
+        self._lock: asyncio.Lock | None = None
+        self._closing = False
+        self._in_use = 0
+        self._waiting = 0
+
+        # Métricas
+        self._acquired_total = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._recycled = 0
+        self._timeouts = 0
+
+    async def start(self):
+        """Inicia o Playwright e aquece os navegadores do pool."""
+        self._closing = False
+        self._lock = asyncio.Lock()
+        self._available = asyncio.Queue()
+        self._playwright = await async_playwright().start()
+
+        for _ in range(self.size):
+            try:
+                slot = await self._launch()
+            except Exception as e:
+                # Chromium indisponível no boot: o slot é lançado no primeiro uso
+                logger.warning("Falha ao aquecer navegador do pool: %s", e)
+                slot = None
+            self._available.put_nowait(slot)
+
+    async def _launch(self) -> _PooledBrowser:
+        browser = await self._playwright.chromium.launch(headless=True)
+        context = await browser.new_context()
+        page = await context.new_page()
+        return _PooledBrowser(browser, context, page)
+
+    async def _recycle(self, slot: _PooledBrowser | None) -> _PooledBrowser:
+        if slot is not None:
+            self._recycled += 1
+            await slot.close()
+        return await self._launch()
+
+    @asynccontextmanager
+    async def page(self, untrusted: bool = False):
+        """
+        Empresta uma página pronta para renderizar e a devolve ao final.
+
+        Com `untrusted=True` (HTML enviado por usuários) a página vem de um
+        contexto novo e descartável, sem JavaScript e com toda requisição que
+        não seja `data:` abortada: o HTML não alcança serviços internos
+        (metadados da nuvem, localhost) nem arquivos locais.
+        """
+        if self._available is None:
+            await self.start()
+        if self._closing:
+            raise PoolClosedError("Pool de navegadores em encerramento")
+
+        started = time.perf_counter()
+        self._waiting += 1
+        try:
+            slot = await asyncio.wait_for(
+                self._available.get(), timeout=self.acquire_timeout
+            )
+        except asyncio.TimeoutError:
+            self._timeouts += 1
+            raise PoolTimeoutError(
+                f"Nenhum navegador livre após {self.acquire_timeout}s"
+            )
+        finally:
+            self._waiting -= 1
+
+        waited = time.perf_counter() - started
+        self._acquired_total += 1
+        self._wait_total += waited
+        self._wait_max = max(self._wait_max, waited)
+        self._in_use += 1
+
+        failed = False
+        try:
+            if slot is None or not slot.is_healthy():
+                slot = await self._recycle(slot)
+            if not untrusted:
+                yield slot.page
+            else:
+                context = await slot.browser.new_context(java_script_enabled=False)
+                try:
+                    await context.route("**/*", _allow_only_data_urls)
+                    yield await context.new_page()
+                finally:
+                    await context.close()
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self._in_use -= 1
+            await self._release(slot, failed)
+
+    async def _release(self, slot: _PooledBrowser | None, failed: bool):
+        try:
+            if slot is not None:
+                slot.uses += 1
+                if slot.uses >= self.max_uses or not slot.is_healthy():
+                    slot = await self._recycle(slot)
+                elif failed:
+                    # Página pode ter ficado em estado inconsistente
+                    await slot.page.close()
+                    slot.page = await slot.context.new_page()
+                else:
+                    await slot.page.goto("about:blank")
+        except Exception as e:
+            logger.warning("Falha ao reciclar navegador do pool: %s", e)
+            if slot is not None:
+                await slot.close()
+            slot = None
+        self._available.put_nowait(slot)
+
+    async def close(self, timeout: float = settings.PDF_POOL_DRAIN_TIMEOUT):
+        """Aguarda as renderizações em andamento e encerra os navegadores."""
+        if self._available is None:
+            return
+        self._closing = True
+
+        deadline = time.monotonic() + timeout
+        while self._in_use and time.monotonic() < deadline:
+            await asyncio.sleep(0.1)
+
+        while not self._available.empty():
+            slot = self._available.get_nowait()
+            if slot is not None:
+                await slot.close()
+
+        if self._playwright is not None:
+            await self._playwright.stop()
+        self._playwright = None
+        self._available = None
+
+    def stats(self) -> dict:
+        """Ocupação e tempos de espera do pool."""
+        acquired = self._acquired_total
+        return {
+            "size": self.size,
+            "in_use": self._in_use,
+            "available": self.size - self._in_use,
+            "waiting": self._waiting,
+            "acquired_total": acquired,
+            "avg_wait_ms": round(self._wait_total / acquired * 1000, 2) if acquired else 0.0,
+            "max_wait_ms": round(self._wait_max * 1000, 2),
+            "timeouts": self._timeouts,
+            "recycled": self._recycled,
+            "max_uses": self.max_uses,
+        }
+
+
+browser_pool = BrowserPool(
+    size=settings.PDF_POOL_SIZE,
+    max_uses=settings.PDF_POOL_MAX_USES,
+    acquire_timeout=settings.PDF_POOL_ACQUIRE_TIMEOUT,
+)
@@ -0,0 +1,61 @@
+import asyncio
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.resume import Resume
+from app.services.pdf_service import render_resume_pdf
+from app.utils.zipstream import ZipStream
+
+
+async def _render_entry(resume_id: int, template_name: str) -> tuple:
+    # Cada renderização carrega apenas o próprio currículo
+    async with AsyncSessionLocal() as db:
+        resume = await db.get(Resume, resume_id)
+    pdf_bytes = await render_resume_pdf(resume, template_name)
+    return f"resume_{resume_id}_{template_name}.pdf", pdf_bytes
+
+
+async def stream_bulk_zip(items: list, concurrency: int = settings.EXPORT_BULK_CONCURRENCY):
+    """
+    Renderiza pares (resume_id, template_name) concorrentemente e emite um
+    ZIP à medida que cada PDF fica pronto.
+
+    No máximo `concurrency` PDFs ficam em memória ao mesmo tempo, qualquer
+    que seja o tamanho do lote. Falhas individuais viram entradas em errors/.
+    """
+    zip_stream = ZipStream()
+    pending = set()
+    remaining = iter(items)
+
+    def launch_next():
+        item = next(remaining, None)
+        if item is not None:
+            task = asyncio.create_task(_render_entry(*item))
+            task.item = item
+            pending.add(task)
+
+    for _ in range(max(1, concurrency)):
+        launch_next()
+
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                pending.discard(task)
+                launch_next()
+
+                try:
+                    name, pdf_bytes = task.result()
+                    yield zip_stream.add(name, pdf_bytes)
+                except Exception as e:
+                    resume_id, template_name = task.item
+                    yield zip_stream.add(
+                        f"errors/resume_{resume_id}_{template_name}.txt",
+                        f"Erro ao gerar PDF: {str(e)}"
+                    )
+
+        yield zip_stream.close()
+    finally:
+        # Cliente desconectou: interrompe as renderizações restantes
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,268 @@
+"""
+Templates HTML enviados pelos usuários (modelo Template).
+
+Renderizados num ambiente Jinja isolado (LimitedSandbox): o template só acessa
+os dados do currículo, sem atributos internos do Python, e não consegue
+multiplicar strings/listas nem gerar ranges além de limites fixos. Compilação
+e renderização rodam num pool de processos próprio, com prazo
+(CUSTOM_TEMPLATE_RENDER_TIMEOUT), memória (CUSTOM_TEMPLATE_MAX_MEMORY_MB) e
+tamanho de saída limitados: um template abusivo afeta só o próprio worker,
+nunca o event loop. Até a compilação precisa disso, pois o Jinja avalia
+expressões constantes (ex.: filtros) ao compilar.
+
+Cada worker guarda os templates compilados num cache LRU chaveado por (id,
+revisão, hash); uma edição incrementa a revisão e a versão antiga
+simplesmente deixa de ser usada. O hash evita reaproveitar a entrada de outro
+template quando o SQLite reutiliza o id de um template removido.
+"""
+import asyncio
+import hashlib
+from concurrent.futures.process import BrokenProcessPool
+
+from jinja2 import TemplateSyntaxError
+from jinja2.sandbox import SandboxedEnvironment
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.template import Template
+from app.services.process_pool import ProcessPool
+from app.utils.ttl_cache import TTLCache
+
+# Limites do sandbox (por operação)
+MAX_RANGE = 10_000
+MAX_SEQUENCE_LENGTH = 1_000_000
+MAX_EXPONENT = 1_000
+
+
+class TemplateLimitError(ValueError):
+    """O template passou de um limite de tempo, memória ou tamanho (responder 422)."""
+
+
+def _limited_range(*args):
+    values = range(*args)
+    if len(values) > MAX_RANGE:
+        raise TemplateLimitError(f"range() acima de {MAX_RANGE} itens")
+    return values
+
+
+def _sequence_length(value):
+    return len(value) if isinstance(value, (str, bytes, list, tuple)) else None
+
+
+class LimitedSandbox(SandboxedEnvironment):
+    """SandboxedEnvironment que barra operações que alocam memória sem limite."""
+
+    # Interceptar também impede o Jinja de calcular essas expressões ao compilar
+    intercepted_binops = frozenset(["*", "**", "+"])
+
+    def __init__(self, **options):
+        super().__init__(**options)
+        self.globals["range"] = _limited_range
+
+    def call_binop(self, context, op: str, left, right):
+        if op == "*":
+            for sequence, times in ((left, right), (right, left)):
+                length = _sequence_length(sequence)
+                if length is not None and isinstance(times, int) and length * times > MAX_SEQUENCE_LENGTH:
+                    raise TemplateLimitError(f"Sequência acima de {MAX_SEQUENCE_LENGTH} itens")
+        elif op == "**":
+            if isinstance(right, int) and isinstance(left, int) and abs(left) > 1 and right > MAX_EXPONENT:
+                raise TemplateLimitError(f"Expoente acima de {MAX_EXPONENT}")
+        elif op == "+":
+            left_length, right_length = _sequence_length(left), _sequence_length(right)
+            if left_length is not None and right_length is not None:
+                if left_length + right_length > MAX_SEQUENCE_LENGTH:
+                    raise TemplateLimitError(f"Sequência acima de {MAX_SEQUENCE_LENGTH} itens")
+        return super().call_binop(context, op, left, right)
+
+
+sandbox_env = LimitedSandbox(autoescape=True)
+
+# Cache dos compilados; vive em cada worker do pool
+_compiled = TTLCache(
+    max_entries=settings.CUSTOM_TEMPLATE_CACHE_SIZE,
+    ttl_seconds=settings.CUSTOM_TEMPLATE_CACHE_TTL_SECONDS,
+)
+
+
+def _hash(html_content: str) -> str:
+    return hashlib.sha256(html_content.encode("utf-8")).hexdigest()
+
+
+def compile_custom_template(html_content: str):
+    """Compila o HTML no sandbox; ValueError se for grande demais ou inválido."""
+    if len(html_content.encode("utf-8")) > settings.CUSTOM_TEMPLATE_MAX_BYTES:
+        raise ValueError(f"Template excede o limite de {settings.CUSTOM_TEMPLATE_MAX_BYTES} bytes")
+    try:
+        return sandbox_env.from_string(html_content)
+    except TemplateSyntaxError as e:
+        raise ValueError(f"Template inválido (linha {e.lineno}): {e.message}")
+
+
+def _limit_worker_memory(max_bytes: int):
+    """Initializer dos workers: teto de memória do processo (só em sistemas POSIX)."""
+    try:
+        import resource
+    except ImportError:
+        return
+    resource.setrlimit(resource.RLIMIT_AS, (max_bytes, max_bytes))
+
+
+def _validate_source(html_content: str) -> None:
+    # Roda no worker: compilar pode avaliar expressões constantes do template
+    compile_custom_template(html_content)
+
+
+def _render_source(key: tuple, html_content: str, data: dict) -> str:
+    """Renderiza no worker, cortando a saída em CUSTOM_TEMPLATE_MAX_OUTPUT_BYTES."""
+    compiled = _compiled.get(key)
+    if compiled is None:
+        compiled = compile_custom_template(html_content)
+        _compiled.set(key, compiled)
+
+    parts, size = [], 0
+    for part in compiled.generate(**data):
+        size += len(part)
+        if size > settings.CUSTOM_TEMPLATE_MAX_OUTPUT_BYTES:
+            raise TemplateLimitError(
+                f"Saída do template acima de {settings.CUSTOM_TEMPLATE_MAX_OUTPUT_BYTES} caracteres"
+            )
+        parts.append(part)
+    return "".join(parts)
+
+
+def _cache_key(template: Template) -> tuple:
+    return (template.id, template.revision, template.content_hash)
+
+
+class CustomTemplateRenderer:
+    """
+    Compila e renderiza templates personalizados no pool de processos, com
+    prazo; com `workers=0` roda no próprio processo (sem prazo, só para
+    desenvolvimento).
+    """
+
+    def __init__(self, workers: int, timeout: float, max_memory_mb: int):
+        self.workers = workers
+        self.timeout = timeout
+        self._pool = ProcessPool(
+            "templates personalizados", workers,
+            initializer=_limit_worker_memory, initargs=(max_memory_mb * 1024 * 1024,),
+        )
+        self.rendered = 0
+        self.rejected = 0
+
+    async def start(self):
+        if self.workers > 0:
+            await self._pool.start(_validate_source, "")
+
+    async def close(self):
+        await self._pool.close()
+
+    async def _run(self, func, *args):
+        try:
+            if self.workers <= 0:
+                return func(*args)
+            return await self._pool.run(func, *args, timeout=self.timeout)
+        except TemplateLimitError:
+            self.rejected += 1
+            raise
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise TemplateLimitError(f"Template excedeu o tempo limite de {self.timeout}s")
+        except (MemoryError, OverflowError, BrokenProcessPool):
+            self.rejected += 1
+            raise TemplateLimitError("Template excedeu o limite de memória")
+        except ValueError:
+            raise
+        except Exception as e:
+            raise ValueError(f"Erro ao renderizar template: {str(e)}")
+
+    async def validate(self, html_content: str):
+        """Compila o template (ValueError se inválido, TemplateLimitError se abusivo)."""
+        await self._run(_validate_source, html_content)
+
+    async def render(self, template: Template, data: dict) -> str:
+        """Renderiza um template personalizado com os dados do currículo."""
+        self.rendered += 1
+        return await self._run(_render_source, _cache_key(template), template.html_content or "", data)
+
+    def stats(self) -> dict:
+        return {"workers": self.workers, "rendered": self.rendered, "rejected": self.rejected}
+
+
+custom_template_renderer = CustomTemplateRenderer(
+    workers=settings.CUSTOM_TEMPLATE_WORKERS,
+    timeout=settings.CUSTOM_TEMPLATE_RENDER_TIMEOUT,
+    max_memory_mb=settings.CUSTOM_TEMPLATE_MAX_MEMORY_MB,
+)
+
+
+async def render_custom_template(template: Template, data: dict) -> str:
+    """Renderiza um template personalizado fora do event loop (ver CustomTemplateRenderer)."""
+    return await custom_template_renderer.render(template, data)
+
+
+async def list_custom_templates(db: AsyncSession, user_id: int):
+    result = await db.execute(
+        select(
+            Template.id, Template.name, Template.revision, Template.content_hash,
+            Template.created_at, Template.updated_at,
+        )
+        .where(Template.user_id == user_id)
+        .order_by(Template.id)
+    )
+    return result.mappings().all()
+
+
+async def get_custom_template(db: AsyncSession, template_id: int, user_id: int):
+    return await db.scalar(
+        select(Template).where(Template.id == template_id, Template.user_id == user_id)
+    )
+
+
+async def create_custom_template(db: AsyncSession, user_id: int, name: str, html_content: str):
+    await custom_template_renderer.validate(html_content)
+
+    template = Template(
+        user_id=user_id,
+        name=name,
+        html_content=html_content,
+        revision=1,
+        content_hash=_hash(html_content),
+    )
+    db.add(template)
+    await db.commit()
+    await db.refresh(template)
+    return template
+
+
+async def update_custom_template(
+    db: AsyncSession, template_id: int, user_id: int, name: str | None, html_content: str | None
+):
+    template = await get_custom_template(db, template_id, user_id)
+    if not template:
+        return None
+
+    if html_content is not None and _hash(html_content) != template.content_hash:
+        await custom_template_renderer.validate(html_content)
+        template.html_content = html_content
+        template.content_hash = _hash(html_content)
+        template.revision += 1
+    if name is not None:
+        template.name = name
+
+    await db.commit()
+    await db.refresh(template)
+    return template
+
+
+async def delete_custom_template(db: AsyncSession, template_id: int, user_id: int):
+    template = await get_custom_template(db, template_id, user_id)
+    if not template:
+        return False
+
+    await db.delete(template)
+    await db.commit()
+    return True
@@ -0,0 +1,199 @@
+"""
+Exportação do currículo para Word (.docx).
+
+O pacote OOXML é emitido como stream de um ZIP: as partes estáticas
+(content types, relacionamentos, estilos) são montadas uma única vez e
+ficam em memória; o word/document.xml é gerado parágrafo a parágrafo,
+então a memória usada não depende do tamanho do currículo.
+"""
+import re
+import zipfile
+from xml.sax.saxutils import escape
+
+from app.utils.zipstream import ZipStream
+
+DOCX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+# Caracteres de controle não são permitidos em XML 1.0
+_INVALID_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+
+# Parágrafos acumulados antes de enviar um pedaço do ZIP
+CHUNK_PARAGRAPHS = 32
+
+_XML_HEADER = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+_CONTENT_TYPES = _XML_HEADER + (
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '<Override PartName="/word/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>'
+    '<Override PartName="/docProps/app.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.extended-properties+xml"/>'
+    '</Types>'
+)
+
+_ROOT_RELS = _XML_HEADER + (
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    '<Relationship Id="rId2" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/extended-properties" '
+    'Target="docProps/app.xml"/>'
+    '</Relationships>'
+)
+
+_DOCUMENT_RELS = _XML_HEADER + (
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/>'
+    '</Relationships>'
+)
+
+_APP_PROPS = _XML_HEADER + (
+    '<Properties xmlns="http://schemas.openxmlformats.org/officeDocument/2006/extended-properties">'
+    '<Application>AI Resume Architect</Application>'
+    '</Properties>'
+)
+
+
+def _style(style_id: str, name: str, size: int, bold: bool = False, color: str | None = None,
+           space_before: int = 0, space_after: int = 80) -> str:
+    run = f'<w:sz w:val="{size}"/><w:szCs w:val="{size}"/>'
+    if bold:
+        run = "<w:b/>" + run
+    if color:
+        run = f'<w:color w:val="{color}"/>' + run
+    return (
+        f'<w:style w:type="paragraph" w:styleId="{style_id}">'
+        f'<w:name w:val="{name}"/><w:basedOn w:val="Normal"/><w:qFormat/>'
+        f'<w:pPr><w:spacing w:before="{space_before}" w:after="{space_after}"/></w:pPr>'
+        f'<w:rPr>{run}</w:rPr></w:style>'
+    )
+
+
+_STYLES = _XML_HEADER + (
+    '<w:styles xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    '<w:docDefaults><w:rPrDefault><w:rPr>'
+    '<w:rFonts w:ascii="Arial" w:hAnsi="Arial" w:cs="Arial" w:eastAsia="Arial"/>'
+    '<w:sz w:val="21"/><w:szCs w:val="21"/><w:lang w:val="pt-BR"/>'
+    '</w:rPr></w:rPrDefault>'
+    '<w:pPrDefault><w:pPr><w:spacing w:after="80" w:line="264" w:lineRule="auto"/></w:pPr></w:pPrDefault>'
+    '</w:docDefaults>'
+    '<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/><w:qFormat/></w:style>'
+    + _style("Title", "Title", 44, bold=True, color="1E293B", space_after=40)
+    + _style("Subtitle", "Subtitle", 19, color="475569", space_after=200)
+    + _style("Heading1", "heading 1", 26, bold=True, color="1E3A8A", space_before=240, space_after=80)
+    + _style("Heading2", "heading 2", 22, bold=True, space_before=120, space_after=20)
+    + _style("Caption", "caption", 18, color="64748B", space_after=60)
+    + '</w:styles>'
+)
+
+_DOCUMENT_START = _XML_HEADER + (
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>'
+)
+
+# A4 com margens de 1,5 cm (as mesmas do PDF)
+_DOCUMENT_END = (
+    '<w:sectPr><w:pgSz w:w="11906" w:h="16838"/>'
+    '<w:pgMar w:top="850" w:right="850" w:bottom="850" w:left="850" '
+    'w:header="708" w:footer="708" w:gutter="0"/></w:sectPr>'
+    '</w:body></w:document>'
+)
+
+# Partes que não dependem do currículo: codificadas uma única vez
+STATIC_PARTS = {
+    "[Content_Types].xml": _CONTENT_TYPES.encode("utf-8"),
+    "_rels/.rels": _ROOT_RELS.encode("utf-8"),
+    "word/_rels/document.xml.rels": _DOCUMENT_RELS.encode("utf-8"),
+    "word/styles.xml": _STYLES.encode("utf-8"),
+    "docProps/app.xml": _APP_PROPS.encode("utf-8"),
+}
+
+
+def _text(value) -> str:
+    return escape(_INVALID_XML_CHARS.sub("", str(value or "")))
+
+
+def _run(text: str, bold: bool = False, italic: bool = False) -> str:
+    """Run de texto; quebras de linha viram <w:br/>."""
+    props = ("<w:b/>" if bold else "") + ("<w:i/>" if italic else "")
+    props = f"<w:rPr>{props}</w:rPr>" if props else ""
+    lines = str(text or "").splitlines() or [""]
+    body = "<w:br/>".join(f'<w:t xml:space="preserve">{_text(line)}</w:t>' for line in lines)
+    return f"<w:r>{props}{body}</w:r>"
+
+
+def _paragraph(*runs: str, style: str | None = None) -> str:
+    props = f'<w:pPr><w:pStyle w:val="{style}"/></w:pPr>' if style else ""
+    return f"<w:p>{props}{''.join(runs)}</w:p>"
+
+
+def _document_paragraphs(data: dict):
+    """Gera os parágrafos do corpo, seção por seção."""
+    yield _paragraph(_run(data.get("fullName") or "Sem Nome"), style="Title")
+
+    contact = [
+        data.get(field) for field in ("email", "phone", "location", "linkedin") if data.get(field)
+    ]
+    if contact:
+        yield _paragraph(_run(" | ".join(contact)), style="Subtitle")
+
+    if data.get("summary"):
+        yield _paragraph(_run("RESUMO PROFISSIONAL"), style="Heading1")
+        yield _paragraph(_run(data["summary"]))
+
+    experiences = data.get("experience") or []
+    if experiences:
+        yield _paragraph(_run("EXPERIÊNCIA PROFISSIONAL"), style="Heading1")
+        for exp in experiences:
+            title = " @ ".join(part for part in (exp.get("role"), exp.get("company")) if part)
+            yield _paragraph(_run(title), style="Heading2")
+            if exp.get("period"):
+                yield _paragraph(_run(exp["period"], italic=True), style="Caption")
+            if exp.get("description"):
+                yield _paragraph(_run(exp["description"]))
+
+    education = data.get("education") or []
+    if education:
+        yield _paragraph(_run("FORMAÇÃO ACADÊMICA"), style="Heading1")
+        for edu in education:
+            yield _paragraph(_run(edu.get("degree") or ""), style="Heading2")
+            details = " | ".join(part for part in (edu.get("institution"), edu.get("year")) if part)
+            if details:
+                yield _paragraph(_run(details), style="Caption")
+
+    skills = [skill for skill in data.get("skills") or [] if skill]
+    if skills:
+        yield _paragraph(_run("HABILIDADES"), style="Heading1")
+        yield _paragraph(_run(" • ".join(skills)))
+
+
+def stream_resume_docx(data: dict):
+    """
+    Gera o .docx do currículo em pedaços de bytes (para StreamingResponse).
+    O document.xml é escrito incrementalmente, em blocos de CHUNK_PARAGRAPHS.
+    """
+    zip_stream = ZipStream(compression=zipfile.ZIP_DEFLATED)
+
+    for name, content in STATIC_PARTS.items():
+        yield zip_stream.add(name, content)
+
+    with zip_stream.open("word/document.xml") as entry:
+        entry.write(_DOCUMENT_START.encode("utf-8"))
+        batch = []
+        for paragraph in _document_paragraphs(data):
+            batch.append(paragraph)
+            if len(batch) >= CHUNK_PARAGRAPHS:
+                entry.write("".join(batch).encode("utf-8"))
+                batch.clear()
+                yield zip_stream.drain()
+        batch.append(_DOCUMENT_END)
+        entry.write("".join(batch).encode("utf-8"))
+
+    yield zip_stream.drain()
+    yield zip_stream.close()
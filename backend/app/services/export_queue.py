@@ -0,0 +1,304 @@
+import asyncio
+import logging
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import delete, or_, select, update
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.export_job import ExportJob
+from app.models.resume import Resume
+from app.services.pdf_service import render_resume_pdf
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = ("pending", "running")
+FINISHED_STATUSES = ("done", "failed")
+
+# Jobs apagados por comando na limpeza
+CLEANUP_BATCH = 500
+
+# Folga entre a gravação do PDF e a conclusão do job, ao apagar arquivos pelo mtime
+RESULT_FILE_GRACE_SECONDS = 3600
+
+
+class QueueFullError(Exception):
+    """A fila de exportação atingiu o limite de jobs pendentes."""
+
+
+class ExportQueue:
+    """
+    Fila de exportação PDF local, persistida na tabela export_jobs.
+
+    Um número fixo de workers asyncio consome a fila; jobs que falham são
+    reenfileirados até `max_attempts`.
+
+    Cada job pertence à instância que o enfileirou (`owner`), que renova a
+    concessão (`lease_expires_at`) enquanto está viva. Com vários workers do
+    uvicorn, uma instância só assume jobs cuja concessão expirou, ou seja,
+    de processos que caíram. Jobs concluídos e seus PDFs são apagados após
+    `retention_hours`.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        max_pending: int,
+        max_attempts: int,
+        results_dir: str,
+        lease_seconds: int,
+        retention_hours: float,
+        cleanup_interval: int,
+    ):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.max_attempts = max_attempts
+        self.results_dir = Path(results_dir)
+        self.lease_seconds = lease_seconds
+        self.retention_hours = retention_hours
+        self.cleanup_interval = cleanup_interval
+
+        self.instance_id = uuid.uuid4().hex
+        self._queue: asyncio.Queue | None = None
+        self._tasks: list = []
+        self._maintenance_task: asyncio.Task | None = None
+
+    async def start(self):
+        """Recupera jobs órfãos, limpa os expirados e inicia os workers."""
+        self._queue = asyncio.Queue()
+        self.results_dir.mkdir(parents=True, exist_ok=True)
+
+        await self._recover_orphans()
+        await self._cleanup()
+
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"export-worker-{i}")
+            for i in range(self.workers)
+        ]
+        self._maintenance_task = asyncio.create_task(self._maintenance(), name="export-maintenance")
+
+    async def close(self):
+        """
+        Interrompe os workers e libera as concessões: os jobs em andamento
+        são assumidos por outra instância viva ou no próximo boot.
+        """
+        tasks = self._tasks + ([self._maintenance_task] if self._maintenance_task else [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks = []
+        self._maintenance_task = None
+        self._queue = None
+
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(
+                    update(ExportJob)
+                    .where(ExportJob.owner == self.instance_id, ExportJob.status.in_(ACTIVE_STATUSES))
+                    .values(lease_expires_at=datetime.utcnow())
+                    .execution_options(synchronize_session=False)
+                )
+                await db.commit()
+        except Exception as e:
+            logger.warning("Falha ao liberar jobs de exportação: %s", e)
+
+    def _lease_deadline(self) -> datetime:
+        return datetime.utcnow() + timedelta(seconds=self.lease_seconds)
+
+    async def _recover_orphans(self):
+        """Assume jobs ativos sem dono ou com a concessão expirada."""
+        now = datetime.utcnow()
+        orphaned = (
+            ExportJob.status.in_(ACTIVE_STATUSES),
+            or_(ExportJob.lease_expires_at.is_(None), ExportJob.lease_expires_at < now),
+        )
+
+        claimed = []
+        async with AsyncSessionLocal() as db:
+            job_ids = (
+                await db.scalars(select(ExportJob.id).where(*orphaned).order_by(ExportJob.created_at))
+            ).all()
+            for job_id in job_ids:
+                # UPDATE condicional: se outra instância assumiu antes, nada muda
+                result = await db.execute(
+                    update(ExportJob)
+                    .where(ExportJob.id == job_id, *orphaned)
+                    .values(status="pending", owner=self.instance_id, lease_expires_at=self._lease_deadline())
+                    .execution_options(synchronize_session=False)
+                )
+                if result.rowcount:
+                    claimed.append(job_id)
+            await db.commit()
+
+        if claimed:
+            logger.info("Recuperados %d jobs de exportação órfãos", len(claimed))
+        for job_id in claimed:
+            self._queue.put_nowait(job_id)
+
+    async def _renew_leases(self):
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(ExportJob)
+                .where(ExportJob.owner == self.instance_id, ExportJob.status.in_(ACTIVE_STATUSES))
+                .values(lease_expires_at=self._lease_deadline())
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+
+    async def _cleanup(self):
+        """Apaga jobs concluídos há mais de `retention_hours` e os PDFs correspondentes."""
+        if self.retention_hours <= 0:
+            return
+        cutoff = datetime.utcnow() - timedelta(hours=self.retention_hours)
+
+        deleted = 0
+        async with AsyncSessionLocal() as db:
+            while True:
+                job_ids = (
+                    await db.scalars(
+                        select(ExportJob.id)
+                        .where(ExportJob.status.in_(FINISHED_STATUSES), ExportJob.finished_at < cutoff)
+                        .limit(CLEANUP_BATCH)
+                    )
+                ).all()
+                if not job_ids:
+                    break
+                await db.execute(delete(ExportJob).where(ExportJob.id.in_(job_ids)))
+                await db.commit()
+                deleted += len(job_ids)
+
+        # Arquivos só depois das linhas: um download nunca aponta para PDF já apagado
+        removed = await asyncio.to_thread(
+            self._remove_old_results, cutoff.timestamp() - RESULT_FILE_GRACE_SECONDS
+        )
+        if deleted or removed:
+            logger.info("Limpeza da exportação: %d jobs e %d arquivos removidos", deleted, removed)
+
+    def _remove_old_results(self, cutoff: float) -> int:
+        # O PDF é gravado antes de o job ser concluído: arquivos mais velhos
+        # que o prazo pertencem a jobs já apagados (ou que nunca terminaram)
+        removed = 0
+        for path in self.results_dir.glob("*.pdf"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                pass
+        return removed
+
+    async def _maintenance(self):
+        """Renova as concessões, assume órfãos e limpa jobs antigos periodicamente."""
+        interval = max(self.lease_seconds / 3, 1)
+        next_cleanup = time.monotonic() + self.cleanup_interval
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self._renew_leases()
+                await self._recover_orphans()
+                if time.monotonic() >= next_cleanup:
+                    next_cleanup = time.monotonic() + self.cleanup_interval
+                    await self._cleanup()
+            except Exception as e:
+                logger.exception("Falha na manutenção da fila de exportação: %s", e)
+
+    async def submit(self, db, user_id: int, resume_id: int, template_name: str) -> ExportJob:
+        """Registra um novo job e o coloca na fila."""
+        if self._queue is None:
+            raise QueueFullError("Fila de exportação indisponível")
+        if self._queue.qsize() >= self.max_pending:
+            raise QueueFullError("Fila de exportação cheia, tente novamente mais tarde")
+
+        job = ExportJob(
+            id=uuid.uuid4().hex,
+            user_id=user_id,
+            resume_id=resume_id,
+            template_name=template_name,
+            status="pending",
+            attempts=0,
+            owner=self.instance_id,
+            lease_expires_at=self._lease_deadline(),
+        )
+        db.add(job)
+        await db.commit()
+        await db.refresh(job)
+
+        self._queue.put_nowait(job.id)
+        return job
+
+    def result_path(self, job_id: str) -> Path:
+        return self.results_dir / f"{job_id}.pdf"
+
+    async def _worker(self):
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._process(job_id)
+            except Exception as e:
+                logger.exception("Erro inesperado no job de exportação %s: %s", job_id, e)
+            finally:
+                self._queue.task_done()
+
+    async def _process(self, job_id: str):
+        async with AsyncSessionLocal() as db:
+            job = await db.get(ExportJob, job_id)
+            # Job assumido por outra instância (concessão expirou) não é processado duas vezes
+            if job is None or job.status not in ACTIVE_STATUSES or job.owner != self.instance_id:
+                return
+
+            job.status = "running"
+            job.attempts += 1
+            job.started_at = datetime.utcnow()
+            await db.commit()
+
+            started = time.perf_counter()
+            try:
+                resume = await db.get(Resume, job.resume_id)
+                if resume is None or resume.user_id != job.user_id:
+                    raise LookupError("Currículo não encontrado")
+
+                pdf_bytes = await render_resume_pdf(resume, job.template_name)
+
+                path = self.result_path(job.id)
+                await asyncio.to_thread(path.write_bytes, pdf_bytes)
+
+                job.status = "done"
+                job.result_path = str(path)
+                job.error = None
+            except Exception as e:
+                job.error = str(e)
+                retryable = not isinstance(e, (LookupError, FileNotFoundError))
+                if retryable and job.attempts < self.max_attempts:
+                    job.status = "pending"
+                    self._requeue(job.id, delay=2 ** job.attempts)
+                else:
+                    job.status = "failed"
+            finally:
+                job.render_ms = int((time.perf_counter() - started) * 1000)
+                if job.status in ("done", "failed"):
+                    job.finished_at = datetime.utcnow()
+                await db.commit()
+
+    def _requeue(self, job_id: str, delay: float):
+        queue = self._queue
+
+        def put():
+            # Ignora se a fila foi encerrada durante o backoff
+            if queue is self._queue:
+                queue.put_nowait(job_id)
+
+        asyncio.get_running_loop().call_later(delay, put)
+
+
+export_queue = ExportQueue(
+    workers=settings.EXPORT_WORKERS,
+    max_pending=settings.EXPORT_MAX_PENDING,
+    max_attempts=settings.EXPORT_MAX_ATTEMPTS,
+    results_dir=settings.EXPORT_RESULTS_DIR,
+    lease_seconds=settings.EXPORT_LEASE_SECONDS,
+    retention_hours=settings.EXPORT_RETENTION_HOURS,
+    cleanup_interval=settings.EXPORT_CLEANUP_INTERVAL_SECONDS,
+)
@@ -0,0 +1,71 @@
+"""
+Consulta do histórico de gerações da IA (GeneratedResume) de um currículo.
+
+As gerações só são acrescentadas, nunca editadas: (maior id, quantidade)
+identifica o estado do histórico, e cada geração é imutável.
+"""
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.generated_resume import GeneratedResume
+from app.models.resume import Resume
+
+
+async def user_owns_resume(db: AsyncSession, resume_id: int, user_id: int) -> bool:
+    found = await db.scalar(select(Resume.id).where(Resume.id == resume_id, Resume.user_id == user_id))
+    return found is not None
+
+
+async def generations_state(db: AsyncSession, resume_id: int):
+    """(maior id, quantidade, última criação) do histórico, lido só do índice."""
+    row = (
+        await db.execute(
+            select(
+                func.max(GeneratedResume.id),
+                func.count(GeneratedResume.id),
+                func.max(GeneratedResume.created_at),
+            ).where(GeneratedResume.resume_id == resume_id)
+        )
+    ).one()
+    return tuple(row)
+
+
+async def list_generations(db: AsyncSession, resume_id: int, limit: int, cursor: int | None = None):
+    """
+    Página do histórico (id e data), da geração mais nova para a mais antiga.
+    Paginação por keyset (id < cursor). Retorna (itens, próximo cursor ou None).
+    """
+    query = select(GeneratedResume.id, GeneratedResume.created_at).where(
+        GeneratedResume.resume_id == resume_id
+    )
+    if cursor is not None:
+        query = query.where(GeneratedResume.id < cursor)
+
+    rows = (
+        await db.execute(query.order_by(GeneratedResume.id.desc()).limit(limit + 1))
+    ).mappings().all()
+
+    items = [dict(row) for row in rows[:limit]]
+    next_cursor = items[-1]["id"] if len(rows) > limit else None
+    return items, next_cursor
+
+
+async def get_generation_meta(db: AsyncSession, resume_id: int, generation_id: int):
+    """id e data de criação de uma geração, sem carregar o JSON."""
+    return (
+        await db.execute(
+            select(GeneratedResume.id, GeneratedResume.created_at).where(
+                GeneratedResume.id == generation_id,
+                GeneratedResume.resume_id == resume_id,
+            )
+        )
+    ).first()
+
+
+async def get_generation(db: AsyncSession, resume_id: int, generation_id: int):
+    return await db.scalar(
+        select(GeneratedResume).where(
+            GeneratedResume.id == generation_id,
+            GeneratedResume.resume_id == resume_id,
+        )
+    )
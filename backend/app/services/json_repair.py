@@ -0,0 +1,194 @@
+import json
+
+from pydantic import TypeAdapter, ValidationError
+
+from app.schemas.generate_resume import GeneratedResume
+
+# Seções obrigatórias do JSON da IA (validadas contra o schema GeneratedResume)
+REQUIRED_SECTIONS = ("summary", "tailoredExperiences", "highlightedSkills")
+OPTIONAL_SECTIONS = ("suggestedAdditions",)
+
+_SECTION_ADAPTERS = {
+    name: TypeAdapter(GeneratedResume.model_fields[name].annotation)
+    for name in REQUIRED_SECTIONS + OPTIONAL_SECTIONS
+}
+
+_LITERALS = {"True": "true", "False": "false", "None": "null"}
+
+
+def extract_json_text(text: str) -> str:
+    """Descarta cercas de markdown e qualquer texto antes do primeiro "{"."""
+    text = text.replace("```json", "").replace("```", "")
+    start = text.find("{")
+    if start == -1:
+        raise ValueError("A resposta da IA não contém JSON válido")
+    return text[start:]
+
+
+def repair_json(text: str) -> tuple:
+    """
+    Corrige defeitos comuns em JSON gerado por LLM:
+    vírgulas sobrando, quebras de linha cruas dentro de strings, literais
+    Python (True/False/None), texto após o objeto raiz e saída truncada
+    (strings e colchetes não fechados).
+
+    Retorna (json reparado, se a saída foi cortada no meio de uma seção).
+    """
+    out = []
+    stack = []
+    in_string = False
+    escape = False
+    i = 0
+
+    while i < len(text):
+        ch = text[i]
+
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+            elif ch == "\n":
+                ch = "\\n"
+            elif ch == "\t":
+                ch = "\\t"
+            elif ch == "\r":
+                ch = ""
+            out.append(ch)
+            i += 1
+            continue
+
+        if ch == '"':
+            in_string = True
+        elif ch in "{[":
+            stack.append("}" if ch == "{" else "]")
+        elif ch in "}]":
+            _strip_trailing_comma(out)
+            if stack:
+                stack.pop()
+            out.append(ch)
+            if not stack:
+                break  # ignora texto após o objeto raiz
+            i += 1
+            continue
+        elif ch.isalpha():
+            word_end = i
+            while word_end < len(text) and text[word_end].isalpha():
+                word_end += 1
+            word = text[i:word_end]
+            out.append(_LITERALS.get(word, word))
+            i = word_end
+            continue
+
+        out.append(ch)
+        i += 1
+
+    # Saída truncada: fecha a string aberta e descarta chave/valor incompletos.
+    # Só conta como corte no meio de uma seção se havia string ou array/objeto aberto.
+    truncated = in_string or len(stack) > 1
+    if in_string:
+        if escape:
+            out.pop()
+        out.append('"')
+    repaired = "".join(out).rstrip()
+    repaired = _drop_dangling(repaired, stack)
+
+    return repaired + "".join(reversed(stack)), truncated
+
+
+def _strip_trailing_comma(out: list):
+    index = len(out) - 1
+    while index >= 0 and out[index].isspace():
+        index -= 1
+    if index >= 0 and out[index] == ",":
+        del out[index]
+
+
+def _drop_dangling(text: str, stack: list) -> str:
+    if not stack:
+        return text
+
+    text = text.rstrip().rstrip(",").rstrip()
+    if text.endswith(":"):
+        # Chave sem valor: remove a chave inteira
+        key_end = text.rstrip(":").rstrip()
+        key_start = key_end[:-1].rfind('"')
+        text = key_end[:key_start].rstrip().rstrip(",")
+    elif stack[-1] == "}" and text.endswith('"'):
+        # Pode ser uma chave sem ":"; se for, também é descartada
+        start = text[:-1].rfind('"')
+        before = text[:start].rstrip()
+        if before.endswith("{") or before.endswith(","):
+            text = before.rstrip(",")
+    return text
+
+
+def parse_partial_json(text: str) -> tuple:
+    """
+    Extrai, repara e carrega o JSON (completo ou parcial) da resposta da IA.
+
+    Retorna (objeto, truncado). Se a saída estava truncada, a última seção
+    presente é descartada, pois pode ter sido cortada no meio.
+    """
+    candidate = extract_json_text(text)
+    truncated = False
+    try:
+        result = json.loads(candidate)
+    except json.JSONDecodeError:
+        repaired, truncated = repair_json(candidate)
+        try:
+            result = json.loads(repaired)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Erro ao parsear JSON da IA: {e}. Resposta recebida: {text[:200]}")
+
+    if not isinstance(result, dict):
+        raise ValueError("A resposta da IA não é um objeto JSON")
+
+    if truncated and result:
+        result.pop(list(result)[-1])
+    return result, truncated
+
+
+def _coerce_experiences(value):
+    # LLMs às vezes devolvem ids numéricos; o schema exige strings
+    if not isinstance(value, list):
+        return value
+    return [
+        {key: str(item) if isinstance(item, (int, float)) else item for key, item in experience.items()}
+        if isinstance(experience, dict) else experience
+        for experience in value
+    ]
+
+
+def validate_sections(data: dict) -> tuple:
+    """
+    Valida cada seção contra o schema GeneratedResume.
+
+    Retorna (seções válidas, nomes das seções obrigatórias ausentes ou inválidas).
+    Seções opcionais inválidas são simplesmente descartadas.
+    """
+    valid = {}
+    invalid = []
+
+    for name, adapter in _SECTION_ADAPTERS.items():
+        value = data.get(name)
+        if name == "tailoredExperiences":
+            value = _coerce_experiences(value)
+
+        if value is None:
+            if name in REQUIRED_SECTIONS:
+                invalid.append(name)
+            continue
+
+        try:
+            validated = adapter.validate_python(value)
+        except ValidationError:
+            if name in REQUIRED_SECTIONS:
+                invalid.append(name)
+            continue
+
+        valid[name] = adapter.dump_python(validated, mode="json")
+
+    return valid, invalid
@@ -0,0 +1,129 @@
+import json
+
+_INVALID = object()
+
+
+class ResumeStreamParser:
+    """
+    Parser incremental do JSON gerado pela IA.
+
+    Recebe o texto em pedaços (`feed`) e devolve eventos assim que um valor
+    do objeto raiz termina, sem esperar o JSON completo:
+
+        ("field", key, value)        valor de primeiro nível concluído
+        ("item", key, index, value)  elemento de um array de primeiro nível concluído
+
+    Texto antes do primeiro "{" (ex.: ```json) é ignorado.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self.complete = False
+
+        self._pos = 0
+        self._stack = []
+        self._in_string = False
+        self._escape = False
+        self._string_is_key = False
+        self._string_start = None
+        self._in_scalar = False
+
+        self._expect_key = False
+        self._key = None
+        self._value_start = None
+        self._item_start = None
+        self._item_index = 0
+
+    def feed(self, chunk: str) -> list:
+        events = []
+        self.buffer += chunk
+
+        while self._pos < len(self.buffer) and not self.complete:
+            i = self._pos
+            ch = self.buffer[i]
+            self._pos += 1
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._string_is_key:
+                        self._key = self._loads(self._string_start, i + 1)
+                    else:
+                        self._finish_value(i + 1, events)
+                continue
+
+            if not self._stack:
+                if ch == "{":
+                    self._stack.append("{")
+                    self._expect_key = True
+                continue
+
+            if self._in_scalar and (ch in ",}]" or ch.isspace()):
+                self._in_scalar = False
+                self._finish_value(i, events)
+
+            if ch.isspace():
+                continue
+            elif ch == '"':
+                self._in_string = True
+                self._string_start = i
+                self._string_is_key = len(self._stack) == 1 and self._expect_key
+                if not self._string_is_key:
+                    self._mark_value_start(i)
+            elif ch in "{[":
+                self._mark_value_start(i)
+                self._stack.append(ch)
+            elif ch in "}]":
+                self._stack.pop()
+                if not self._stack:
+                    self.complete = True
+                else:
+                    self._finish_value(i + 1, events)
+            elif ch == ":":
+                if len(self._stack) == 1:
+                    self._expect_key = False
+            elif ch == ",":
+                if len(self._stack) == 1:
+                    self._expect_key = True
+            elif not self._in_scalar:
+                # Início de número, true, false ou null
+                self._in_scalar = True
+                self._mark_value_start(i)
+
+        return events
+
+    def _is_top_level_array(self) -> bool:
+        return len(self._stack) == 2 and self._stack[1] == "["
+
+    def _mark_value_start(self, index: int):
+        depth = len(self._stack)
+        if depth == 1 and self._value_start is None:
+            self._value_start = index
+            self._item_index = 0
+        elif self._is_top_level_array() and self._item_start is None:
+            self._item_start = index
+
+    def _finish_value(self, end: int, events: list):
+        depth = len(self._stack)
+        if depth == 1 and self._value_start is not None:
+            value = self._loads(self._value_start, end)
+            self._value_start = None
+            if value is not _INVALID:
+                events.append(("field", self._key, value))
+        elif self._is_top_level_array() and self._item_start is not None:
+            value = self._loads(self._item_start, end)
+            self._item_start = None
+            if value is not _INVALID:
+                events.append(("item", self._key, self._item_index, value))
+            self._item_index += 1
+
+    def _loads(self, start: int, end: int):
+        try:
+            return json.loads(self.buffer[start:end])
+        except json.JSONDecodeError:
+            # Trecho inválido: o JSON completo será validado ao final
+            return _INVALID
@@ -0,0 +1,77 @@
+import hashlib
+import json
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.llm_cache import LLMCacheEntry
+from app.services.prompt_builder import strip_empty
+
+
+def make_llm_cache_key(cv_data: dict, job_context: dict, model: str, prompt_version: str) -> str:
+    """
+    Chave do cache: usa a mesma normalização do prompt (strip_empty), então
+    entradas que geram o mesmo prompt caem na mesma chave.
+    """
+    payload = json.dumps(
+        {
+            "cv": strip_empty(cv_data),
+            "job": strip_empty(job_context),
+            "model": model,
+            "prompt_version": prompt_version,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+async def get_cached_result(db: AsyncSession, key: str) -> dict | None:
+    """Retorna a resposta em cache, ou None se ausente/expirada."""
+    entry = await db.get(LLMCacheEntry, key)
+    if entry is None:
+        return None
+
+    now = datetime.utcnow()
+    if entry.created_at < now - timedelta(seconds=settings.LLM_CACHE_TTL_SECONDS):
+        await db.delete(entry)
+        await db.commit()
+        return None
+
+    entry.hits += 1
+    entry.last_used_at = now
+    return entry.response
+
+
+async def store_cached_result(db: AsyncSession, key: str, result: dict, model: str, prompt_version: str):
+    """Grava (ou substitui) uma resposta e aplica o limite de tamanho do cache."""
+    now = datetime.utcnow()
+    entry = await db.get(LLMCacheEntry, key)
+    if entry is None:
+        entry = LLMCacheEntry(key=key, hits=0)
+        db.add(entry)
+
+    entry.model = model
+    entry.prompt_version = prompt_version
+    entry.response = result
+    entry.created_at = now
+    entry.last_used_at = now
+    await db.flush()
+
+    total = await db.scalar(select(func.count()).select_from(LLMCacheEntry))
+    overflow = total - settings.LLM_CACHE_MAX_ENTRIES
+    if overflow > 0:
+        # Remove as entradas usadas há mais tempo
+        stale_keys = list(await db.scalars(
+            select(LLMCacheEntry.key)
+            .order_by(LLMCacheEntry.last_used_at)
+            .limit(overflow)
+        ))
+        await db.execute(
+            delete(LLMCacheEntry)
+            .where(LLMCacheEntry.key.in_(stale_keys))
+            .execution_options(synchronize_session=False)
+        )
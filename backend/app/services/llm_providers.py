@@ -0,0 +1,267 @@
+import asyncio
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass
+
+import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
+
+from app.core.config import settings
+from app.services.prompt_builder import estimate_tokens
+
+
+class LLMError(ValueError):
+    """Erro genérico de um provedor de IA."""
+
+
+class RateLimitError(LLMError):
+    """O provedor recusou a chamada por limite de uso (429 / RESOURCE_EXHAUSTED)."""
+
+
+class TransientLLMError(LLMError):
+    """Falha temporária do provedor (5xx, deadline); pode ser repetida."""
+
+
+class ModelUnavailableError(LLMError):
+    """O modelo não existe ou a chave não tem acesso a ele."""
+
+
+@dataclass
+class LLMResponse:
+    text: str
+    model: str
+    input_tokens: int | None = None
+    output_tokens: int | None = None
+
+
+class LLMProvider:
+    """
+    Interface dos provedores de IA. `generate` e `stream` recebem o texto do
+    prompt e o nome do modelo; erros devem ser convertidos para as exceções
+    acima para que a camada de retry/fallback saiba como reagir.
+    """
+
+    name = "base"
+
+    async def generate(self, prompt: str, model: str) -> LLMResponse:
+        raise NotImplementedError
+
+    async def stream(self, prompt: str, model: str):
+        raise NotImplementedError
+        yield  # pragma: no cover
+
+    def generate_sync(self, prompt: str, model: str) -> LLMResponse:
+        raise NotImplementedError
+
+
+class GeminiProvider(LLMProvider):
+    name = "gemini"
+
+    def __init__(self, api_key: str):
+        genai.configure(api_key=api_key)
+
+    @staticmethod
+    def _translate(error: Exception) -> LLMError:
+        if isinstance(error, (google_exceptions.ResourceExhausted, google_exceptions.TooManyRequests)):
+            return RateLimitError(str(error))
+        if isinstance(error, (
+            google_exceptions.ServiceUnavailable,
+            google_exceptions.InternalServerError,
+            google_exceptions.DeadlineExceeded,
+        )):
+            return TransientLLMError(str(error))
+        if isinstance(error, (google_exceptions.NotFound, google_exceptions.PermissionDenied)):
+            return ModelUnavailableError(str(error))
+
+        message = str(error)
+        if "429" in message or "RESOURCE_EXHAUSTED" in message:
+            return RateLimitError(message)
+        return LLMError(f"Erro ao gerar currículo com IA: {message}")
+
+    @staticmethod
+    def _to_response(response, model: str) -> LLMResponse:
+        usage = getattr(response, "usage_metadata", None)
+        return LLMResponse(
+            text=response.text,
+            model=model,
+            input_tokens=getattr(usage, "prompt_token_count", None),
+            output_tokens=getattr(usage, "candidates_token_count", None),
+        )
+
+    async def generate(self, prompt: str, model: str) -> LLMResponse:
+        try:
+            response = await genai.GenerativeModel(model).generate_content_async(prompt)
+            return self._to_response(response, model)
+        except LLMError:
+            raise
+        except Exception as e:
+            raise self._translate(e)
+
+    async def stream(self, prompt: str, model: str):
+        try:
+            response = await genai.GenerativeModel(model).generate_content_async(prompt, stream=True)
+            async for chunk in response:
+                if chunk.text:
+                    yield chunk.text
+        except LLMError:
+            raise
+        except Exception as e:
+            raise self._translate(e)
+
+    def generate_sync(self, prompt: str, model: str) -> LLMResponse:
+        try:
+            response = genai.GenerativeModel(model).generate_content(prompt)
+            return self._to_response(response, model)
+        except LLMError:
+            raise
+        except Exception as e:
+            raise self._translate(e)
+
+
+def _section(prompt: str, start: str, end: str) -> dict:
+    try:
+        text = prompt.split(start, 1)[1].split(end, 1)[0]
+        return json.loads(text.strip())
+    except (IndexError, json.JSONDecodeError):
+        return {}
+
+
+class FakeProvider(LLMProvider):
+    """
+    Provedor local e determinístico para testes de carga e desenvolvimento
+    sem rede. Devolve um JSON válido derivado do próprio prompt após
+    `latency_ms` milissegundos.
+    """
+
+    name = "fake"
+
+    def __init__(self, latency_ms: float = 0, stream_chunks: int = 8):
+        self.latency_ms = latency_ms
+        self.stream_chunks = stream_chunks
+
+    def _build(self, prompt: str, model: str) -> LLMResponse:
+        candidate = _section(prompt, "CANDIDATE DATA:", "TARGET JOB CONTEXT:")
+        job = _section(prompt, "TARGET JOB CONTEXT:", "Your task is")
+
+        result = {
+            "summary": (
+                f"{candidate.get('fullName', 'Profissional')} com experiência alinhada "
+                f"à vaga de {job.get('title', 'interesse')}."
+            ),
+            "tailoredExperiences": [
+                {
+                    "id": str(experience.get("id", index + 1)),
+                    "company": experience.get("company", ""),
+                    "role": experience.get("role", ""),
+                    "period": experience.get("period", ""),
+                    "description": experience.get("description", ""),
+                }
+                for index, experience in enumerate(candidate.get("experience", []))
+            ],
+            "highlightedSkills": list(candidate.get("skills", []))[:10],
+            "suggestedAdditions": [],
+        }
+        text = json.dumps(result, ensure_ascii=False)
+        return LLMResponse(
+            text=text,
+            model=model,
+            input_tokens=estimate_tokens(prompt),
+            output_tokens=estimate_tokens(text),
+        )
+
+    async def generate(self, prompt: str, model: str) -> LLMResponse:
+        await asyncio.sleep(self.latency_ms / 1000)
+        return self._build(prompt, model)
+
+    async def stream(self, prompt: str, model: str):
+        text = self._build(prompt, model).text
+        size = max(1, -(-len(text) // self.stream_chunks))
+        for start in range(0, len(text), size):
+            await asyncio.sleep(self.latency_ms / 1000 / self.stream_chunks)
+            yield text[start:start + size]
+
+    def generate_sync(self, prompt: str, model: str) -> LLMResponse:
+        time.sleep(self.latency_ms / 1000)
+        return self._build(prompt, model)
+
+
+def recording_key(prompt: str, model: str) -> str:
+    return hashlib.sha256(f"{model}\n{prompt}".encode("utf-8")).hexdigest()
+
+
+class RecordedProvider(LLMProvider):
+    """
+    Reproduz respostas gravadas anteriormente (ex.: pelo benchmark_models.py)
+    a partir de um arquivo JSON indexado por modelo + prompt. Permite rodar
+    benchmarks e testes offline com saídas reais de modelos.
+
+    Cada gravação tem "text" e, opcionalmente, "chunks", "ttft_ms",
+    "latency_ms", "input_tokens" e "output_tokens". Com `replay_timing`,
+    os tempos gravados também são reproduzidos.
+    """
+
+    name = "recorded"
+
+    def __init__(self, path: str, replay_timing: bool = False):
+        self.path = path
+        self.replay_timing = replay_timing
+        self.recordings = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.recordings = json.load(f).get("recordings", {})
+
+    def _lookup(self, prompt: str, model: str) -> dict:
+        recording = self.recordings.get(recording_key(prompt, model))
+        if recording is None:
+            raise ModelUnavailableError(f"Nenhuma resposta gravada para {model} com este prompt")
+        return recording
+
+    def _delay(self, recording: dict, key: str, default: float = 0) -> float:
+        if not self.replay_timing:
+            return 0
+        return (recording.get(key) or default) / 1000
+
+    @staticmethod
+    def _to_response(recording: dict, prompt: str, model: str) -> LLMResponse:
+        return LLMResponse(
+            text=recording["text"],
+            model=model,
+            input_tokens=recording.get("input_tokens") or estimate_tokens(prompt),
+            output_tokens=recording.get("output_tokens") or estimate_tokens(recording["text"]),
+        )
+
+    async def generate(self, prompt: str, model: str) -> LLMResponse:
+        recording = self._lookup(prompt, model)
+        await asyncio.sleep(self._delay(recording, "latency_ms"))
+        return self._to_response(recording, prompt, model)
+
+    async def stream(self, prompt: str, model: str):
+        recording = self._lookup(prompt, model)
+        chunks = recording.get("chunks") or [recording["text"]]
+
+        first_delay = self._delay(recording, "ttft_ms")
+        rest_delay = max(0, self._delay(recording, "latency_ms") - first_delay)
+
+        await asyncio.sleep(first_delay)
+        for index, chunk in enumerate(chunks):
+            if index:
+                await asyncio.sleep(rest_delay / (len(chunks) - 1))
+            yield chunk
+
+    def generate_sync(self, prompt: str, model: str) -> LLMResponse:
+        recording = self._lookup(prompt, model)
+        time.sleep(self._delay(recording, "latency_ms"))
+        return self._to_response(recording, prompt, model)
+
+
+def create_provider(name: str = settings.LLM_PROVIDER) -> LLMProvider:
+    """Instancia o provedor configurado em LLM_PROVIDER."""
+    if name == "gemini":
+        return GeminiProvider(api_key=settings.GEMINI_API_KEY)
+    if name == "fake":
+        return FakeProvider(latency_ms=settings.LLM_FAKE_LATENCY_MS)
+    if name == "recorded":
+        return RecordedProvider(settings.LLM_RECORDINGS_PATH)
+    raise ValueError(f"Provedor de IA desconhecido: {name}")
@@ -0,0 +1,278 @@
+import asyncio
+import random
+import threading
+import time
+
+from app.services.llm_providers import (
+    LLMError,
+    LLMProvider,
+    LLMResponse,
+    ModelUnavailableError,
+    RateLimitError,
+    TransientLLMError,
+)
+
+# Erros que justificam nova tentativa com backoff
+RETRYABLE_ERRORS = (RateLimitError, TransientLLMError)
+
+
+class CircuitOpenError(LLMError):
+    """O circuito está aberto: o provedor está saturado e a chamada falha na hora."""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class LLMCall:
+    """
+    Modelo com chamada em voo numa geração. Quem impõe o tempo limite
+    (llm_service) usa isso para registrar o estouro como falha do modelo;
+    cancelamentos de fora (cliente desconectou, lote cancelado) não contam.
+    """
+
+    def __init__(self):
+        self.model: str | None = None
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker clássico (fechado → aberto → meio-aberto).
+
+    Após `failure_threshold` falhas seguidas o circuito abre e as chamadas
+    falham imediatamente por `reset_timeout` segundos; depois disso uma
+    única chamada de teste decide se ele fecha ou volta a abrir. Uma chamada
+    de teste sem resultado após `reset_timeout` conta como falha e libera outra.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._trial_started_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open" and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = "half_open"
+                self._trial_in_flight = False
+            if self.state == "half_open" and self._trial_in_flight:
+                # Teste perdido (ex.: cancelado sem registrar resultado): não trava o modelo
+                if time.monotonic() - self._trial_started_at < self.reset_timeout:
+                    return False
+            if self.state == "half_open":
+                self._trial_in_flight = True
+                self._trial_started_at = time.monotonic()
+                return True
+            return False
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == "open"
+
+    def retry_after(self) -> float:
+        return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+    def record_success(self):
+        with self._lock:
+            self.state = "closed"
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def release_trial(self):
+        """Chamada de teste cancelada sem resultado: libera outra, sem contar falha."""
+        with self._lock:
+            if self.state == "half_open":
+                self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self.state == "half_open" or self._failures >= self.failure_threshold:
+                self.state = "open"
+                self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+
+class LLMClient:
+    """
+    Cliente resiliente sobre um LLMProvider.
+
+    Para cada modelo, na ordem de prioridade: repete chamadas que falharam por
+    limite de uso ou erro temporário com backoff exponencial e jitter, mantém um
+    circuit breaker por modelo e, esgotadas as tentativas, passa ao próximo.
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        models: list,
+        max_retries: int,
+        base_delay: float,
+        max_delay: float,
+        breaker_failures: int,
+        breaker_reset: float,
+    ):
+        self.provider = provider
+        self.models = models
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.breakers = {
+            model: CircuitBreaker(breaker_failures, breaker_reset) for model in models
+        }
+
+    @property
+    def primary_model(self) -> str:
+        return self.models[0]
+
+    def _backoff(self, attempt: int) -> float:
+        # "Full jitter": espalha as novas tentativas de clientes concorrentes
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def _circuit_open_error(self) -> CircuitOpenError:
+        retry_after = min(breaker.retry_after() for breaker in self.breakers.values())
+        return CircuitOpenError(
+            "Serviço de IA saturado, tente novamente em instantes",
+            retry_after=retry_after,
+        )
+
+    def _should_retry(self, model: str, attempt: int) -> bool:
+        return attempt < self.max_retries and not self.breakers[model].is_open
+
+    def record_timeout(self, call: LLMCall | None):
+        """O tempo limite estourou com `call` em voo: conta como falha daquele modelo."""
+        if call is not None and call.model is not None:
+            self.breakers[call.model].record_failure()
+            call.model = None
+
+    async def generate(self, prompt: str, call: LLMCall | None = None) -> LLMResponse:
+        """`call` registra o modelo em voo, para `record_timeout`."""
+        call = call or LLMCall()
+        last_error = None
+
+        for model in self.models:
+            breaker = self.breakers[model]
+            if not breaker.allow():
+                continue
+
+            for attempt in range(self.max_retries + 1):
+                call.model = model
+                try:
+                    response = await self.provider.generate(prompt, model)
+                    call.model = None
+                    breaker.record_success()
+                    return response
+                except asyncio.CancelledError:
+                    # Cancelado de fora: só libera o teste; se foi o tempo limite,
+                    # quem o impôs registra a falha (record_timeout)
+                    breaker.release_trial()
+                    raise
+                except RETRYABLE_ERRORS as e:
+                    call.model = None
+                    breaker.record_failure()
+                    last_error = e
+                    if not self._should_retry(model, attempt):
+                        break
+                    await asyncio.sleep(self._backoff(attempt))
+                except ModelUnavailableError as e:
+                    call.model = None
+                    breaker.record_success()
+                    last_error = e
+                    break
+                except LLMError:
+                    call.model = None
+                    breaker.record_success()
+                    raise
+
+        raise last_error or self._circuit_open_error()
+
+    async def stream(self, prompt: str, call: LLMCall | None = None):
+        """Como `generate`, mas só troca de modelo antes do primeiro pedaço."""
+        call = call or LLMCall()
+        last_error = None
+
+        for model in self.models:
+            breaker = self.breakers[model]
+            if not breaker.allow():
+                continue
+
+            for attempt in range(self.max_retries + 1):
+                started = False
+                call.model = model
+                try:
+                    async for chunk in self.provider.stream(prompt, model):
+                        started = True
+                        yield chunk
+                    call.model = None
+                    breaker.record_success()
+                    return
+                except asyncio.CancelledError:
+                    # Cancelado de fora: só libera o teste (ver `generate`)
+                    breaker.release_trial()
+                    raise
+                except GeneratorExit:
+                    # Consumidor parou de ler: se já chegou texto, o modelo respondeu
+                    call.model = None
+                    if started:
+                        breaker.record_success()
+                    else:
+                        breaker.release_trial()
+                    raise
+                except RETRYABLE_ERRORS as e:
+                    call.model = None
+                    breaker.record_failure()
+                    if started:
+                        raise
+                    last_error = e
+                    if not self._should_retry(model, attempt):
+                        break
+                    await asyncio.sleep(self._backoff(attempt))
+                except ModelUnavailableError as e:
+                    call.model = None
+                    breaker.record_success()
+                    if started:
+                        raise
+                    last_error = e
+                    break
+                except LLMError:
+                    call.model = None
+                    breaker.record_success()
+                    raise
+
+        raise last_error or self._circuit_open_error()
+
+    def generate_sync(self, prompt: str) -> LLMResponse:
+        last_error = None
+
+        for model in self.models:
+            breaker = self.breakers[model]
+            if not breaker.allow():
+                continue
+
+            for attempt in range(self.max_retries + 1):
+                try:
+                    response = self.provider.generate_sync(prompt, model)
+                    breaker.record_success()
+                    return response
+                except RETRYABLE_ERRORS as e:
+                    breaker.record_failure()
+                    last_error = e
+                    if not self._should_retry(model, attempt):
+                        break
+                    time.sleep(self._backoff(attempt))
+                except ModelUnavailableError as e:
+                    breaker.record_success()
+                    last_error = e
+                    break
+                except LLMError:
+                    breaker.record_success()
+                    raise
+
+        raise last_error or self._circuit_open_error()
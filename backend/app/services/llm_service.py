@@ -1,14 +1,88 @@
-import json
-import google.generativeai as genai
+import asyncio
 from app.core.config import settings
+from app.services.llm_providers import create_provider
+from app.services.llm_resilience import LLMCall, LLMClient
+from app.services.json_repair import parse_partial_json, validate_sections
+from app.services.prompt_builder import build_resume_prompt, build_sections_prompt, ResumePrompt
 
-# Configura o Gemini com a API key (API estável)
-genai.configure(api_key=settings.GEMINI_API_KEY)
+# Cliente com retry/backoff, circuit breaker e fallback entre modelos
+llm_client = LLMClient(
+    provider=create_provider(settings.LLM_PROVIDER),
+    models=settings.LLM_MODELS,
+    max_retries=settings.LLM_MAX_RETRIES,
+    base_delay=settings.LLM_RETRY_BASE_DELAY,
+    max_delay=settings.LLM_RETRY_MAX_DELAY,
+    breaker_failures=settings.LLM_BREAKER_FAILURES,
+    breaker_reset=settings.LLM_BREAKER_RESET_SECONDS,
+)
 
+MODEL_NAME = llm_client.primary_model
 
-def generate_resume_with_ai(cv_data: dict, job_context: dict) -> dict:
+# Incrementar sempre que o prompt mudar: invalida o cache de respostas
+PROMPT_VERSION = "2"
+
+# Limita quantas chamadas à IA ficam em voo ao mesmo tempo no processo
+_llm_semaphore = asyncio.Semaphore(settings.LLM_MAX_CONCURRENCY)
+
+
+class LLMTimeoutError(ValueError):
+    """A geração não terminou dentro do tempo limite."""
+
+
+class IncompleteResponseError(ValueError):
+    """O JSON da IA foi lido, mas algumas seções obrigatórias estão ausentes ou inválidas."""
+
+    def __init__(self, partial: dict, missing: list):
+        super().__init__(f"JSON da IA está faltando chaves obrigatórias: {missing}")
+        self.partial = partial
+        self.missing = missing
+
+
+def parse_ai_response(text: str) -> dict:
+    """
+    Extrai, repara e valida o JSON retornado pela IA contra o schema GeneratedResume.
+    Levanta IncompleteResponseError com as seções válidas quando só parte da saída é aproveitável.
+    """
+    data, _ = parse_partial_json(text)
+    valid, invalid = validate_sections(data)
+
+    if invalid:
+        raise IncompleteResponseError(valid, invalid)
+
+    return valid
+
+
+def _merge_sections(error: IncompleteResponseError, text: str) -> dict:
+    data, _ = parse_partial_json(text)
+    valid, _ = validate_sections(data)
+
+    still_missing = [section for section in error.missing if section not in valid]
+    if still_missing:
+        raise ValueError(f"JSON da IA está faltando chaves obrigatórias: {still_missing}")
+
+    result = dict(error.partial)
+    result.update({section: valid[section] for section in error.missing})
+    return result
+
+
+async def _complete_sections(
+    cv_data: dict, job_context: dict, error: IncompleteResponseError, call: LLMCall | None = None
+) -> dict:
+    """Pede novamente apenas as seções que faltaram, sem descartar o resto da geração."""
+    prompt = build_sections_prompt(cv_data, job_context, error.missing)
+    response = await llm_client.generate(prompt.text, call)
+    return _merge_sections(error, response.text)
+
+
+def _complete_sections_sync(cv_data: dict, job_context: dict, error: IncompleteResponseError) -> dict:
+    prompt = build_sections_prompt(cv_data, job_context, error.missing)
+    response = llm_client.generate_sync(prompt.text)
+    return _merge_sections(error, response.text)
+
+
+def generate_resume_with_ai(cv_data: dict, job_context: dict, prompt: ResumePrompt | None = None) -> dict:
     """
-    Gera um currículo otimizado usando Google Gemini AI.
+    Gera um currículo otimizado usando o provedor de IA configurado (Gemini por padrão).
     
     Args:
         cv_data: Dados do currículo do candidato
@@ -18,75 +92,126 @@ def generate_resume_with_ai(cv_data: dict, job_context: dict) -> dict:
         dict: Currículo otimizado com summary, tailoredExperiences, 
               highlightedSkills e suggestedAdditions
     """
-    
-    prompt = f"""
-    Act as a world-class HR Recruiter and Resume Writer.
+    if prompt is None:
+        prompt = build_resume_prompt(cv_data, job_context)
 
-    CANDIDATE DATA:
-    {json.dumps(cv_data, indent=2)}
+    try:
+        response = llm_client.generate_sync(prompt.text)
+        try:
+            return parse_ai_response(response.text)
+        except IncompleteResponseError as e:
+            return _complete_sections_sync(cv_data, job_context, e)
 
-    TARGET JOB CONTEXT:
-    {json.dumps(job_context, indent=2)}
+    except ValueError:
+        raise
 
-    Your task is to rewrite the resume to be ATS-optimized and perfectly tailored to the job.
-    
-    IMPORTANT: Return ONLY a valid JSON object with NO markdown formatting, NO code blocks, NO explanations.
-    
-    The JSON must have exactly these keys:
-    - "summary": string (compelling professional summary tailored to the job)
-    - "tailoredExperiences": array of objects with keys: id, company, role, period, description
-    - "highlightedSkills": array of strings (skills most relevant to the job)
-    - "suggestedAdditions": array of strings (optional improvements or missing elements)
-    
-    Example format:
-    {{
-      "summary": "...",
-      "tailoredExperiences": [
-        {{"id": "1", "company": "...", "role": "...", "period": "...", "description": "..."}}
-      ],
-      "highlightedSkills": ["skill1", "skill2"],
-      "suggestedAdditions": ["suggestion1", "suggestion2"]
-    }}
+    except Exception as e:
+        raise ValueError(f"Erro ao gerar currículo com IA: {str(e)}")
+
+
+async def generate_resume_with_ai_async(
+    cv_data: dict,
+    job_context: dict,
+    timeout: float = settings.LLM_TIMEOUT,
+    prompt: ResumePrompt | None = None,
+) -> dict:
+    """
+    Versão não bloqueante de `generate_resume_with_ai`.
+
+    Usa a API assíncrona do provedor, respeita o limite global de chamadas
+    simultâneas e aborta após `timeout` segundos (incluindo a espera pelo
+    semáforo e as novas tentativas). Cancelar a task cancela a chamada.
+    `prompt` permite reaproveitar um prompt já montado (ex.: em lote).
     """
+    if prompt is None:
+        prompt = build_resume_prompt(cv_data, job_context)
+
+    llm_call = LLMCall()
+
+    async def call():
+        async with _llm_semaphore:
+            response = await llm_client.generate(prompt.text, llm_call)
+            try:
+                return parse_ai_response(response.text)
+            except IncompleteResponseError as e:
+                return await _complete_sections(cv_data, job_context, e, llm_call)
 
     try:
-        # Usa a API estável do generativeai
-        model = genai.GenerativeModel('gemini-2.5-flash')
-        response = model.generate_content(prompt)
-        
-        text = response.text.strip()
-        
-        # Remove markdown code blocks se existirem
-        if text.startswith("```"):
-            lines = text.split("\n")
-            text = "\n".join(lines[1:-1])  # Remove primeira e última linha
-        
-        # Remove possíveis backticks restantes
-        text = text.replace("```json", "").replace("```", "").strip()
-        
-        # Extrai o JSON do texto
-        start = text.find("{")
-        end = text.rfind("}") + 1
-        
-        if start == -1 or end == 0:
-            raise ValueError("A resposta da IA não contém JSON válido")
-        
-        clean_json = text[start:end]
-        
-        # Parse do JSON
-        result = json.loads(clean_json)
-        
-        # Validação básica da estrutura
-        required_keys = ["summary", "tailoredExperiences", "highlightedSkills"]
-        missing_keys = [key for key in required_keys if key not in result]
-        
-        if missing_keys:
-            raise ValueError(f"JSON da IA está faltando chaves obrigatórias: {missing_keys}")
-        
-        return result
-        
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Erro ao parsear JSON da IA: {e}. Resposta recebida: {text[:200]}")
-    
+        return await asyncio.wait_for(call(), timeout=timeout)
+
+    except asyncio.TimeoutError:
+        # Só o estouro do tempo limite conta no circuit breaker; cancelamentos não
+        llm_client.record_timeout(llm_call)
+        raise LLMTimeoutError(f"A IA não respondeu em {timeout}s")
+
+    except ValueError:
+        raise
+
+    except Exception as e:
+        raise ValueError(f"Erro ao gerar currículo com IA: {str(e)}")
+
+
+async def stream_resume_with_ai(
+    cv_data: dict,
+    job_context: dict,
+    timeout: float = settings.LLM_TIMEOUT,
+    prompt: ResumePrompt | None = None,
+):
+    """
+    Gera o currículo em modo streaming, entregando o texto da IA em pedaços
+    conforme chega. Sujeito ao mesmo semáforo e tempo limite da versão assíncrona.
+    """
+    if prompt is None:
+        prompt = build_resume_prompt(cv_data, job_context)
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    llm_call = LLMCall()
+
+    try:
+        await asyncio.wait_for(_llm_semaphore.acquire(), timeout=timeout)
+        try:
+            chunks = llm_client.stream(prompt.text, llm_call).__aiter__()
+            while True:
+                try:
+                    chunk = await asyncio.wait_for(chunks.__anext__(), timeout=deadline - loop.time())
+                except StopAsyncIteration:
+                    break
+                yield chunk
+        finally:
+            _llm_semaphore.release()
+
+    except asyncio.TimeoutError:
+        llm_client.record_timeout(llm_call)
+        raise LLMTimeoutError(f"A IA não respondeu em {timeout}s")
+
+    except ValueError:
+        raise
+
     except Exception as e:
-        raise ValueError(f"Erro ao gerar currículo com IA: {str(e)}")
\ No newline at end of file
+        raise ValueError(f"Erro ao gerar currículo com IA: {str(e)}")
+
+
+async def finalize_streamed_response(
+    text: str,
+    cv_data: dict,
+    job_context: dict,
+    timeout: float = settings.LLM_TIMEOUT,
+) -> dict:
+    """Valida o texto completo de uma geração em streaming, completando seções inválidas se preciso."""
+    try:
+        return parse_ai_response(text)
+    except IncompleteResponseError as e:
+        error = e
+
+    llm_call = LLMCall()
+
+    async def call():
+        async with _llm_semaphore:
+            return await _complete_sections(cv_data, job_context, error, llm_call)
+
+    try:
+        return await asyncio.wait_for(call(), timeout=timeout)
+    except asyncio.TimeoutError:
+        llm_client.record_timeout(llm_call)
+        raise LLMTimeoutError(f"A IA não respondeu em {timeout}s")
@@ -0,0 +1,643 @@
+"""
+Renderização direta para PDF dos templates embutidos (modern, classic, creative).
+
+Os dados de `resume_to_template_data` são diagramados em Python puro, sem
+navegador: texto quebrado com as métricas das fontes padrão do PDF
+(Helvetica no lugar de Arial, Times no lugar de Georgia) e paginação com
+fluxo por coluna. Medidas seguem o CSS dos templates (1px = 0,75pt) com as
+mesmas margens A4 do Playwright. Templates personalizados e currículos com
+caracteres fora da WinAnsi (ex.: "Ł", cirílico, CJK), que as fontes padrão
+não cobrem, continuam indo para o Chromium.
+"""
+from dataclasses import dataclass, field
+from typing import Callable
+
+from app.core.config import settings
+from app.services.process_pool import ProcessPool
+from app.utils.pdf_fonts import char_width, is_winansi, text_width
+from app.utils.pdf_writer import A4, PDFDocument, PDFPage
+
+# Muda quando o layout muda (entra no ETag e na chave de cache dos PDFs)
+NATIVE_RENDERER_VERSION = "native-2"
+
+PX = 0.75  # 1px do CSS em pontos
+PAGE_MARGIN = 42.52  # 1,5cm, igual a PDF_OPTIONS
+
+SANS = ("Helvetica", "Helvetica-Bold", "Helvetica-Oblique")
+SERIF = ("Times-Roman", "Times-Bold", "Times-Italic")
+
+
+@dataclass(frozen=True)
+class TextStyle:
+    font: str
+    size: float  # em px do CSS
+    color: str
+    line_height: float = 1.3
+    letter_spacing: float = 0  # px
+    upper: bool = False
+
+    @property
+    def pt(self) -> float:
+        return self.size * PX
+
+    @property
+    def leading(self) -> float:
+        return self.pt * self.line_height
+
+    @property
+    def spacing(self) -> float:
+        return self.letter_spacing * PX
+
+    def measure(self, text: str) -> float:
+        return text_width(text, self.font, self.pt) + self.spacing * len(text)
+
+    def prepare(self, text) -> str:
+        text = str(text or "")
+        return text.upper() if self.upper else text
+
+
+@dataclass(frozen=True)
+class TemplateLayout:
+    """Tradução do CSS de um template embutido para o layout nativo."""
+    name: TextStyle
+    contact: TextStyle
+    contact_separator_color: str
+    heading: TextStyle
+    heading_rule: tuple  # (cor, espessura em px)
+    summary: TextStyle
+    tag: TextStyle
+    tag_background: str
+    tag_border: str | None
+    tag_padding: tuple  # (horizontal, vertical) em px
+    role: TextStyle
+    period: TextStyle
+    company: TextStyle
+    description: TextStyle
+    institution: TextStyle
+    details: TextStyle
+    titles: dict
+    body_padding: float = 20  # px (body no @media print)
+    centered_header: bool = False
+    header_rule: tuple | None = None  # (cor, espessura) abaixo do cabeçalho
+    header_band: str | None = None  # fundo do cabeçalho (creative)
+    education_separator: str = " | "
+    tags_stacked: bool = False
+    sidebar: dict = field(default_factory=dict)  # creative: largura, fundo, borda, estilo do título
+
+
+_MODERN = TemplateLayout(
+    name=TextStyle(SANS[1], 36, "#0f172a", 1.2, 1, upper=True),
+    contact=TextStyle(SANS[0], 14, "#64748b", 1.6),
+    contact_separator_color="#cbd5e1",
+    heading=TextStyle(SANS[1], 18, "#2563eb", 1.3, 1.5, upper=True),
+    heading_rule=("#2563eb", 2),
+    summary=TextStyle(SANS[0], 15, "#475569", 1.7),
+    tag=TextStyle(SANS[0], 13, "#475569"),
+    tag_background="#f1f5f9",
+    tag_border="#e2e8f0",
+    tag_padding=(14, 6),
+    role=TextStyle(SANS[1], 18, "#0f172a"),
+    period=TextStyle(SANS[2], 13, "#64748b"),
+    company=TextStyle(SANS[1], 15, "#2563eb"),
+    description=TextStyle(SANS[0], 14, "#475569", 1.7),
+    institution=TextStyle(SANS[1], 16, "#0f172a"),
+    details=TextStyle(SANS[0], 14, "#64748b", 1.6),
+    titles={
+        "summary": "Resumo Profissional",
+        "skills": "Habilidades",
+        "experience": "Experiência Profissional",
+        "education": "Formação Acadêmica",
+    },
+)
+
+_CLASSIC = TemplateLayout(
+    name=TextStyle(SERIF[1], 38, "#0f172a", 1.2, 3, upper=True),
+    contact=TextStyle(SANS[0], 14, "#64748b", 1.6),
+    contact_separator_color="#cbd5e1",
+    heading=TextStyle(SERIF[1], 16, "#1e293b", 1.3, 2, upper=True),
+    heading_rule=("#cbd5e1", 1),
+    summary=TextStyle(SERIF[2], 15, "#334155", 1.8),
+    tag=TextStyle(SANS[0], 13, "#334155"),
+    tag_background="#f8fafc",
+    tag_border="#e2e8f0",
+    tag_padding=(12, 5),
+    role=TextStyle(SERIF[1], 17, "#0f172a"),
+    period=TextStyle(SANS[2], 13, "#64748b"),
+    company=TextStyle(SERIF[2], 15, "#334155"),
+    description=TextStyle(SERIF[0], 14, "#475569", 1.7),
+    institution=TextStyle(SERIF[1], 16, "#0f172a"),
+    details=TextStyle(SANS[0], 14, "#64748b", 1.6),
+    titles={
+        "summary": "Resumo Profissional",
+        "skills": "Competências",
+        "experience": "Experiência Profissional",
+        "education": "Formação Acadêmica",
+    },
+    centered_header=True,
+    header_rule=("#1e293b", 3),
+)
+
+_CREATIVE = TemplateLayout(
+    name=TextStyle(SANS[1], 36, "#ffffff", 1.2, 2, upper=True),
+    contact=TextStyle(SANS[0], 14, "#cbd5e1", 1.6),
+    contact_separator_color="#475569",
+    heading=TextStyle(SANS[1], 16, "#2563eb", 1.3, 1.5, upper=True),
+    heading_rule=("#2563eb", 2),
+    summary=TextStyle(SANS[0], 15, "#475569", 1.7),
+    tag=TextStyle(SANS[0], 13, "#0c4a6e"),
+    tag_background="#e0f2fe",
+    tag_border=None,
+    tag_padding=(12, 8),
+    role=TextStyle(SANS[1], 18, "#0f172a"),
+    period=TextStyle(SANS[2], 13, "#64748b"),
+    company=TextStyle(SANS[1], 15, "#2563eb"),
+    description=TextStyle(SANS[0], 14, "#475569", 1.7),
+    institution=TextStyle(SANS[1], 15, "#0f172a"),
+    details=TextStyle(SANS[0], 13, "#64748b", 1.5),
+    titles={
+        "summary": "Sobre",
+        "skills": "Habilidades",
+        "experience": "Experiência Profissional",
+        "education": "Formação",
+    },
+    body_padding=0,
+    header_band="#0f172a",
+    education_separator="\n",
+    tags_stacked=True,
+    sidebar={
+        "width": 280,
+        "padding": (20, 15),
+        "background": "#f8fafc",
+        "border": "#e2e8f0",
+        "main_padding": (20, 30),
+        "heading": TextStyle(SANS[1], 16, "#1e293b", 1.3, 1.5, upper=True),
+        "heading_rule": ("#cbd5e1", 2),
+    },
+)
+
+LAYOUTS = {"modern": _MODERN, "classic": _CLASSIC, "creative": _CREATIVE}
+NATIVE_TEMPLATES = frozenset(LAYOUTS)
+
+
+# --- Blocos e quebra de texto ----------------------------------------------
+
+@dataclass
+class _Block:
+    """Unidade indivisível do fluxo: desenhada em (x, y) do topo do bloco."""
+    height: float
+    draw: Callable[[PDFPage, float, float], None]
+    space_before: float = 0
+    keep_with_next: bool = False
+
+
+def _split_word(word: str, style: TextStyle, width: float) -> list:
+    """
+    Corta uma palavra maior que a linha em pedaços que caibam (mínimo de um
+    caractere). Larguras acumuladas são calculadas uma vez e cada corte é uma
+    busca binária, então o custo é O(n log n) no tamanho da palavra.
+    """
+    prefix = [0]
+    for char in word:
+        prefix.append(prefix[-1] + char_width(char, style.font))
+
+    def measure(start: int, end: int) -> float:
+        # mesma conta de TextStyle.measure(word[start:end])
+        return (prefix[end] - prefix[start]) * style.pt / 1000 + style.spacing * (end - start)
+
+    pieces, start, end = [], 0, len(word)
+    while end - start > 1 and measure(start, end) > width:
+        low, high = start + 1, end - 1
+        while low < high:
+            middle = (low + high + 1) // 2
+            if measure(start, middle) <= width:
+                low = middle
+            else:
+                high = middle - 1
+        pieces.append(word[start:low])
+        start = low
+    pieces.append(word[start:])
+    return pieces
+
+
+def _wrap(text: str, style: TextStyle, width: float, keep_newlines: bool = False) -> list:
+    """Quebra gulosa por palavras; palavras maiores que a linha são cortadas."""
+    paragraphs = text.split("\n") if keep_newlines else [" ".join(text.split())]
+    space = style.measure(" ")
+    lines = []
+    for paragraph in paragraphs:
+        words = paragraph.split()
+        if not words:
+            lines.append("")
+            continue
+
+        current, current_width = "", 0.0
+        for word in words:
+            word_width = style.measure(word)
+            if current and current_width + space + word_width <= width:
+                current += " " + word
+                current_width += space + word_width
+                continue
+            if current:
+                lines.append(current)
+            if word_width > width and len(word) > 1:
+                pieces = _split_word(word, style, width)
+                lines += pieces[:-1]
+                word = pieces[-1]
+                word_width = style.measure(word)
+            current, current_width = word, word_width
+        lines.append(current)
+    return lines
+
+
+def _baseline(style: TextStyle) -> float:
+    # Linha centralizada na altura de linha, como no CSS; ~0,75 do corpo acima da base
+    return (style.leading - style.pt) / 2 + style.pt * 0.75
+
+
+def _draw_text(page: PDFPage, x: float, y: float, text: str, style: TextStyle):
+    if text:
+        page.text(x, y + _baseline(style), text, style.font, style.pt, style.color, style.spacing)
+
+
+def _text_blocks(text, style: TextStyle, width: float, space_before: float = 0,
+                 keep_newlines: bool = False, centered: bool = False, keep_first: bool = False) -> list:
+    lines = _wrap(style.prepare(text), style, width, keep_newlines)
+    blocks = []
+    for index, line in enumerate(lines):
+        offset = (width - style.measure(line)) / 2 if centered else 0
+
+        def draw(page, x, y, line=line, offset=offset):
+            _draw_text(page, x + offset, y, line, style)
+
+        blocks.append(_Block(
+            style.leading, draw,
+            space_before=space_before if index == 0 else 0,
+            keep_with_next=keep_first and index == 0 and len(lines) > 1,
+        ))
+    return blocks
+
+
+def _heading_block(title: str, style: TextStyle, rule: tuple, width: float, space_before: float) -> _Block:
+    rule_color, rule_px = rule
+    padding = 5 * PX
+    height = style.leading + padding + rule_px * PX
+
+    def draw(page, x, y):
+        _draw_text(page, x, y, style.prepare(title), style)
+        rule_y = y + style.leading + padding + rule_px * PX / 2
+        page.line(x, rule_y, x + width, rule_y, rule_color, rule_px * PX)
+
+    return _Block(height, draw, space_before=space_before, keep_with_next=True)
+
+
+def _contact_blocks(items: list, layout: TemplateLayout, width: float, space_before: float) -> list:
+    """Itens de contato separados por "•", quebrando linha quando não cabem."""
+    style = layout.contact
+    gap = 15 * PX
+    bullet = style.measure("•")
+    rows, row, row_width = [], [], 0.0
+    for item in items:
+        item_width = style.measure(item)
+        extra = item_width if not row else gap + bullet + gap + item_width
+        if row and row_width + extra > width:
+            rows.append((row, row_width))
+            row, row_width = [], 0.0
+            extra = item_width
+        row.append(item)
+        row_width += extra
+    if row:
+        rows.append((row, row_width))
+
+    blocks = []
+    for index, (row, row_width) in enumerate(rows):
+        offset = (width - row_width) / 2 if layout.centered_header else 0
+
+        def draw(page, x, y, row=row, offset=offset):
+            cursor = x + offset
+            for position, item in enumerate(row):
+                if position:
+                    cursor += gap
+                    _draw_text(page, cursor, y, "•", TextStyle(
+                        style.font, style.size, layout.contact_separator_color, style.line_height
+                    ))
+                    cursor += bullet + gap
+                _draw_text(page, cursor, y, item, style)
+                cursor += style.measure(item)
+
+        blocks.append(_Block(style.leading, draw, space_before=space_before if index == 0 else 0))
+    return blocks
+
+
+def _tag_blocks(skills: list, layout: TemplateLayout, width: float, space_before: float) -> list:
+    style = layout.tag
+    pad_x, pad_y = layout.tag_padding[0] * PX, layout.tag_padding[1] * PX
+    gap = (8 if layout.tags_stacked else 10) * PX
+    height = style.leading + 2 * pad_y
+
+    def tag_width(skill):
+        return min(style.measure(skill) + 2 * pad_x, width)
+
+    rows, row, row_width = [], [], 0.0
+    for skill in skills:
+        skill = style.prepare(skill)
+        if layout.tags_stacked:
+            rows.append([skill])
+            continue
+        item_width = tag_width(skill)
+        if row and row_width + gap + item_width > width:
+            rows.append(row)
+            row, row_width = [], 0.0
+        row_width += (gap if row else 0) + item_width
+        row.append(skill)
+    if row:
+        rows.append(row)
+
+    def draw_tag(page, x, y, skill, box_width, centered):
+        page.fill_rect(x, y, box_width, height, layout.tag_background)
+        if layout.tag_border:
+            page.line(x, y, x + box_width, y, layout.tag_border, 0.75)
+            page.line(x, y + height, x + box_width, y + height, layout.tag_border, 0.75)
+            page.line(x, y, x, y + height, layout.tag_border, 0.75)
+            page.line(x + box_width, y, x + box_width, y + height, layout.tag_border, 0.75)
+        text = _wrap(skill, style, box_width - 2 * pad_x)[0]
+        offset = (box_width - style.measure(text)) / 2 if centered else pad_x
+        _draw_text(page, x + offset, y + pad_y, text, style)
+
+    blocks = []
+    for index, row in enumerate(rows):
+        def draw(page, x, y, row=row):
+            if layout.tags_stacked:
+                draw_tag(page, x, y, row[0], width, True)
+                return
+            cursor = x
+            for skill in row:
+                box_width = tag_width(skill)
+                draw_tag(page, cursor, y, skill, box_width, False)
+                cursor += box_width + gap
+
+        blocks.append(_Block(height, draw, space_before=space_before if index == 0 else gap))
+    return blocks
+
+
+def _role_blocks(exp: dict, layout: TemplateLayout, width: float, space_before: float) -> list:
+    """Cargo à esquerda e período à direita na mesma linha (flex space-between)."""
+    role_style, period_style = layout.role, layout.period
+    period = period_style.prepare(exp.get("period"))
+    period_width = period_style.measure(period)
+    role_width = width - period_width - (10 * PX if period else 0)
+    lines = _wrap(role_style.prepare(exp.get("role")), role_style, max(role_width, width / 2)) or [""]
+
+    blocks = []
+    for index, line in enumerate(lines):
+        def draw(page, x, y, line=line, first=index == 0):
+            _draw_text(page, x, y, line, role_style)
+            if first and period:
+                # Alinha pela linha de base do cargo (align-items: baseline)
+                baseline_shift = _baseline(role_style) - _baseline(period_style)
+                _draw_text(page, x + width - period_width, y + baseline_shift, period, period_style)
+
+        blocks.append(_Block(
+            role_style.leading, draw,
+            space_before=space_before if index == 0 else 0,
+            keep_with_next=True,
+        ))
+    return blocks
+
+
+# --- Seções ----------------------------------------------------------------
+
+def _section_blocks(section: str, data: dict, layout: TemplateLayout, width: float,
+                    heading: TextStyle, heading_rule: tuple, first: bool) -> list:
+    section_gap = 0 if first else 30 * PX
+    blocks = [_heading_block(layout.titles[section], heading, heading_rule, width, section_gap)]
+    heading_gap = 15 * PX
+
+    if section == "summary":
+        blocks += _text_blocks(data["summary"], layout.summary, width, heading_gap)
+
+    elif section == "skills":
+        skills = [str(skill) for skill in data["skills"] if skill]
+        blocks += _tag_blocks(skills, layout, width, heading_gap)
+
+    elif section == "experience":
+        for index, exp in enumerate(data["experience"]):
+            exp = exp if isinstance(exp, dict) else {}
+            gap = heading_gap if index == 0 else 25 * PX
+            blocks += _role_blocks(exp, layout, width, gap)
+            if exp.get("company"):
+                blocks += _text_blocks(exp["company"], layout.company, width, 5 * PX, keep_first=True)
+                blocks[-1].keep_with_next = bool(exp.get("description"))
+            else:
+                blocks[-1].keep_with_next = bool(exp.get("description"))
+            if exp.get("description"):
+                blocks += _text_blocks(exp["description"], layout.description, width, 8 * PX, keep_newlines=True)
+
+    elif section == "education":
+        for index, edu in enumerate(data["education"]):
+            edu = edu if isinstance(edu, dict) else {}
+            gap = heading_gap if index == 0 else 15 * PX
+            details = layout.education_separator.join(
+                str(part) for part in (edu.get("degree"), edu.get("year")) if part
+            )
+            blocks += _text_blocks(edu.get("institution"), layout.institution, width, gap, keep_first=True)
+            if details:
+                blocks[-1].keep_with_next = True
+                blocks += _text_blocks(details, layout.details, width, 2 * PX, keep_newlines=True)
+
+    return blocks
+
+
+def _present_sections(data: dict, sections: tuple) -> list:
+    return [section for section in sections if data.get(section)]
+
+
+# --- Paginação -------------------------------------------------------------
+
+class _Pages:
+    """Cria as páginas sob demanda, já com o fundo (faixas, barra lateral)."""
+
+    def __init__(self, document: PDFDocument, decorate: Callable[[PDFPage, int], None]):
+        self.document = document
+        self.decorate = decorate
+        self.pages = []
+
+    def get(self, index: int) -> PDFPage:
+        while len(self.pages) <= index:
+            page = self.document.add_page(*A4)
+            self.decorate(page, len(self.pages))
+            self.pages.append(page)
+        return self.pages[index]
+
+
+@dataclass
+class _Column:
+    x: float
+    width: float
+    first_top: float  # topo na primeira página (abaixo do cabeçalho)
+    top: float
+    bottom: float
+
+    def top_of(self, page_index: int) -> float:
+        return self.first_top if page_index == 0 else self.top
+
+
+def _flow(blocks: list, column: _Column, pages: _Pages):
+    """Distribui os blocos na coluna, abrindo páginas quando não cabem."""
+    page_index, y = 0, column.first_top
+    for index, block in enumerate(blocks):
+        at_top = y <= column.top_of(page_index)
+        gap = 0 if at_top else block.space_before
+        needed = gap + block.height
+
+        # Títulos e primeiras linhas não ficam sozinhos no fim da página
+        follower = index
+        while blocks[follower].keep_with_next and follower + 1 < len(blocks):
+            follower += 1
+            needed += blocks[follower].space_before + blocks[follower].height
+
+        if not at_top and y + needed > column.bottom:
+            page_index += 1
+            y, gap = column.top_of(page_index), 0
+
+        block.draw(pages.get(page_index), column.x, y + gap)
+        y += gap + block.height
+    pages.get(page_index)
+
+
+def _header_blocks(data: dict, layout: TemplateLayout, width: float) -> list:
+    blocks = _text_blocks(data.get("fullName"), layout.name, width, centered=layout.centered_header)
+    contact = [str(data[key]) for key in ("email", "phone", "location") if data.get(key)]
+    if data.get("linkedin"):
+        contact.append("LinkedIn")
+    if contact:
+        gap = (12 if layout.centered_header else 8) * PX
+        blocks += _contact_blocks(contact, layout, width, gap)
+    return blocks
+
+
+def supports_data(data) -> bool:
+    """
+    True se todo texto de `data` pode ser escrito com as fontes padrão.
+    Confere também a versão em maiúsculas (títulos com `upper`): "µ".upper()
+    já sai da WinAnsi.
+    """
+    if isinstance(data, dict):
+        return all(supports_data(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return all(supports_data(value) for value in data)
+    if isinstance(data, str):
+        return is_winansi(data) and is_winansi(data.upper())
+    return True
+
+
+def render_native_pdf(template_name: str, data: dict) -> bytes:
+    """
+    Gera o PDF de um template embutido a partir de `resume_to_template_data`.
+    Função pura e sem estado: pode rodar em qualquer processo do pool.
+    """
+    layout = LAYOUTS[template_name]
+    document = PDFDocument(title=f"{data.get('fullName') or ''} - Currículo")
+    page_width, page_height = A4
+    left = PAGE_MARGIN + layout.body_padding * PX
+    width = page_width - 2 * left
+    top = PAGE_MARGIN + layout.body_padding * PX
+    bottom = page_height - PAGE_MARGIN - layout.body_padding * PX
+
+    if not layout.sidebar:
+        blocks = _header_blocks(data, layout, width)
+        if layout.header_rule:
+            rule_color, rule_px = layout.header_rule
+            padding = 20 * PX
+
+            def draw_rule(page, x, y):
+                page.line(x, y + padding, x + width, y + padding, rule_color, rule_px * PX)
+
+            blocks.append(_Block(padding + rule_px * PX, draw_rule))
+
+        for section in _present_sections(data, ("summary", "skills", "experience", "education")):
+            blocks += _section_blocks(section, data, layout, width, layout.heading, layout.heading_rule, first=False)
+
+        _flow(blocks, _Column(left, width, top, top, bottom), _Pages(document, lambda page, index: None))
+        return document.to_bytes()
+
+    # creative: faixa escura com o cabeçalho e duas colunas (lateral + principal)
+    sidebar = layout.sidebar
+    band_padding = 30 * PX
+    header = _header_blocks(data, layout, width - 2 * band_padding)
+    band_height = 2 * band_padding + sum(block.space_before + block.height for block in header)
+    content_top = PAGE_MARGIN + band_height
+    sidebar_width = sidebar["width"] * PX
+
+    def decorate(page: PDFPage, index: int):
+        area_top = content_top if index == 0 else PAGE_MARGIN
+        page.fill_rect(left, area_top, sidebar_width, bottom - area_top, sidebar["background"])
+        border_x = left + sidebar_width - 1.5 * PX
+        page.line(border_x, area_top, border_x, bottom, sidebar["border"], 3 * PX)
+        if index == 0:
+            page.fill_rect(left, PAGE_MARGIN, width, band_height, layout.header_band)
+            y = PAGE_MARGIN + band_padding
+            for block in header:
+                y += block.space_before
+                block.draw(page, left + band_padding, y)
+                y += block.height
+
+    pages = _Pages(document, decorate)
+
+    side_pad_y, side_pad_x = (value * PX for value in sidebar["padding"])
+    side_width = sidebar_width - 2 * side_pad_x
+    side_blocks = []
+    for position, section in enumerate(_present_sections(data, ("summary", "skills", "education"))):
+        side_blocks += _section_blocks(
+            section, data, layout, side_width, sidebar["heading"], sidebar["heading_rule"], first=position == 0
+        )
+
+    main_pad_y, main_pad_x = (value * PX for value in sidebar["main_padding"])
+    main_x = left + sidebar_width + main_pad_x
+    main_width = width - sidebar_width - 2 * main_pad_x
+    main_blocks = []
+    if data.get("experience"):
+        main_blocks = _section_blocks(
+            "experience", data, layout, main_width, layout.heading, layout.heading_rule, first=True
+        )
+
+    _flow(side_blocks, _Column(
+        left + side_pad_x, side_width, content_top + side_pad_y, PAGE_MARGIN + side_pad_y, bottom - side_pad_y
+    ), pages)
+    _flow(main_blocks, _Column(
+        main_x, main_width, content_top + main_pad_y, PAGE_MARGIN + main_pad_y, bottom - main_pad_y
+    ), pages)
+    return document.to_bytes()
+
+
+# --- Pool de processos -----------------------------------------------------
+
+class NativePDFRenderer:
+    """
+    Executa `render_native_pdf` num pool de processos para usar todos os
+    núcleos; com `workers=0` renderiza no próprio processo (alguns ms).
+    """
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self._pool = ProcessPool("renderização PDF nativa", workers)
+        self.rendered = 0
+
+    async def start(self):
+        """Sobe os processos antecipadamente para a primeira exportação não pagar o custo."""
+        if self.workers > 0:
+            await self._pool.start(render_native_pdf, "modern", {"fullName": "warmup"})
+
+    async def close(self):
+        await self._pool.close()
+
+    async def render(self, template_name: str, data: dict) -> bytes:
+        self.rendered += 1
+        if self.workers <= 0:
+            return render_native_pdf(template_name, data)
+        return await self._pool.run(render_native_pdf, template_name, data)
+
+    def stats(self) -> dict:
+        return {"workers": self.workers, "rendered": self.rendered}
+
+
+native_pdf_renderer = NativePDFRenderer(workers=settings.PDF_NATIVE_WORKERS)
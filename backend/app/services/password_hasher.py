@@ -0,0 +1,62 @@
+from app.core.config import settings
+from app.core.security import get_password_hash, verify_and_update_password
+from app.services.process_pool import ProcessPool
+
+
+class HasherBusyError(Exception):
+    """Há hashes demais em andamento; a requisição deve ser recusada (503)."""
+
+
+class PasswordHasher:
+    """
+    Executa bcrypt (hash e verificação) em um pool de processos dedicado.
+
+    O bcrypt é CPU-bound e segura o GIL o suficiente para travar o
+    threadpool do FastAPI em picos de login; em processos separados ele
+    usa vários núcleos sem afetar as demais rotas. O número de operações em
+    andamento é limitado: acima de `max_pending` a chamada falha na hora
+    com HasherBusyError em vez de enfileirar indefinidamente.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._pool = ProcessPool("hash de senhas", workers)
+        self._pending = 0
+
+    async def start(self):
+        """Sobe os processos antecipadamente para o primeiro login não pagar o custo."""
+        await self._pool.start(get_password_hash, "warmup")
+
+    async def close(self):
+        await self._pool.close()
+
+    async def _run(self, func, *args):
+        if self._pending >= self.max_pending:
+            raise HasherBusyError("Muitas autenticações em andamento, tente novamente em instantes")
+
+        self._pending += 1
+        try:
+            return await self._pool.run(func, *args)
+        finally:
+            self._pending -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> tuple:
+        """Retorna (senha confere, novo hash ou None), como `verify_and_update_password`."""
+        return await self._run(verify_and_update_password, password, hashed_password)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "pending": self._pending,
+            "max_pending": self.max_pending,
+        }
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
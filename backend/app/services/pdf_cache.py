@@ -0,0 +1,110 @@
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+from app.core.config import settings
+
+
+def make_cache_key(resume_data: dict, template_name: str, template_hash: str, options: dict) -> str:
+    """
+    Gera uma chave estável a partir do conteúdo do currículo, do template e
+    das opções de página. Qualquer edição no currículo ou no arquivo do
+    template produz uma chave diferente.
+    """
+    payload = json.dumps(
+        {
+            "data": resume_data,
+            "template": template_name,
+            "template_hash": template_hash,
+            "options": options,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class PDFDiskCache:
+    """
+    Cache de PDFs em disco endereçado por conteúdo, com limite de tamanho
+    e remoção LRU (o mtime do arquivo marca o último acesso).
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes: int | None = None
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.pdf"
+
+    def _entries(self):
+        if not self.directory.exists():
+            return []
+        return [entry for entry in self.directory.glob("*/*.pdf") if entry.is_file()]
+
+    def _ensure_size(self):
+        if self._total_bytes is None:
+            self._total_bytes = sum(entry.stat().st_size for entry in self._entries())
+
+    def get(self, key: str) -> bytes | None:
+        path = self._path(key)
+        try:
+            content = path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+        # Marca o acesso para a política LRU
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return content
+
+    def put(self, key: str, content: bytes):
+        if len(content) > self.max_bytes:
+            return
+
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Escrita atômica: outro worker nunca lê um PDF pela metade
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(content)
+
+        with self._lock:
+            self._ensure_size()
+            previous = path.stat().st_size if path.exists() else 0
+            os.replace(tmp_path, path)
+            self._total_bytes += len(content) - previous
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+        entries.sort(key=lambda item: item[0])
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                entry.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+        self._total_bytes = total
+
+
+pdf_cache = PDFDiskCache(settings.PDF_CACHE_DIR, settings.PDF_CACHE_MAX_BYTES)
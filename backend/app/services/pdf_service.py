@@ -0,0 +1,102 @@
+import asyncio
+
+from app.core.config import settings
+from app.services.browser_pool import browser_pool
+from app.services.custom_template_service import render_custom_template
+from app.services.native_pdf import (
+    native_pdf_renderer,
+    supports_data,
+    NATIVE_RENDERER_VERSION,
+    NATIVE_TEMPLATES,
+)
+from app.services.pdf_cache import pdf_cache, make_cache_key
+from app.services.template_service import (
+    get_template_hash,
+    render_template,
+    resume_model_to_template_data
+)
+
+# Configurações de página usadas em todas as exportações PDF
+PDF_OPTIONS = {
+    "format": "A4",
+    "margin": {
+        "top": "1.5cm",
+        "right": "1.5cm",
+        "bottom": "1.5cm",
+        "left": "1.5cm"
+    },
+    "print_background": True,
+}
+
+
+# Templates embutidos renderizados sem navegador (PDF_NATIVE_TEMPLATES)
+NATIVE_ENABLED_TEMPLATES = frozenset(
+    name.strip() for name in settings.PDF_NATIVE_TEMPLATES.split(",") if name.strip()
+) & NATIVE_TEMPLATES
+
+
+def pdf_renderer_for(template_name: str, custom_template=None, template_data: dict | None = None) -> str:
+    """
+    Qual renderizador gera o PDF ("native-N" ou "chromium"); entra em ETags.
+    Sem `template_data` responde pelo template; com os dados, também manda
+    para o Chromium textos que as fontes padrão do PDF não cobrem. Como essa
+    escolha só depende do conteúdo (já no hash do currículo), o ETag segue estável.
+    """
+    if custom_template is not None or template_name not in NATIVE_ENABLED_TEMPLATES:
+        return "chromium"
+    if template_data is not None and not supports_data(template_data):
+        return "chromium"
+    return NATIVE_RENDERER_VERSION
+
+
+async def html_to_pdf(html_content: str, untrusted: bool = False) -> bytes:
+    """
+    Converte HTML em PDF usando uma página emprestada do pool de navegadores.
+    `untrusted` (templates personalizados) isola a página: sem JavaScript e sem rede.
+    """
+    async with browser_pool.page(untrusted=untrusted) as page:
+        await page.set_content(html_content, wait_until="load" if untrusted else "networkidle")
+        return await page.pdf(**PDF_OPTIONS)
+
+
+async def render_resume_pdf(resume, template_name: str, custom_template=None) -> bytes:
+    """
+    Gera o PDF de um modelo Resume com o template indicado (ou com o template
+    personalizado `custom_template`, se informado).
+    Templates embutidos são diagramados direto em PDF (alguns ms, sem navegador),
+    salvo quando o texto sai da WinAnsi; os demais consultam primeiro o cache
+    em disco e só então usam o Playwright.
+    """
+    template_data = resume_model_to_template_data(resume)
+    if pdf_renderer_for(template_name, custom_template, template_data) != "chromium":
+        return await native_pdf_renderer.render(template_name, template_data)
+
+    if custom_template is not None:
+        template_name = f"custom:{custom_template.id}"
+        template_hash = custom_template.content_hash
+    else:
+        template_hash = get_template_hash(template_name)
+
+    cache_key = None
+    if settings.PDF_CACHE_ENABLED:
+        cache_key = make_cache_key(
+            resume.data,
+            template_name,
+            template_hash,
+            PDF_OPTIONS,
+        )
+        # Leitura, utime e eventual evicção tocam o disco: fora do event loop
+        cached = await asyncio.to_thread(pdf_cache.get, cache_key)
+        if cached is not None:
+            return cached
+
+    if custom_template is not None:
+        html_content = await render_custom_template(custom_template, template_data)
+    else:
+        html_content = render_template(template_name, template_data)
+    pdf_bytes = await html_to_pdf(html_content, untrusted=custom_template is not None)
+
+    if cache_key is not None:
+        await asyncio.to_thread(pdf_cache.put, cache_key, pdf_bytes)
+
+    return pdf_bytes
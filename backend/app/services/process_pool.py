@@ -0,0 +1,88 @@
+"""
+Pool de processos compartilhado pelos serviços CPU-bound (hash de senhas,
+PDF nativo, templates personalizados).
+
+O executor usa o contexto "spawn" (não herda threads nem o event loop do
+servidor), é criado sob demanda e recriado quando um worker morre. Com
+`timeout`, uma tarefa que estoura o prazo derruba os workers do pool: é a
+única forma de interromper código preso num processo.
+"""
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+logger = logging.getLogger(__name__)
+
+
+class ProcessPool:
+    """ProcessPoolExecutor "spawn" com aquecimento e uma nova tentativa se o pool quebrar."""
+
+    def __init__(self, name: str, workers: int, initializer=None, initargs: tuple = ()):
+        self.name = name
+        self.workers = workers
+        self.initializer = initializer
+        self.initargs = initargs
+        self._executor: ProcessPoolExecutor | None = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # "spawn" evita herdar threads e o event loop do processo do servidor
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=self.initializer,
+                initargs=self.initargs,
+            )
+        return self._executor
+
+    def _discard(self, executor: ProcessPoolExecutor):
+        # Só descarta se ninguém já o trocou: chamadas concorrentes que
+        # falharam com o mesmo pool não derrubam o pool novo
+        if self._executor is executor:
+            self._executor = None
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def start(self, func, *args):
+        """Sobe os processos antecipadamente, rodando `func(*args)` uma vez em cada."""
+        executor = self._get_executor()
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(
+            loop.run_in_executor(executor, func, *args)
+            for _ in range(self.workers)
+        ))
+
+    def _terminate(self, executor: ProcessPoolExecutor):
+        # Não há API pública para matar um worker ocupado; as tarefas dos
+        # demais workers recebem BrokenProcessPool e são repetidas em `run`
+        for process in list((executor._processes or {}).values()):
+            process.terminate()
+        self._discard(executor)
+
+    async def _submit(self, executor: ProcessPoolExecutor, func, args: tuple, timeout: float | None):
+        future = asyncio.get_running_loop().run_in_executor(executor, func, *args)
+        if timeout is None:
+            return await future
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Tarefa do pool '%s' passou de %ss; encerrando workers", self.name, timeout)
+            self._terminate(executor)
+            raise
+
+    async def run(self, func, *args, timeout: float | None = None):
+        """Executa `func(*args)` num worker; TimeoutError após `timeout` segundos."""
+        executor = self._get_executor()
+        try:
+            return await self._submit(executor, func, args, timeout)
+        except BrokenProcessPool:
+            # Um worker morreu (ex.: OOM): recria o pool e tenta uma vez mais
+            logger.warning("Pool de processos '%s' quebrado; recriando", self.name)
+            self._discard(executor)
+            return await self._submit(self._get_executor(), func, args, timeout)
+
+    async def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,191 @@
+import json
+import logging
+from dataclasses import dataclass
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Aproximação usada para modelos Gemini: ~4 caracteres por token
+CHARS_PER_TOKEN = 4
+
+# Campos de texto nunca são cortados abaixo deste tamanho
+MIN_FIELD_CHARS = 120
+TRUNCATION_MARK = "…"
+
+# Listas que podem perder itens finais quando cortar textos não basta
+DROPPABLE_LISTS = ("experience", "education", "skills")
+
+PROMPT_TEMPLATE = """Act as a world-class HR Recruiter and Resume Writer.
+
+CANDIDATE DATA:
+{candidate}
+
+TARGET JOB CONTEXT:
+{job}
+
+Your task is to rewrite the resume to be ATS-optimized and perfectly tailored to the job.
+
+IMPORTANT: Return ONLY a valid JSON object with NO markdown formatting, NO code blocks, NO explanations.
+
+The JSON must have exactly these keys:
+- "summary": string (compelling professional summary tailored to the job)
+- "tailoredExperiences": array of objects with keys: id, company, role, period, description
+- "highlightedSkills": array of strings (skills most relevant to the job)
+- "suggestedAdditions": array of strings (optional improvements or missing elements)
+
+Example format:
+{{"summary":"...","tailoredExperiences":[{{"id":"1","company":"...","role":"...","period":"...","description":"..."}}],"highlightedSkills":["skill1","skill2"],"suggestedAdditions":["suggestion1"]}}
+"""
+
+# Especificação de cada seção, usada ao pedir novamente apenas as seções inválidas
+SECTION_SPECS = {
+    "summary": '- "summary": string (compelling professional summary tailored to the job)',
+    "tailoredExperiences": '- "tailoredExperiences": array of objects with keys: id, company, role, period, description (all strings)',
+    "highlightedSkills": '- "highlightedSkills": array of strings (skills most relevant to the job)',
+    "suggestedAdditions": '- "suggestedAdditions": array of strings (optional improvements or missing elements)',
+}
+
+SECTIONS_PROMPT_TEMPLATE = """Act as a world-class HR Recruiter and Resume Writer.
+
+CANDIDATE DATA:
+{candidate}
+
+TARGET JOB CONTEXT:
+{job}
+
+Rewrite ONLY the following parts of an ATS-optimized resume tailored to the job.
+
+IMPORTANT: Return ONLY a valid JSON object with NO markdown formatting, NO code blocks, NO explanations.
+
+The JSON must have exactly these keys:
+{specs}
+"""
+
+_TEMPLATE_TOKENS = None
+
+
+@dataclass
+class ResumePrompt:
+    text: str
+    estimated_tokens: int
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimativa barata do número de tokens de entrada."""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def compact_json(value) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def strip_empty(value):
+    """Remove campos vazios e espaços supérfluos (retorna uma cópia)."""
+    if isinstance(value, dict):
+        stripped = {key: strip_empty(item) for key, item in value.items()}
+        return {key: item for key, item in stripped.items() if item not in (None, "", [], {})}
+    if isinstance(value, list):
+        stripped = [strip_empty(item) for item in value]
+        return [item for item in stripped if item not in (None, "", [], {})]
+    if isinstance(value, str):
+        return " ".join(value.split())
+    return value
+
+
+def _long_text_fields(value, found: list):
+    if isinstance(value, dict):
+        items = value.items()
+    elif isinstance(value, list):
+        items = enumerate(value)
+    else:
+        return found
+
+    for key, item in items:
+        if isinstance(item, str) and len(item) > MIN_FIELD_CHARS:
+            found.append((value, key))
+        else:
+            _long_text_fields(item, found)
+    return found
+
+
+def _truncate(text: str, max_chars: int) -> str:
+    """Corta `text` em até `max_chars` caracteres (contando a marca de corte)."""
+    if len(text) <= max_chars:
+        return text
+    head = text[:max_chars - len(TRUNCATION_MARK)]
+    # Sem espaço para quebrar (URLs longas, CJK): corta no meio da palavra
+    cut = head.rsplit(" ", 1)[0] if " " in head else head
+    return cut.rstrip(" ,.;:") + TRUNCATION_MARK
+
+
+def fit_to_budget(data: dict, budget_tokens: int) -> str:
+    """
+    Serializa `data` de forma compacta dentro de `budget_tokens`.
+
+    Corta primeiro o texto mais longo (descrições, resumo) e, se ainda não
+    couber, remove os últimos itens das listas maiores. Cada passo encurta um
+    campo ou uma lista; quando nada mais pode encolher, devolve o que couber.
+    """
+    data = strip_empty(data)
+    text = compact_json(data)
+
+    while estimate_tokens(text) > budget_tokens:
+        excess_chars = (estimate_tokens(text) - budget_tokens) * CHARS_PER_TOKEN
+        fields = _long_text_fields(data, [])
+
+        if fields:
+            container, key = max(fields, key=lambda field: len(field[0][field[1]]))
+            value = container[key]
+            container[key] = _truncate(value, max(MIN_FIELD_CHARS, len(value) - excess_chars))
+        else:
+            lists = [
+                data[name] for name in DROPPABLE_LISTS
+                if isinstance(data.get(name), list) and len(data[name]) > 1
+            ]
+            if not lists:
+                break
+            max(lists, key=len).pop()
+
+        text = compact_json(data)
+
+    return text
+
+
+def serialize_candidate(cv_data: dict) -> str:
+    """Seção do candidato; independe da vaga e pode ser reaproveitada em lote."""
+    return fit_to_budget(cv_data, _candidate_budget())
+
+
+def serialize_job(job_context: dict) -> str:
+    return fit_to_budget(job_context, settings.LLM_JOB_TOKEN_BUDGET)
+
+
+def _candidate_budget() -> int:
+    global _TEMPLATE_TOKENS
+    if _TEMPLATE_TOKENS is None:
+        _TEMPLATE_TOKENS = estimate_tokens(PROMPT_TEMPLATE.format(candidate="", job=""))
+    return settings.LLM_PROMPT_TOKEN_BUDGET - settings.LLM_JOB_TOKEN_BUDGET - _TEMPLATE_TOKENS
+
+
+def build_resume_prompt(cv_data: dict, job_context: dict, candidate_json: str | None = None) -> ResumePrompt:
+    """Monta o prompt de otimização do currículo para a vaga dentro do orçamento de tokens."""
+    if candidate_json is None:
+        candidate_json = serialize_candidate(cv_data)
+
+    text = PROMPT_TEMPLATE.format(candidate=candidate_json, job=serialize_job(job_context))
+    prompt = ResumePrompt(text=text, estimated_tokens=estimate_tokens(text))
+
+    logger.info("Prompt de currículo: ~%d tokens estimados", prompt.estimated_tokens)
+    return prompt
+
+
+def build_sections_prompt(cv_data: dict, job_context: dict, sections: list) -> ResumePrompt:
+    """Prompt que pede apenas as seções indicadas (reparo de respostas parciais)."""
+    specs = "\n".join(SECTION_SPECS[section] for section in sections)
+    text = SECTIONS_PROMPT_TEMPLATE.format(
+        candidate=serialize_candidate(cv_data),
+        job=serialize_job(job_context),
+        specs=specs,
+    )
+    return ResumePrompt(text=text, estimated_tokens=estimate_tokens(text))
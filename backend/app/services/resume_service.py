@@ -1,51 +1,156 @@
-from sqlalchemy.orm import Session
+import hashlib
+import json
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.resume import Resume
+from app.services.revision_service import record_revision, get_revision, delete_revisions
+
+# Campos do CV que podem ser pedidos na listagem (?fields=...); "data" traz o JSON inteiro
+TEXT_FIELDS = ("fullName", "email", "phone", "location", "linkedin", "summary")
+LIST_FIELDS = ("skills", "experience", "education")
+SELECTABLE_FIELDS = TEXT_FIELDS + LIST_FIELDS + ("data",)
+
+# Gravações simultâneas disputam o próximo número de revisão; a perdedora refaz a escrita
+UPDATE_ATTEMPTS = 5
+
+
+def content_hash(cv_data: dict) -> str:
+    """SHA-256 do JSON canônico do currículo; gravado junto da linha a cada escrita."""
+    payload = json.dumps(cv_data, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _count(field: str):
+    return func.coalesce(func.json_array_length(Resume.data[field]), 0)
 
-def create_resume(db: Session, user_id: int, cv_data: dict):
-    resume = Resume(user_id=user_id, data=cv_data)
+
+def _summary_columns(fields: list) -> list:
+    """Colunas da listagem: extraídas do JSON pelo próprio banco, sem carregar o blob."""
+    columns = [
+        Resume.id,
+        Resume.data["fullName"].as_string().label("fullName"),
+        Resume.created_at,
+        Resume.updated_at,
+        _count("experience").label("experience_count"),
+        _count("education").label("education_count"),
+        _count("skills").label("skills_count"),
+    ]
+    for field in fields:
+        if field == "data":
+            columns.append(Resume.data)
+        elif field in TEXT_FIELDS and field != "fullName":
+            columns.append(Resume.data[field].as_string().label(field))
+        elif field in LIST_FIELDS:
+            columns.append(Resume.data[field].as_json().label(field))
+    return columns
+
+async def create_resume(db: AsyncSession, user_id: int, cv_data: dict):
+    resume = Resume(user_id=user_id, data=cv_data, content_hash=content_hash(cv_data))
     db.add(resume)
-    db.commit()
-    db.refresh(resume)
+    await db.flush()
+    await record_revision(db, resume.id, None, cv_data)
+    await db.commit()
+    await db.refresh(resume)
     return resume
 
-def get_user_resumes(db: Session, user_id: int):
-    return db.query(Resume).filter(Resume.user_id == user_id).all()
+async def get_user_resumes(db: AsyncSession, user_id: int):
+    result = await db.scalars(select(Resume).where(Resume.user_id == user_id))
+    return result.all()
+
+async def list_resume_summaries(
+    db: AsyncSession,
+    user_id: int,
+    limit: int,
+    cursor: int | None = None,
+    fields: list = (),
+):
+    """
+    Página de resumos dos currículos do usuário, do mais novo para o mais antigo.
+
+    Paginação por keyset (id < cursor): o custo de cada página não cresce com
+    o número de currículos. Retorna (itens, cursor da próxima página ou None).
+    """
+    query = select(*_summary_columns(fields)).where(Resume.user_id == user_id)
+    if cursor is not None:
+        query = query.where(Resume.id < cursor)
+
+    rows = (await db.execute(query.order_by(Resume.id.desc()).limit(limit + 1))).mappings().all()
+
+    items = [dict(row) for row in rows[:limit]]
+    next_cursor = items[-1]["id"] if len(rows) > limit else None
+    return items, next_cursor
 
-def get_resume_by_id(db: Session, resume_id: int, user_id: int):
-    return (
-        db.query(Resume)
-        .filter(Resume.id == resume_id, Resume.user_id == user_id)
-        .first()
+async def get_resume_by_id(db: AsyncSession, resume_id: int, user_id: int):
+    return await db.scalar(
+        select(Resume)
+        .where(Resume.id == resume_id, Resume.user_id == user_id)
     )
 
+async def get_resume_content_hash(db: AsyncSession, resume_id: int, user_id: int):
+    """Hash do conteúdo do currículo (None se não existir), sem carregar o JSON."""
+    row = (
+        await db.execute(
+            select(Resume.id, Resume.content_hash)
+            .where(Resume.id == resume_id, Resume.user_id == user_id)
+        )
+    ).first()
+    if row is None:
+        return None
+    if row.content_hash is not None:
+        return row.content_hash
+
+    # Linha gravada sem o hash: calcula agora e guarda para as próximas
+    resume = await get_resume_by_id(db, resume_id, user_id)
+    resume.content_hash = content_hash(resume.data)
+    await db.commit()
+    return resume.content_hash
+
 # NOVA FUNÇÃO DELETE
-def delete_resume(db: Session, resume_id: int, user_id: int):
-    resume = (
-        db.query(Resume)
-        .filter(Resume.id == resume_id, Resume.user_id == user_id)
-        .first()
-    )
+async def delete_resume(db: AsyncSession, resume_id: int, user_id: int):
+    resume = await get_resume_by_id(db, resume_id, user_id)
     
     if not resume:
         return False
     
-    db.delete(resume)
-    db.commit()
+    await delete_revisions(db, resume.id)
+    await db.delete(resume)
+    await db.commit()
     return True
 
 # NOVA FUNÇÃO UPDATE
-def update_resume(db: Session, resume_id: int, user_id: int, cv_data: dict):
-    resume = (
-        db.query(Resume)
-        .filter(Resume.id == resume_id, Resume.user_id == user_id)
-        .first()
-    )
-    
+async def update_resume(db: AsyncSession, resume_id: int, user_id: int, cv_data: dict):
+    for attempt in range(UPDATE_ATTEMPTS):
+        resume = await get_resume_by_id(db, resume_id, user_id)
+
+        if not resume:
+            return None
+
+        await record_revision(db, resume.id, resume.data, cv_data)
+        resume.data = cv_data
+        resume.content_hash = content_hash(cv_data)
+        try:
+            await db.commit()
+        except IntegrityError:
+            # Outra gravação levou a mesma versão (uq resume_id, version):
+            # relê o currículo já atualizado e refaz o diff a partir dele
+            await db.rollback()
+            if attempt == UPDATE_ATTEMPTS - 1:
+                raise
+            continue
+
+        await db.refresh(resume)
+        return resume
+
+async def restore_resume_revision(db: AsyncSession, resume_id: int, user_id: int, version: int):
+    """Volta o currículo ao conteúdo de `version`, registrando isso como nova revisão."""
+    resume = await get_resume_by_id(db, resume_id, user_id)
     if not resume:
         return None
-    
-    resume.data = cv_data
-    db.commit()
-    db.refresh(resume)
-    return resume
 
+    revision = await get_revision(db, resume.id, version)
+    if revision is None:
+        raise ValueError("Revisão não encontrada")
+
+    return await update_resume(db, resume_id, user_id, revision["data"])
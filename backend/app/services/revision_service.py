@@ -0,0 +1,116 @@
+"""
+Histórico de versões dos currículos.
+
+Cada alteração grava apenas o diff (app.utils.json_diff) em relação à versão
+anterior; a cada RESUME_SNAPSHOT_INTERVAL versões grava-se o JSON completo.
+Reconstruir uma versão lê o snapshot mais próximo e no máximo
+RESUME_SNAPSHOT_INTERVAL - 1 deltas, independentemente do tamanho do histórico.
+"""
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.resume_revision import ResumeRevision
+from app.utils.json_diff import apply_delta, diff
+
+SNAPSHOT = "snapshot"
+DELTA = "delta"
+
+
+def _is_snapshot_version(version: int) -> bool:
+    interval = max(settings.RESUME_SNAPSHOT_INTERVAL, 1)
+    return (version - 1) % interval == 0
+
+
+async def _latest_version(db: AsyncSession, resume_id: int) -> int:
+    latest = await db.scalar(
+        select(func.max(ResumeRevision.version)).where(ResumeRevision.resume_id == resume_id)
+    )
+    return latest or 0
+
+
+async def record_revision(db: AsyncSession, resume_id: int, old_data: dict | None, new_data: dict):
+    """
+    Adiciona à sessão a revisão que leva `old_data` a `new_data` (sem commit).
+
+    Currículos anteriores ao histórico ganham antes uma v1 com o conteúdo antigo.
+    Retorna a revisão criada, ou None se nada mudou.
+    """
+    version = await _latest_version(db, resume_id)
+
+    if version == 0 and old_data is not None:
+        db.add(ResumeRevision(resume_id=resume_id, version=1, kind=SNAPSHOT, payload=old_data))
+        version = 1
+
+    if old_data is None:
+        delta = None
+    else:
+        delta = diff(old_data, new_data)
+        if not delta:
+            return None
+
+    version += 1
+    if delta is None or _is_snapshot_version(version):
+        revision = ResumeRevision(resume_id=resume_id, version=version, kind=SNAPSHOT, payload=new_data)
+    else:
+        revision = ResumeRevision(resume_id=resume_id, version=version, kind=DELTA, payload=delta)
+
+    db.add(revision)
+    return revision
+
+
+async def list_revisions(db: AsyncSession, resume_id: int, limit: int, cursor: int | None = None):
+    """Página de revisões (versão, tipo e data), da mais nova para a mais antiga."""
+    query = select(
+        ResumeRevision.version, ResumeRevision.kind, ResumeRevision.created_at
+    ).where(ResumeRevision.resume_id == resume_id)
+    if cursor is not None:
+        query = query.where(ResumeRevision.version < cursor)
+
+    rows = (
+        await db.execute(query.order_by(ResumeRevision.version.desc()).limit(limit + 1))
+    ).mappings().all()
+
+    items = [dict(row) for row in rows[:limit]]
+    next_cursor = items[-1]["version"] if len(rows) > limit else None
+    return items, next_cursor
+
+
+async def get_revision(db: AsyncSession, resume_id: int, version: int):
+    """
+    Reconstrói uma versão: snapshot mais recente <= version + deltas seguintes.
+    Retorna {"version", "created_at", "data"} ou None se a versão não existir.
+    """
+    base_version = await db.scalar(
+        select(func.max(ResumeRevision.version)).where(
+            ResumeRevision.resume_id == resume_id,
+            ResumeRevision.kind == SNAPSHOT,
+            ResumeRevision.version <= version,
+        )
+    )
+    if base_version is None:
+        return None
+
+    revisions = (
+        await db.scalars(
+            select(ResumeRevision)
+            .where(
+                ResumeRevision.resume_id == resume_id,
+                ResumeRevision.version.between(base_version, version),
+            )
+            .order_by(ResumeRevision.version)
+        )
+    ).all()
+    if not revisions or revisions[-1].version != version:
+        return None
+
+    data = revisions[0].payload
+    for revision in revisions[1:]:
+        data = revision.payload if revision.kind == SNAPSHOT else apply_delta(data, revision.payload)
+
+    return {"version": version, "created_at": revisions[-1].created_at, "data": data}
+
+
+async def delete_revisions(db: AsyncSession, resume_id: int):
+    """Remove o histórico do currículo (sem commit)."""
+    await db.execute(delete(ResumeRevision).where(ResumeRevision.resume_id == resume_id))
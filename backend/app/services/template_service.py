@@ -1,32 +1,181 @@
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template, select_autoescape
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 TEMPLATES_DIR = BASE_DIR / "templates" / "html"
 
-# Configura o Jinja2 Environment
-env = Environment(
-    loader=FileSystemLoader(TEMPLATES_DIR),
-    autoescape=select_autoescape(['html', 'xml'])
+
+@dataclass(frozen=True)
+class TemplateEntry:
+    """Template já compilado, com o hash e o mtime do arquivo de origem."""
+    name: str
+    path: Path
+    mtime_ns: int
+    size: int
+    hash: str
+    source: str
+    template: Template
+
+    def metadata(self) -> dict:
+        return {
+            "name": self.name,
+            "hash": self.hash,
+            "size": self.size,
+            "modified_at": datetime.fromtimestamp(self.mtime_ns / 1e9, tz=timezone.utc).isoformat(),
+        }
+
+
+class TemplateRegistry:
+    """
+    Registro em memória dos templates HTML.
+
+    Todos os templates são compilados em `load_all()` (na inicialização); o
+    bytecode fica num cache em disco compartilhado entre os workers, então só
+    o primeiro processo compila de fato. Um arquivo alterado é recompilado no
+    próximo acesso (comparando mtime) e arquivos novos ou removidos são
+    percebidos pelo mtime do diretório, sem reiniciar o servidor.
+    """
+
+    def __init__(self, directory: Path, bytecode_cache_dir: str | None = None, auto_reload: bool = True):
+        self.directory = Path(directory)
+        self.auto_reload = auto_reload
+
+        bytecode_cache = None
+        if bytecode_cache_dir:
+            Path(bytecode_cache_dir).mkdir(parents=True, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(bytecode_cache_dir)
+
+        self.env = Environment(
+            loader=FileSystemLoader(self.directory),
+            autoescape=select_autoescape(['html', 'xml']),
+            bytecode_cache=bytecode_cache,
+            auto_reload=auto_reload,
+        )
+        self._entries: dict = {}
+        self._dir_mtime_ns: int | None = None
+        self._lock = threading.Lock()
+        self.compilations = 0
+
+    def _path(self, name: str) -> Path:
+        return self.directory / f"{name}.html"
+
+    def _compile(self, name: str) -> TemplateEntry:
+        path = self._path(name)
+        stat = path.stat()
+        source_bytes = path.read_bytes()
+        entry = TemplateEntry(
+            name=name,
+            path=path,
+            mtime_ns=stat.st_mtime_ns,
+            size=len(source_bytes),
+            hash=hashlib.sha256(source_bytes).hexdigest(),
+            source=source_bytes.decode("utf-8"),
+            template=self.env.get_template(path.name),
+        )
+        self.compilations += 1
+        return entry
+
+    def _scan(self):
+        """Sincroniza o registro com o diretório (chamado com o lock adquirido)."""
+        try:
+            dir_mtime = self.directory.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._entries.clear()
+            self._dir_mtime_ns = None
+            return
+        if dir_mtime == self._dir_mtime_ns:
+            return
+
+        names = {path.stem for path in self.directory.glob("*.html")}
+        for name in list(self._entries):
+            if name not in names:
+                del self._entries[name]
+        for name in sorted(names - self._entries.keys()):
+            try:
+                self._entries[name] = self._compile(name)
+            except Exception:
+                logger.exception("Falha ao compilar o template %s", name)
+        self._dir_mtime_ns = dir_mtime
+
+    def load_all(self):
+        """Compila todos os templates do diretório (usado na inicialização)."""
+        with self._lock:
+            self._dir_mtime_ns = None
+            self._entries.clear()
+            self._scan()
+        logger.info("%d templates carregados", len(self._entries))
+
+    def get(self, name: str) -> TemplateEntry:
+        """Template pelo nome, recompilado se o arquivo mudou desde a última carga."""
+        with self._lock:
+            if self.auto_reload or self._dir_mtime_ns is None:
+                self._scan()
+
+            entry = self._entries.get(name)
+            if entry is None:
+                raise FileNotFoundError(f"Template '{name}' não encontrado")
+
+            if self.auto_reload:
+                try:
+                    mtime = entry.path.stat().st_mtime_ns
+                except FileNotFoundError:
+                    del self._entries[name]
+                    raise FileNotFoundError(f"Template '{name}' não encontrado")
+                if mtime != entry.mtime_ns:
+                    entry = self._compile(name)
+                    self._entries[name] = entry
+
+            return entry
+
+    def names(self) -> list:
+        with self._lock:
+            if self.auto_reload or self._dir_mtime_ns is None:
+                self._scan()
+            return sorted(self._entries)
+
+    def metadata(self) -> list:
+        return [self.get(name).metadata() for name in self.names()]
+
+    def stats(self) -> dict:
+        return {
+            "templates": len(self._entries),
+            "compilations": self.compilations,
+            "auto_reload": self.auto_reload,
+            "bytecode_cache": self.env.bytecode_cache is not None,
+        }
+
+
+template_registry = TemplateRegistry(
+    TEMPLATES_DIR,
+    bytecode_cache_dir=settings.TEMPLATE_BYTECODE_CACHE_DIR or None,
+    auto_reload=settings.TEMPLATE_AUTO_RELOAD,
 )
 
 
 def load_template(template_name: str) -> str:
-    """Carrega um template HTML pelo nome."""
-    template_file = f"{template_name}.html"
-    template_path = TEMPLATES_DIR / template_file
-    
-    if not template_path.exists():
-        raise FileNotFoundError(f"Template '{template_name}' não encontrado")
-    
-    with open(template_path, "r", encoding="utf-8") as file:
-        return file.read()
+    """Retorna o código-fonte de um template HTML pelo nome."""
+    return template_registry.get(template_name).source
+
+
+def get_template_hash(template_name: str) -> str:
+    """Retorna o SHA-256 do arquivo do template (usado em chaves de cache e ETags)."""
+    return template_registry.get(template_name).hash
 
 
 def render_template(template_name: str, data: dict) -> str:
     """Renderiza um template HTML com dados usando Jinja2."""
+    template = template_registry.get(template_name).template
     try:
-        template = env.get_template(f"{template_name}.html")
         return template.render(**data)
     except Exception as e:
         raise ValueError(f"Erro ao renderizar template: {str(e)}")
@@ -54,8 +203,9 @@ def resume_model_to_template_data(resume) -> dict:
 
 def get_available_templates() -> list:
     """Lista todos os templates HTML disponíveis."""
-    templates = []
-    if TEMPLATES_DIR.exists():
-        for file in TEMPLATES_DIR.glob("*.html"):
-            templates.append(file.stem)
-    return templates
+    return template_registry.names()
+
+
+def get_templates_metadata() -> list:
+    """Nome, hash, tamanho e data de modificação de cada template."""
+    return template_registry.metadata()
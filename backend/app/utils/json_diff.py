@@ -0,0 +1,95 @@
+"""
+Diff compacto entre documentos JSON (dicts, listas e escalares).
+
+Formato do delta: dict de operações por chave (em listas, o índice como string):
+
+    {"k": ["=", valor]}     substitui / inclui o valor
+    {"k": ["-"]}            remove a chave
+    {"k": ["~", delta]}     aplica um delta aninhado (dict ou lista)
+    {"$len": n}             (só em listas) novo tamanho da lista
+
+`apply_delta(old, diff(old, new)) == new` para quaisquer valores JSON.
+"""
+import copy
+
+LENGTH_KEY = "$len"
+
+
+def _same_kind(old, new) -> bool:
+    return (isinstance(old, dict) and isinstance(new, dict)) or (
+        isinstance(old, list) and isinstance(new, list)
+    )
+
+
+def _diff_value(old, new):
+    """Operação para transformar `old` em `new` (None se forem iguais)."""
+    if _same_kind(old, new):
+        nested = diff(old, new)
+        if not nested:
+            return None
+        # Delta aninhado só compensa se for menor que o valor inteiro
+        if len(repr(nested)) < len(repr(new)):
+            return ["~", nested]
+        return ["=", new]
+    if old == new and type(old) is type(new):
+        return None
+    return ["=", new]
+
+
+def diff(old, new) -> dict:
+    """Delta que transforma `old` em `new` (dois dicts ou duas listas)."""
+    delta = {}
+
+    if isinstance(old, dict):
+        for key, value in new.items():
+            if key not in old:
+                delta[key] = ["=", value]
+            else:
+                operation = _diff_value(old[key], value)
+                if operation is not None:
+                    delta[key] = operation
+        for key in old:
+            if key not in new:
+                delta[key] = ["-"]
+        return delta
+
+    for index, value in enumerate(new):
+        if index >= len(old):
+            delta[str(index)] = ["=", value]
+        else:
+            operation = _diff_value(old[index], value)
+            if operation is not None:
+                delta[str(index)] = operation
+    if len(old) != len(new):
+        delta[LENGTH_KEY] = len(new)
+    return delta
+
+
+def apply_delta(value, delta: dict):
+    """Aplica `delta` sobre uma cópia de `value` e retorna o resultado."""
+    result = copy.deepcopy(value)
+    _apply_in_place(result, delta)
+    return result
+
+
+def _apply_in_place(target, delta: dict):
+    if isinstance(target, list):
+        length = delta.get(LENGTH_KEY, len(target))
+        if length < len(target):
+            del target[length:]
+        else:
+            target.extend([None] * (length - len(target)))
+
+    for key, operation in delta.items():
+        if key == LENGTH_KEY:
+            continue
+        slot = int(key) if isinstance(target, list) else key
+
+        if operation[0] == "=":
+            target[slot] = copy.deepcopy(operation[1])
+        elif operation[0] == "-":
+            target.pop(slot, None)
+        elif operation[0] == "~":
+            _apply_in_place(target[slot], operation[1])
+        else:
+            raise ValueError(f"Operação de delta desconhecida: {operation[0]}")
@@ -0,0 +1,138 @@
+"""
+Métricas das fontes padrão do PDF (Standard 14: Helvetica e Times).
+
+Essas fontes existem em todo leitor de PDF e não precisam ser embutidas.
+As larguras vêm dos arquivos AFM da Adobe (unidades de 1/1000 do corpo) e o
+texto é codificado em WinAnsiEncoding (cp1252), que cobre o português.
+"""
+import unicodedata
+
+# Larguras dos caracteres 32..126 (WinAnsi: 39 = aspas simples retas, 96 = acento grave)
+_ASCII_WIDTHS = {
+    "Helvetica": """
+        278 278 355 556 556 889 667 191 333 333 389 584 278 333 278 278 556 556 556
+        556 556 556 556 556 556 556 278 278 584 584 584 556 1015 667 667 722 722 667
+        611 778 722 278 500 667 556 833 722 778 667 778 722 667 611 722 667 944 667
+        667 611 278 278 278 469 556 333 556 556 500 556 556 278 556 556 222 222 500
+        222 833 556 556 556 556 333 500 278 556 500 722 500 500 500 334 260 334 584
+    """,
+    "Helvetica-Bold": """
+        278 333 474 556 556 889 722 238 333 333 389 584 278 333 278 278 556 556 556
+        556 556 556 556 556 556 556 333 333 584 584 584 611 975 722 722 722 722 667
+        611 778 722 278 556 722 611 833 722 778 667 778 722 667 611 722 667 944 667
+        667 611 333 278 333 584 556 333 556 611 556 611 556 333 611 611 278 278 556
+        278 889 611 611 611 611 389 556 333 611 556 778 556 556 500 389 280 389 584
+    """,
+    "Times-Roman": """
+        250 333 408 500 500 833 778 180 333 333 500 564 250 333 250 278 500 500 500
+        500 500 500 500 500 500 500 278 278 564 564 564 444 921 722 667 667 722 611
+        556 722 722 333 389 722 611 889 722 722 556 722 667 556 611 722 722 944 722
+        722 611 333 278 333 469 500 333 444 500 444 500 444 333 500 500 278 278 500
+        278 778 500 500 500 500 333 389 278 500 500 722 500 500 444 480 200 480 541
+    """,
+    "Times-Bold": """
+        250 333 555 500 500 1000 833 278 333 333 500 570 250 333 250 278 500 500 500
+        500 500 500 500 500 500 500 333 333 570 570 570 500 930 722 667 722 722 667
+        611 778 778 389 500 778 667 944 722 778 611 778 722 556 667 722 722 1000 722
+        722 667 333 278 333 581 500 333 500 556 444 556 444 333 500 556 278 333 556
+        278 833 556 500 556 556 444 389 333 556 500 722 500 500 444 394 220 394 520
+    """,
+    "Times-Italic": """
+        250 333 420 500 500 833 778 214 333 333 500 675 250 333 250 278 500 500 500
+        500 500 500 500 500 500 500 333 333 675 675 675 500 920 611 611 667 722 611
+        611 722 722 333 444 667 556 833 667 722 611 722 611 500 556 722 611 833 611
+        556 556 389 278 389 422 500 333 500 500 444 500 444 278 500 500 278 278 444
+        278 722 500 500 500 500 389 389 278 500 444 667 444 444 389 400 275 400 541
+    """,
+}
+
+# Glifos fora do ASCII com largura própria: Helvetica, Helvetica-Bold,
+# Times-Roman, Times-Bold, Times-Italic
+_SPECIAL_WIDTHS = {
+    "\u2022": (350, 350, 350, 350, 350),     # bullet
+    "\u2013": (556, 556, 500, 500, 500),     # endash
+    "\u2014": (1000, 1000, 1000, 1000, 889), # emdash
+    "\u2018": (222, 278, 333, 333, 333),     # quoteleft
+    "\u2019": (222, 278, 333, 333, 333),     # quoteright
+    "\u201c": (333, 500, 444, 500, 556),     # quotedblleft
+    "\u201d": (333, 500, 444, 500, 556),     # quotedblright
+    "\u2026": (1000, 1000, 1000, 1000, 889), # ellipsis
+    "\u20ac": (556, 556, 500, 500, 500),     # Euro
+    "\u00b7": (278, 278, 250, 250, 250),     # periodcentered
+    "\u00b0": (400, 400, 400, 400, 400),     # degree
+    "\u00aa": (370, 370, 276, 300, 276),     # ordfeminine
+    "\u00ba": (365, 365, 310, 330, 310),     # ordmasculine
+    "\u00a9": (737, 737, 760, 747, 760),     # copyright
+    "\u00d7": (584, 584, 564, 570, 675),     # multiply
+    "\u00df": (611, 611, 500, 556, 500),     # germandbls
+}
+_SPECIAL_ORDER = ("Helvetica", "Helvetica-Bold", "Times-Roman", "Times-Bold", "Times-Italic")
+
+# Oblíqua tem as mesmas larguras da regular
+FONT_ALIASES = {"Helvetica-Oblique": "Helvetica"}
+
+STANDARD_FONTS = tuple(_ASCII_WIDTHS) + tuple(FONT_ALIASES)
+
+
+def _build_table(font: str) -> dict:
+    values = [int(value) for value in _ASCII_WIDTHS[font].split()]
+    table = {chr(32 + index): value for index, value in enumerate(values)}
+    column = _SPECIAL_ORDER.index(font)
+    table.update({char: widths[column] for char, widths in _SPECIAL_WIDTHS.items()})
+    table["\u00a0"] = table[" "]
+    return table
+
+
+_WIDTHS = {font: _build_table(font) for font in _ASCII_WIDTHS}
+
+
+def _base_char(char: str) -> str:
+    """Letra base de um caractere acentuado (á -> a); acentos não mudam a largura."""
+    decomposed = unicodedata.normalize("NFD", char)
+    return decomposed[0] if decomposed else char
+
+
+def char_width(char: str, font: str) -> int:
+    table = _WIDTHS[FONT_ALIASES.get(font, font)]
+    width = table.get(char)
+    if width is None:
+        width = table.get(_base_char(char), table["o"])
+    return width
+
+
+def text_width(text: str, font: str, size: float) -> float:
+    """Largura do texto em pontos."""
+    table = _WIDTHS[FONT_ALIASES.get(font, font)]
+    total = 0
+    for char in text:
+        width = table.get(char)
+        if width is None:
+            width = char_width(char, font)
+        total += width
+    return total * size / 1000
+
+
+def is_winansi(text: str) -> bool:
+    """True se o texto cabe na WinAnsi (cp1252) das fontes padrão, sem perdas."""
+    try:
+        text.encode("cp1252")
+    except UnicodeEncodeError:
+        return False
+    return True
+
+
+def to_winansi(text: str) -> bytes:
+    """
+    Codifica em WinAnsi; caracteres fora dela perdem o acento se possível
+    (ex.: ő -> o) e, em último caso, viram "?".
+    """
+    try:
+        return text.encode("cp1252")
+    except UnicodeEncodeError:
+        chars = []
+        for char in text:
+            try:
+                chars.append(char.encode("cp1252"))
+            except UnicodeEncodeError:
+                chars.append(_base_char(char).encode("cp1252", "replace"))
+        return b"".join(chars)
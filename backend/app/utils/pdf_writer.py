@@ -0,0 +1,161 @@
+"""
+Escritor mínimo de PDF (1.4): páginas com retângulos, linhas e texto nas
+fontes padrão (app.utils.pdf_fonts). Coordenadas em pontos, com origem no
+canto superior esquerdo da página, como no layout.
+"""
+import zlib
+
+from app.utils.pdf_fonts import STANDARD_FONTS, to_winansi
+
+# A4 em pontos
+A4 = (595.28, 841.89)
+
+_FONT_RESOURCES = {font: f"F{index + 1}" for index, font in enumerate(STANDARD_FONTS)}
+
+
+def _num(value: float) -> bytes:
+    text = f"{value:.2f}".rstrip("0").rstrip(".")
+    return (text if text not in ("", "-0") else "0").encode("ascii")
+
+
+def _color(color: str) -> bytes:
+    """'#rrggbb' -> 'r g b' (0..1)."""
+    color = color.lstrip("#")
+    return b" ".join(_num(int(color[i:i + 2], 16) / 255) for i in (0, 2, 4))
+
+
+def _pdf_string(raw: bytes) -> bytes:
+    return b"(" + raw.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)").replace(b"\r", b"\\r") + b")"
+
+
+def _text_string(text: str) -> bytes:
+    """String de metadados (Info): ASCII direto, demais em UTF-16BE."""
+    if text.isascii():
+        return _pdf_string(text.encode("ascii"))
+    return b"<FEFF" + text.encode("utf-16-be").hex().upper().encode("ascii") + b">"
+
+
+class PDFPage:
+    def __init__(self, width: float, height: float):
+        self.width = width
+        self.height = height
+        self._ops = []
+        self.fonts = set()
+
+    def fill_rect(self, x: float, y: float, width: float, height: float, color: str):
+        self._ops.append(
+            _color(color) + b" rg " + b" ".join(
+                (_num(x), _num(self.height - y - height), _num(width), _num(height))
+            ) + b" re f"
+        )
+
+    def line(self, x1: float, y1: float, x2: float, y2: float, color: str, width: float = 1):
+        self._ops.append(
+            _color(color) + b" RG " + _num(width) + b" w "
+            + _num(x1) + b" " + _num(self.height - y1) + b" m "
+            + _num(x2) + b" " + _num(self.height - y2) + b" l S"
+        )
+
+    def text(self, x: float, baseline: float, text: str, font: str, size: float, color: str,
+             char_spacing: float = 0):
+        self.fonts.add(font)
+        spacing = _num(char_spacing) + b" Tc " if char_spacing else b""
+        self._ops.append(
+            b"BT /" + _FONT_RESOURCES[font].encode("ascii") + b" " + _num(size) + b" Tf " + spacing
+            + _color(color) + b" rg " + _num(x) + b" " + _num(self.height - baseline) + b" Td "
+            + _pdf_string(to_winansi(text)) + b" Tj ET"
+        )
+
+    def content(self) -> bytes:
+        return b"\n".join(self._ops)
+
+
+class PDFDocument:
+    def __init__(self, title: str | None = None, compress: bool = True):
+        self.title = title
+        self.compress = compress
+        self.pages = []
+
+    def add_page(self, width: float = A4[0], height: float = A4[1]) -> PDFPage:
+        page = PDFPage(width, height)
+        self.pages.append(page)
+        return page
+
+    def to_bytes(self) -> bytes:
+        objects = []  # corpo de cada objeto, na ordem dos números (1-based)
+
+        def reserve() -> int:
+            objects.append(None)
+            return len(objects)
+
+        catalog_id = reserve()
+        pages_id = reserve()
+
+        used_fonts = sorted({font for page in self.pages for font in page.fonts}, key=STANDARD_FONTS.index)
+        font_ids = {}
+        for font in used_fonts:
+            font_ids[font] = reserve()
+            objects[font_ids[font] - 1] = (
+                b"<< /Type /Font /Subtype /Type1 /BaseFont /" + font.encode("ascii")
+                + b" /Encoding /WinAnsiEncoding >>"
+            )
+        font_dict = b"<< " + b" ".join(
+            b"/" + _FONT_RESOURCES[font].encode("ascii") + b" " + str(font_ids[font]).encode() + b" 0 R"
+            for font in used_fonts
+        ) + b" >>"
+
+        page_ids = []
+        for page in self.pages:
+            content = page.content()
+            content_id = reserve()
+            if self.compress:
+                content = zlib.compress(content)
+                objects[content_id - 1] = (
+                    b"<< /Length " + str(len(content)).encode() + b" /Filter /FlateDecode >>\nstream\n"
+                    + content + b"\nendstream"
+                )
+            else:
+                objects[content_id - 1] = (
+                    b"<< /Length " + str(len(content)).encode() + b" >>\nstream\n" + content + b"\nendstream"
+                )
+
+            page_id = reserve()
+            page_ids.append(page_id)
+            objects[page_id - 1] = (
+                b"<< /Type /Page /Parent " + str(pages_id).encode() + b" 0 R"
+                + b" /MediaBox [0 0 " + _num(page.width) + b" " + _num(page.height) + b"]"
+                + b" /Resources << /Font " + font_dict + b" >>"
+                + b" /Contents " + str(content_id).encode() + b" 0 R >>"
+            )
+
+        objects[catalog_id - 1] = b"<< /Type /Catalog /Pages " + str(pages_id).encode() + b" 0 R >>"
+        objects[pages_id - 1] = (
+            b"<< /Type /Pages /Kids [" + b" ".join(str(page_id).encode() + b" 0 R" for page_id in page_ids)
+            + b"] /Count " + str(len(page_ids)).encode() + b" >>"
+        )
+
+        info_id = reserve()
+        info = b"<< /Producer (AI Resume Architect)"
+        if self.title:
+            info += b" /Title " + _text_string(self.title)
+        objects[info_id - 1] = info + b" >>"
+
+        output = [b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n"]
+        offsets = []
+        position = len(output[0])
+        for number, body in enumerate(objects, start=1):
+            chunk = str(number).encode() + b" 0 obj\n" + body + b"\nendobj\n"
+            offsets.append(position)
+            output.append(chunk)
+            position += len(chunk)
+
+        xref = [b"xref\n0 " + str(len(objects) + 1).encode() + b"\n", b"0000000000 65535 f \n"]
+        xref.extend(f"{offset:010d} 00000 n \n".encode("ascii") for offset in offsets)
+        output.extend(xref)
+        output.append(
+            b"trailer\n<< /Size " + str(len(objects) + 1).encode()
+            + b" /Root " + str(catalog_id).encode() + b" 0 R"
+            + b" /Info " + str(info_id).encode() + b" 0 R >>\nstartxref\n"
+            + str(position).encode() + b"\n%%EOF\n"
+        )
+        return b"".join(output)
@@ -0,0 +1,53 @@
+import zipfile
+
+
+class _ChunkSink:
+    """Destino não-seekable do ZipFile: acumula bytes até serem drenados."""
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class ZipStream:
+    """
+    Escreve um arquivo ZIP em pedaços, sem nunca manter o arquivo inteiro
+    em memória. Cada chamada devolve os bytes prontos para envio.
+    """
+
+    def __init__(self, compression: int = zipfile.ZIP_STORED):
+        self._sink = _ChunkSink()
+        self._zip = zipfile.ZipFile(self._sink, mode="w", compression=compression)
+
+    def add(self, name: str, data: bytes | str) -> bytes:
+        """Adiciona uma entrada completa e retorna os bytes gerados."""
+        self._zip.writestr(name, data)
+        return self._sink.drain()
+
+    def open(self, name: str):
+        """Abre uma entrada para escrita incremental (use `drain` entre escritas)."""
+        return self._zip.open(name, mode="w", force_zip64=False)
+
+    def drain(self) -> bytes:
+        return self._sink.drain()
+
+    def close(self) -> bytes:
+        """Finaliza o ZIP (diretório central) e retorna os bytes restantes."""
+        self._zip.close()
+        return self._sink.drain()
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Benchmark de latência e qualidade dos modelos de IA.
+
+Roda um corpus fixo de pares currículo/vaga em cada modelo configurado e
+registra tempo até o primeiro token, latência total, tokens de entrada e
+saída, taxa de JSON parseável e validade contra o schema GeneratedResume.
+O relatório é um JSON ordenado, feito para ser comparado entre execuções.
+
+Exemplos:
+    python benchmark_models.py                                   # Gemini, modelos de LLM_MODELS
+    python benchmark_models.py --provider fake                   # offline, determinístico
+    python benchmark_models.py --provider recorded               # offline, respostas gravadas
+    python benchmark_models.py --record benchmarks/recordings.json   # grava respostas reais
+    python benchmark_models.py --baseline benchmarks/report_anterior.json
+"""
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+from app.core.config import settings
+from app.services.json_repair import extract_json_text, parse_partial_json, validate_sections
+from app.services.llm_providers import (
+    FakeProvider,
+    RecordedProvider,
+    create_provider,
+    recording_key,
+)
+from app.services.llm_service import PROMPT_VERSION
+from app.services.prompt_builder import build_resume_prompt, estimate_tokens
+
+DEFAULT_CORPUS = "benchmarks/corpus.json"
+DEFAULT_OUTPUT = "benchmarks/report.json"
+
+# Métricas do resumo comparadas com --baseline (menor é melhor para latência)
+COMPARED_METRICS = (
+    "ttft_ms_p50",
+    "total_ms_p50",
+    "total_ms_p95",
+    "output_tokens_mean",
+    "parse_success_rate",
+    "schema_valid_rate",
+    "error_rate",
+)
+
+
+def load_corpus(path: str) -> list:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["cases"]
+
+
+def build_provider(args):
+    if args.provider == "fake":
+        return FakeProvider(latency_ms=args.fake_latency_ms)
+    if args.provider == "recorded":
+        return RecordedProvider(args.recordings, replay_timing=args.replay_timing)
+    return create_provider(args.provider)
+
+
+def evaluate_output(text: str) -> dict:
+    """Qualidade da resposta: JSON direto, JSON após reparo e validade por seção."""
+    quality = {"parse_ok": False, "repaired": False, "schema_valid": False, "invalid_sections": []}
+
+    try:
+        json.loads(extract_json_text(text))
+        quality["parse_ok"] = True
+    except ValueError:
+        pass
+
+    try:
+        data, truncated = parse_partial_json(text)
+    except ValueError:
+        quality["invalid_sections"] = ["*"]
+        return quality
+
+    quality["repaired"] = not quality["parse_ok"]
+    _, invalid = validate_sections(data)
+    quality["invalid_sections"] = invalid
+    quality["schema_valid"] = not invalid and not truncated
+    return quality
+
+
+async def run_once(provider, model: str, prompt, stream: bool) -> dict:
+    """Executa um prompt direto no provedor (sem retry/fallback) e mede o tempo."""
+    result = {
+        "ok": False,
+        "error": None,
+        "ttft_ms": None,
+        "total_ms": None,
+        "input_tokens": prompt.estimated_tokens,
+        "output_tokens": None,
+        "tokens_estimated": True,
+        "text": "",
+        "chunks": [],
+    }
+    started = time.perf_counter()
+
+    try:
+        if stream:
+            async for chunk in provider.stream(prompt.text, model):
+                if result["ttft_ms"] is None:
+                    result["ttft_ms"] = round((time.perf_counter() - started) * 1000, 1)
+                result["chunks"].append(chunk)
+            result["text"] = "".join(result["chunks"])
+            result["output_tokens"] = estimate_tokens(result["text"])
+        else:
+            response = await provider.generate(prompt.text, model)
+            result["text"] = response.text
+            result["chunks"] = [response.text]
+            result["input_tokens"] = response.input_tokens or prompt.estimated_tokens
+            result["output_tokens"] = response.output_tokens or estimate_tokens(response.text)
+            result["tokens_estimated"] = response.input_tokens is None
+        result["ok"] = True
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {str(e)[:200]}"
+
+    result["total_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    return result
+
+
+def _percentile(values: list, fraction: float):
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _mean(values: list):
+    return round(statistics.fmean(values), 1) if values else None
+
+
+def summarize(runs: list) -> dict:
+    summary = {}
+    for model in sorted({run["model"] for run in runs}):
+        model_runs = [run for run in runs if run["model"] == model]
+        ok_runs = [run for run in model_runs if run["ok"]]
+        ttft = [run["ttft_ms"] for run in ok_runs if run["ttft_ms"] is not None]
+        total = [run["total_ms"] for run in ok_runs]
+        count = len(model_runs)
+
+        summary[model] = {
+            "runs": count,
+            "errors": count - len(ok_runs),
+            "error_rate": round((count - len(ok_runs)) / count, 3),
+            "ttft_ms_p50": _percentile(ttft, 0.5),
+            "ttft_ms_p95": _percentile(ttft, 0.95),
+            "total_ms_p50": _percentile(total, 0.5),
+            "total_ms_p95": _percentile(total, 0.95),
+            "total_ms_mean": _mean(total),
+            "input_tokens_mean": _mean([run["input_tokens"] for run in ok_runs]),
+            "output_tokens_mean": _mean([run["output_tokens"] for run in ok_runs]),
+            "parse_success_rate": round(sum(run["parse_ok"] for run in model_runs) / count, 3),
+            "repaired_rate": round(sum(run["repaired"] for run in model_runs) / count, 3),
+            "schema_valid_rate": round(sum(run["schema_valid"] for run in model_runs) / count, 3),
+        }
+    return summary
+
+
+async def run_benchmark(args) -> tuple:
+    provider = build_provider(args)
+    cases = load_corpus(args.corpus)
+    if args.cases:
+        cases = [case for case in cases if case["id"] in args.cases]
+
+    runs = []
+    recordings = {}
+
+    for model in args.models:
+        for case in cases:
+            prompt = build_resume_prompt(case["cv"], case["job"])
+
+            for repetition in range(args.repeat):
+                print(f"[{model}] {case['id']} #{repetition + 1}...", end=" ", flush=True)
+                result = await run_once(provider, model, prompt, stream=not args.no_stream)
+                quality = evaluate_output(result["text"]) if result["ok"] else evaluate_output("")
+
+                if result["ok"]:
+                    print(f"{result['total_ms']:.0f}ms {'✅' if quality['schema_valid'] else '⚠️'}")
+                    recordings[recording_key(prompt.text, model)] = {
+                        "model": model,
+                        "case": case["id"],
+                        "text": result["text"],
+                        "chunks": result["chunks"],
+                        "ttft_ms": result["ttft_ms"],
+                        "latency_ms": result["total_ms"],
+                        "input_tokens": None if result["tokens_estimated"] else result["input_tokens"],
+                        "output_tokens": None if result["tokens_estimated"] else result["output_tokens"],
+                    }
+                else:
+                    print(f"❌ {result['error']}")
+
+                runs.append({
+                    "model": model,
+                    "case": case["id"],
+                    "run": repetition + 1,
+                    "ok": result["ok"],
+                    "error": result["error"],
+                    "ttft_ms": result["ttft_ms"],
+                    "total_ms": result["total_ms"],
+                    "input_tokens": result["input_tokens"],
+                    "output_tokens": result["output_tokens"],
+                    "tokens_estimated": result["tokens_estimated"],
+                    **quality,
+                })
+
+    return runs, recordings
+
+
+def compare(summary: dict, baseline_path: str):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)["summary"]
+
+    print("\n" + "=" * 80)
+    print(f"📊 Comparação com {baseline_path}")
+    print("=" * 80)
+    for model, metrics in summary.items():
+        previous = baseline.get(model)
+        if previous is None:
+            print(f"\n{model}: sem dados no baseline")
+            continue
+        print(f"\n{model}")
+        for metric in COMPARED_METRICS:
+            old, new = previous.get(metric), metrics.get(metric)
+            if old is None or new is None:
+                continue
+            print(f"   {metric:<20} {old:>10} → {new:<10} ({new - old:+.3f})")
+
+
+def print_summary(summary: dict):
+    print("\n" + "=" * 80)
+    print("📋 RESUMO POR MODELO")
+    print("=" * 80)
+    for model, metrics in summary.items():
+        print(f"\n{model}")
+        print(f"   Erros: {metrics['errors']}/{metrics['runs']}")
+        print(f"   TTFT p50: {metrics['ttft_ms_p50']} ms | Latência p50/p95: "
+              f"{metrics['total_ms_p50']} / {metrics['total_ms_p95']} ms")
+        print(f"   Tokens médios (entrada/saída): {metrics['input_tokens_mean']} / {metrics['output_tokens_mean']}")
+        print(f"   JSON válido: {metrics['parse_success_rate']:.0%} | Após reparo: "
+              f"{metrics['repaired_rate']:.0%} | Schema válido: {metrics['schema_valid_rate']:.0%}")
+
+
+def write_json(path: str, payload: dict):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de latência e qualidade dos modelos de IA")
+    parser.add_argument("--provider", default=settings.LLM_PROVIDER, choices=["gemini", "fake", "recorded"])
+    parser.add_argument("--models", nargs="+", default=settings.LLM_MODELS)
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    parser.add_argument("--cases", nargs="+", help="Roda apenas os casos com estes ids")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--no-stream", action="store_true",
+                        help="Usa chamada sem streaming (sem TTFT, com contagem real de tokens)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", help="Relatório anterior para comparar")
+    parser.add_argument("--record", help="Grava as respostas obtidas para uso com --provider recorded")
+    parser.add_argument("--recordings", default=settings.LLM_RECORDINGS_PATH)
+    parser.add_argument("--replay-timing", action="store_true",
+                        help="Com --provider recorded, reproduz os tempos gravados")
+    parser.add_argument("--fake-latency-ms", type=float, default=settings.LLM_FAKE_LATENCY_MS)
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    started_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+    print("\n" + "=" * 80)
+    print(f"🧪 Benchmark de modelos ({args.provider}): {', '.join(args.models)}")
+    print("=" * 80 + "\n")
+
+    runs, recordings = asyncio.run(run_benchmark(args))
+    summary = summarize(runs)
+
+    report = {
+        "meta": {
+            "started_at": started_at,
+            "provider": args.provider,
+            "models": args.models,
+            "corpus": args.corpus,
+            "repeat": args.repeat,
+            "stream": not args.no_stream,
+            "prompt_version": PROMPT_VERSION,
+            "python": platform.python_version(),
+        },
+        "summary": summary,
+        "runs": runs,
+    }
+    write_json(args.output, report)
+
+    if args.record:
+        write_json(args.record, {"prompt_version": PROMPT_VERSION, "recordings": recordings})
+        print(f"\n💾 {len(recordings)} respostas gravadas em {args.record}")
+
+    print_summary(summary)
+    if args.baseline:
+        compare(summary, args.baseline)
+
+    print(f"\n📄 Relatório salvo em {args.output}\n")
+    return 0 if runs and all(run["ok"] for run in runs) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,18 @@
+from app.services.prompt_builder import MIN_FIELD_CHARS, TRUNCATION_MARK, _truncate, fit_to_budget
+
+
+def test_truncate_text_without_spaces():
+    text = _truncate("x" * 500, MIN_FIELD_CHARS)
+    assert len(text) == MIN_FIELD_CHARS
+    assert text.endswith(TRUNCATION_MARK)
+
+
+def test_fit_to_budget_terminates_on_text_without_spaces():
+    text = fit_to_budget({"summary": "x" * 500, "skills": ["a" * 300, "履歴書" * 200]}, 20)
+    assert len(text) < 400
+
+
+def test_fit_to_budget_drops_list_items_when_fields_are_at_minimum():
+    data = {"experience": [{"description": "y" * 400} for _ in range(5)]}
+    text = fit_to_budget(data, 60)
+    assert text.count("description") < 5
@@ -13,20 +13,13 @@ import {
 import api from '../services/api';
 import toast from 'react-hot-toast';
 
-// Interface baseada nos seus modelos de backend
+// Resumo retornado pela listagem paginada de /resumes/
 interface Resume {
   id: number;
-  data: {
-    fullName?: string;
-    email?: string;
-    phone?: string;
-    location?: string;
-    linkedin?: string;
-    summary?: string;
-    skills?: string[];
-    experience?: any[];
-    education?: any[];
-  };
+  fullName?: string | null;
+  experience_count?: number;
+  education_count?: number;
+  skills_count?: number;
   created_at?: string;
   updated_at?: string;
 }
@@ -34,16 +27,17 @@ interface Resume {
 export const Dashboard = () => {
   const [resumes, setResumes] = useState<Resume[]>([]);
   const [isLoading, setIsLoading] = useState(true);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [searchTerm, setSearchTerm] = useState("");
   const navigate = useNavigate();
 
-  // Busca a lista de currículos do backend
-  const fetchResumes = async () => {
+  // Busca a lista de currículos do backend (uma página por vez)
+  const fetchResumes = async (cursor?: string) => {
     try {
-      setIsLoading(true);
-      const response = await api.get('/resumes/');
-      console.log('Currículos carregados:', response.data); // Debug
-      setResumes(response.data);
+      setIsLoading(!cursor);
+      const response = await api.get('/resumes/', { params: cursor ? { cursor } : {} });
+      setResumes(prev => (cursor ? [...prev, ...response.data] : response.data));
+      setNextCursor(response.headers['x-next-cursor'] ?? null);
     } catch (error) {
       console.error('Erro ao carregar currículos:', error);
       toast.error("Erro ao carregar os seus currículos");
@@ -75,7 +69,7 @@ export const Dashboard = () => {
 
   // Função auxiliar para obter o título do currículo
   const getResumeTitle = (resume: Resume): string => {
-    return resume.data?.fullName || 'Currículo sem nome';
+    return resume.fullName || 'Currículo sem nome';
   };
 
   // Filtro corrigido
@@ -204,6 +198,17 @@ export const Dashboard = () => {
             ))}
           </div>
         )}
+
+        {!isLoading && nextCursor && (
+          <div className="flex justify-center mt-8">
+            <button
+              onClick={() => fetchResumes(nextCursor)}
+              className="px-5 py-2 border border-gray-300 rounded-lg font-medium text-gray-700 hover:bg-gray-50 transition"
+            >
+              Carregar mais
+            </button>
+          </div>
+        )}
       </main>
     </div>
   );
@@ -103,14 +103,14 @@ export const Preview = () => {
       });
 
       const blob = new Blob([response.data], {
-        type: 'application/msword',
+        type: 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
       });
 
       const url = window.URL.createObjectURL(blob);
 
       const link = document.createElement('a');
       link.href = url;
-      link.download = `curriculo_${id}.doc`;
+      link.download = `curriculo_${id}.docx`;
 
       document.body.appendChild(link);
       link.click();